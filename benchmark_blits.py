@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Blit micro-benchmark
+Times blitting a pet sprite and a background as loaded, after conversion to
+the display format, and (for the sprite) with RLE acceleration, at 32- and
+16-bit display depths. Runs on SDL's dummy video driver unless
+SDL_VIDEODRIVER is set, so the numbers measure pixel work, not presentation.
+"""
+
+import os
+import sys
+import timeit
+
+# Add src directory to path so we can use the game's loaders
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from asset_manager import accelerate, convert_for_display
+from background_store import list_background_files, load_scaled_background
+from sprite_atlas import load_sprite_frame
+from sprite_catalog import load_catalog
+
+SCREEN_SIZE = (480, 320)
+SPRITE_SIZE = (50, 50)
+BLITS = 2000
+
+def time_blits(screen, surface):
+    """Return microseconds per blit of surface onto screen"""
+    seconds = timeit.timeit(lambda: screen.blit(surface, (10, 10)), number=BLITS)
+    return seconds / BLITS * 1e6
+
+def main():
+    """Benchmark loaded, converted and RLE surfaces"""
+    print("=== Blit Benchmark ===")
+    print()
+
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    sprites_dir = os.path.join(project_root, "assets", "sprites")
+    background_dir = os.path.join(project_root, "assets", "background")
+    if len(sys.argv) > 1:
+        sprites_dir = sys.argv[1]
+
+    pygame.display.init()
+    catalog = load_catalog(sprites_dir)
+    digimon = catalog.available_digimon()
+    background_files = list_background_files(background_dir)
+    if not digimon or not background_files:
+        print("❌ Need at least one Digimon and one background to benchmark")
+        sys.exit(1)
+
+    sprite_folder = catalog.path(digimon[0])
+    for depth in (32, 16):
+        screen = pygame.display.set_mode(SCREEN_SIZE, 0, depth)
+        sprite = pygame.transform.scale(load_sprite_frame(sprite_folder, 0), SPRITE_SIZE)
+        background = load_scaled_background(os.path.join(background_dir, background_files[0]), SCREEN_SIZE)
+        converted_sprite = convert_for_display(sprite)
+
+        # Drivers may not offer the depth asked for (the dummy driver is always 32-bit)
+        print(f"{screen.get_bitsize()}-bit display (asked for {depth}-bit):")
+        cases = [
+            ("sprite as loaded", sprite),
+            ("sprite converted", converted_sprite),
+            ("sprite converted + RLE", accelerate(converted_sprite)),
+            ("background as loaded", background),
+            ("background converted", convert_for_display(background)),
+        ]
+        for name, surface in cases:
+            print(f"  {name:<24} {surface.get_bitsize():>2}-bit {time_blits(screen, surface):9.2f} us/blit")
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Build packed sprite atlases
+Packs every Digimon sprite folder into one pre-decoded atlas file per source
+folder (assets/sprites/<source>/sprites.vpatlas) so the game can mmap the
+pixels instead of decoding thousands of small PNGs on every start.
+"""
+
+import os
+import sys
+import time
+
+# Add src directory to path so we can import the atlas module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from sprite_atlas import build_all_atlases
+
+def main():
+    """Build atlases for all sprite source folders"""
+    print("=== Building Sprite Atlases ===")
+    print()
+    
+    sprites_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sprites")
+    if len(sys.argv) > 1:
+        sprites_dir = sys.argv[1]
+    
+    if not os.path.exists(sprites_dir):
+        print(f"❌ Sprites directory not found: {sprites_dir}")
+        sys.exit(1)
+    
+    start_time = time.time()
+    written = build_all_atlases(sprites_dir)
+    elapsed = time.time() - start_time
+    
+    for atlas_path in written:
+        size_kb = os.path.getsize(atlas_path) / 1024
+        print(f"✅ {os.path.relpath(atlas_path, sprites_dir)} ({size_kb:.0f} KB)")
+    
+    if written:
+        print(f"\nBuilt {len(written)} atlases in {elapsed:.1f}s")
+        print("Re-run this script after adding or changing sprite PNGs.")
+    else:
+        print("❌ No Digimon sprite folders found.")
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,12 @@ to prevent crashes when the game starts on a fresh system.
 import json
 import os
 import random
+import sys
+
+# Add src directory to path so we can use the shared sprite catalog
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from sprite_catalog import load_catalog
 
 def create_initial_selection():
     """Create initial selection file with random Digimon"""
@@ -16,17 +22,8 @@ def create_initial_selection():
     assets_dir = os.path.join(os.path.dirname(__file__), "assets")
     sprites_dir = os.path.join(assets_dir, "sprites")
     
-    available_digimon = []
-    
-    if os.path.exists(sprites_dir):
-        for folder in os.listdir(sprites_dir):
-            folder_path = os.path.join(sprites_dir, folder)
-            if folder.endswith("_dmc") and os.path.isdir(folder_path):
-                # Check if it has walking animation frames
-                frame_0 = os.path.join(folder_path, "0.png")
-                frame_1 = os.path.join(folder_path, "1.png")
-                if os.path.exists(frame_0) and os.path.exists(frame_1):
-                    available_digimon.append(folder)
+    # Digimon with walking animation frames, including those in source subfolders
+    available_digimon = load_catalog(sprites_dir).available_digimon()
     
     print(f"Found {len(available_digimon)} available Digimon: {available_digimon[:5]}...")
     
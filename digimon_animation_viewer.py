@@ -10,6 +10,14 @@ import os
 import time
 import random
 
+# Add src directory to path so we can use the game's sprite catalog and atlas loader
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from asset_manager import convert_for_display
+from sprite_atlas import load_sprite_frame
+from sprite_catalog import load_catalog
+from text_cache import get_text_cache
+
 # Initialize Pygame
 pygame.init()
 
@@ -45,6 +53,8 @@ class DigimonAnimationViewer:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
+        self.title_font = pygame.font.Font(None, 48)
+        self.text = get_text_cache()  # Labels repeat every frame, render each once
         
         # Load all Digimon
         self.digimon_list = []
@@ -69,23 +79,17 @@ class DigimonAnimationViewer:
             print(f"Sprites directory not found: {sprites_dir}")
             return
         
-        # Get all Digimon folders
-        digimon_folders = []
-        for folder in os.listdir(sprites_dir):
-            if folder.endswith("_dmc") and os.path.isdir(os.path.join(sprites_dir, folder)):
-                digimon_folders.append(folder)
-        
-        digimon_folders.sort()  # Sort alphabetically
+        # Get all Digimon folders, including those inside source subfolders
+        catalog = load_catalog(sprites_dir)
         
-        for folder in digimon_folders:
-            digimon_path = os.path.join(sprites_dir, folder)
-            digimon_data = self.load_digimon_sprites(digimon_path, folder)
+        for folder in catalog.names():  # Sorted alphabetically
+            digimon_data = self.load_digimon_sprites(catalog.path(folder), folder, catalog.frames(folder))
             if digimon_data:
                 self.digimon_list.append(digimon_data)
         
         print(f"Loaded {len(self.digimon_list)} Digimon with animations")
     
-    def load_digimon_sprites(self, digimon_path, folder_name):
+    def load_digimon_sprites(self, digimon_path, folder_name, frame_numbers):
         """Load all sprite frames for a single Digimon"""
         digimon_name = folder_name.replace("_dmc", "")
         
@@ -93,13 +97,12 @@ class DigimonAnimationViewer:
         frames = {}
         animations = {}
         
-        for frame_num in range(15):  # 0-14
-            frame_path = os.path.join(digimon_path, f"{frame_num}.png")
-            if os.path.exists(frame_path):
+        for frame_num in frame_numbers:
+            if frame_num < 15:  # 0-14
                 try:
-                    frame = pygame.image.load(frame_path)
+                    frame = load_sprite_frame(digimon_path, frame_num)
                     # Scale to consistent size
-                    frame = pygame.transform.scale(frame, (DIGIMON_SIZE, DIGIMON_SIZE))
+                    frame = convert_for_display(pygame.transform.scale(frame, (DIGIMON_SIZE, DIGIMON_SIZE)))
                     frames[frame_num] = frame
                 except Exception as e:
                     print(f"Error loading frame {frame_num} for {digimon_name}: {e}")
@@ -198,7 +201,7 @@ class DigimonAnimationViewer:
                 self.screen.blit(current_sprite, (x, y))
             
             # Draw Digimon name
-            name_surface = self.small_font.render(digimon["name"], True, TEXT_COLOR)
+            name_surface = self.text.render(self.small_font, digimon["name"], TEXT_COLOR)
             name_rect = name_surface.get_rect()
             name_rect.centerx = col * CELL_WIDTH + CELL_WIDTH // 2
             name_rect.y = row * CELL_HEIGHT + CELL_HEIGHT - 40
@@ -206,7 +209,7 @@ class DigimonAnimationViewer:
             
             # Draw current animation name
             anim_name = self.current_animation if self.current_animation in digimon["animations"] else "N/A"
-            anim_surface = self.small_font.render(anim_name, True, (200, 200, 200))
+            anim_surface = self.text.render(self.small_font, anim_name, (200, 200, 200))
             anim_rect = anim_surface.get_rect()
             anim_rect.centerx = col * CELL_WIDTH + CELL_WIDTH // 2
             anim_rect.y = row * CELL_HEIGHT + CELL_HEIGHT - 20
@@ -216,14 +219,14 @@ class DigimonAnimationViewer:
         """Draw user interface elements"""
         # Current animation type
         anim_text = f"Current Animation: {self.current_animation}"
-        anim_surface = self.font.render(anim_text, True, HIGHLIGHT_COLOR)
+        anim_surface = self.text.render(self.font, anim_text, HIGHLIGHT_COLOR)
         self.screen.blit(anim_surface, (10, 10))
         
         # Animation list
         y_offset = 40
         for i, anim_name in enumerate(ANIMATION_TYPES.keys()):
             color = HIGHLIGHT_COLOR if anim_name == self.current_animation else TEXT_COLOR
-            anim_surface = self.small_font.render(f"{i+1}. {anim_name}", True, color)
+            anim_surface = self.text.render(self.small_font, f"{i+1}. {anim_name}", color)
             self.screen.blit(anim_surface, (10, y_offset))
             y_offset += 20
         
@@ -255,13 +258,13 @@ class DigimonAnimationViewer:
             
             for i, instruction in enumerate(instructions):
                 color = HIGHLIGHT_COLOR if instruction.startswith("CONTROLS") else TEXT_COLOR
-                inst_surface = self.small_font.render(instruction, True, color)
+                inst_surface = self.text.render(self.small_font, instruction, color)
                 self.screen.blit(inst_surface, (SCREEN_WIDTH - inst_width, 20 + i * 20))
         
         # Draw page indicator at bottom
         if self.get_total_pages() > 1:
             page_text = f"Page {self.current_page + 1} of {self.get_total_pages()} | Total: {len(self.digimon_list)} Digimon"
-            page_surface = self.font.render(page_text, True, HIGHLIGHT_COLOR)
+            page_surface = self.text.render(self.font, page_text, HIGHLIGHT_COLOR)
             page_rect = page_surface.get_rect()
             page_rect.centerx = SCREEN_WIDTH // 2
             page_rect.y = SCREEN_HEIGHT - 30
@@ -293,36 +296,36 @@ class DigimonAnimationViewer:
             self.screen.blit(large_sprite, sprite_rect)
         
         # Digimon name
-        name_surface = pygame.font.Font(None, 48).render(digimon["name"], True, HIGHLIGHT_COLOR)
+        name_surface = self.text.render(self.title_font, digimon["name"], HIGHLIGHT_COLOR)
         name_rect = name_surface.get_rect()
         name_rect.centerx = SCREEN_WIDTH // 2
         name_rect.y = 50
         self.screen.blit(name_surface, name_rect)
         
         # Available animations
-        anim_list_title = self.font.render("Available Animations:", True, TEXT_COLOR)
+        anim_list_title = self.text.render(self.font, "Available Animations:", TEXT_COLOR)
         self.screen.blit(anim_list_title, (50, 150))
         
         y_offset = 180
         for anim_name in digimon["animations"].keys():
             color = HIGHLIGHT_COLOR if anim_name == self.current_animation else TEXT_COLOR
-            anim_surface = self.font.render(f"• {anim_name}", True, color)
+            anim_surface = self.text.render(self.font, f"• {anim_name}", color)
             self.screen.blit(anim_surface, (70, y_offset))
             y_offset += 30
         
         # Frame information
-        frame_info = self.font.render(f"Animation: {self.current_animation}", True, TEXT_COLOR)
+        frame_info = self.text.render(self.font, f"Animation: {self.current_animation}", TEXT_COLOR)
         self.screen.blit(frame_info, (50, SCREEN_HEIGHT - 100))
         
         if anim_frames:
-            frame_count_info = self.font.render(f"Frames: {len(anim_frames)}", True, TEXT_COLOR)
+            frame_count_info = self.text.render(self.font, f"Frames: {len(anim_frames)}", TEXT_COLOR)
             self.screen.blit(frame_count_info, (50, SCREEN_HEIGHT - 70))
             
-            current_frame_info = self.font.render(f"Current Frame: {digimon['current_frame'] + 1}/{len(anim_frames)}", True, TEXT_COLOR)
+            current_frame_info = self.text.render(self.font, f"Current Frame: {digimon['current_frame'] + 1}/{len(anim_frames)}", TEXT_COLOR)
             self.screen.blit(current_frame_info, (50, SCREEN_HEIGHT - 40))
         
         # Back instruction
-        back_text = self.small_font.render("Press ESCAPE to return to grid view", True, (150, 150, 150))
+        back_text = self.text.render(self.small_font, "Press ESCAPE to return to grid view", (150, 150, 150))
         back_rect = back_text.get_rect()
         back_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20)
         self.screen.blit(back_text, back_rect)
@@ -435,6 +438,7 @@ class DigimonAnimationViewer:
             pygame.display.flip()
             self.clock.tick(60)  # 60 FPS
         
+        print(f"Text cache: {self.text.stats()}")
         pygame.quit()
         sys.exit()
 
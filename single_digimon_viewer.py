@@ -8,6 +8,14 @@ import pygame
 import sys
 import os
 
+# Add src directory to path so we can use the game's sprite catalog and atlas loader
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from asset_manager import convert_for_display
+from sprite_atlas import load_sprite_frame
+from sprite_catalog import load_catalog
+from text_cache import get_text_cache
+
 # Initialize Pygame
 pygame.init()
 
@@ -26,6 +34,7 @@ class SingleDigimonViewer:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.big_font = pygame.font.Font(None, 36)
+        self.text = get_text_cache()  # Labels repeat every frame, render each once
         
         # State
         self.digimon_list = []
@@ -46,17 +55,16 @@ class SingleDigimonViewer:
             print(f"Sprites directory not found: {sprites_dir}")
             return
         
-        # Get all Digimon folders
-        for folder in sorted(os.listdir(sprites_dir)):
-            if folder.endswith("_dmc") and os.path.isdir(os.path.join(sprites_dir, folder)):
-                digimon_path = os.path.join(sprites_dir, folder)
-                digimon_data = self.load_digimon_frames(digimon_path, folder)
-                if digimon_data:
-                    self.digimon_list.append(digimon_data)
+        # Get all Digimon folders, including those inside source subfolders
+        catalog = load_catalog(sprites_dir)
+        for folder in catalog.names():
+            digimon_data = self.load_digimon_frames(catalog.path(folder), folder, catalog.frames(folder))
+            if digimon_data:
+                self.digimon_list.append(digimon_data)
         
         print(f"Loaded {len(self.digimon_list)} Digimon")
     
-    def load_digimon_frames(self, digimon_path, folder_name):
+    def load_digimon_frames(self, digimon_path, folder_name, frame_numbers):
         """Load all frames for a single Digimon"""
         digimon_name = folder_name.replace("_dmc", "")
         frames = []
@@ -64,15 +72,14 @@ class SingleDigimonViewer:
         
         # Load frames 0-14
         for frame_num in range(15):
-            frame_path = os.path.join(digimon_path, f"{frame_num}.png")
-            if os.path.exists(frame_path):
+            if frame_num in frame_numbers:
                 try:
                     # Load original frame
-                    original = pygame.image.load(frame_path)
+                    original = load_sprite_frame(digimon_path, frame_num)
                     original_size = original.get_size()
                     
                     # Create scaled version for display
-                    scaled = pygame.transform.scale(original, (SPRITE_SIZE, SPRITE_SIZE))
+                    scaled = convert_for_display(pygame.transform.scale(original, (SPRITE_SIZE, SPRITE_SIZE)))
                     
                     frames.append({
                         'original': original,
@@ -149,7 +156,7 @@ class SingleDigimonViewer:
                            (sprite_x + SPRITE_SIZE, sprite_y), 
                            (sprite_x, sprite_y + SPRITE_SIZE), 3)
             
-            missing_text = self.font.render("MISSING", True, (150, 150, 150))
+            missing_text = self.text.render(self.font, "MISSING", (150, 150, 150))
             text_rect = missing_text.get_rect()
             text_rect.center = (sprite_x + SPRITE_SIZE // 2, sprite_y + SPRITE_SIZE // 2 + 30)
             self.screen.blit(missing_text, text_rect)
@@ -164,7 +171,7 @@ class SingleDigimonViewer:
         info_y = 50
         
         # Digimon name
-        name_surface = self.big_font.render(digimon['name'], True, HIGHLIGHT_COLOR)
+        name_surface = self.text.render(self.big_font, digimon['name'], HIGHLIGHT_COLOR)
         self.screen.blit(name_surface, (info_x, info_y))
         info_y += 50
         
@@ -178,19 +185,19 @@ class SingleDigimonViewer:
                 frame_text = f"Frame {frame_data['number']}: MISSING"
                 color = (150, 150, 150)
             
-            frame_surface = self.font.render(frame_text, True, color)
+            frame_surface = self.text.render(self.font, frame_text, color)
             self.screen.blit(frame_surface, (info_x, info_y))
             info_y += 30
         
         # Animation status
         anim_status = "ON" if self.auto_animate else "OFF"
         anim_color = HIGHLIGHT_COLOR if self.auto_animate else TEXT_COLOR
-        anim_surface = self.font.render(f"Auto Animation: {anim_status}", True, anim_color)
+        anim_surface = self.text.render(self.font, f"Auto Animation: {anim_status}", anim_color)
         self.screen.blit(anim_surface, (info_x, info_y))
         info_y += 40
         
         # Available frames list
-        available_text = self.font.render("Available Frames:", True, TEXT_COLOR)
+        available_text = self.text.render(self.font, "Available Frames:", TEXT_COLOR)
         self.screen.blit(available_text, (info_x, info_y))
         info_y += 30
         
@@ -201,7 +208,7 @@ class SingleDigimonViewer:
         for i in range(0, len(available_frames), frames_per_row):
             row_frames = available_frames[i:i+frames_per_row]
             row_text = ", ".join(row_frames)
-            row_surface = self.font.render(row_text, True, (200, 200, 200))
+            row_surface = self.text.render(self.font, row_text, (200, 200, 200))
             self.screen.blit(row_surface, (info_x + 20, info_y))
             info_y += 25
         
@@ -218,7 +225,7 @@ class SingleDigimonViewer:
         
         for usage in usage_info:
             color = HIGHLIGHT_COLOR if usage.startswith("Frame Usage:") else (180, 180, 180)
-            usage_surface = self.font.render(usage, True, color)
+            usage_surface = self.text.render(self.font, usage, color)
             self.screen.blit(usage_surface, (info_x, info_y))
             info_y += 22
     
@@ -239,7 +246,7 @@ class SingleDigimonViewer:
         
         for control in controls:
             color = HIGHLIGHT_COLOR if control.startswith("CONTROLS:") else TEXT_COLOR
-            control_surface = self.font.render(control, True, color)
+            control_surface = self.text.render(self.font, control, color)
             self.screen.blit(control_surface, (10, y))
             y += 22
     
@@ -249,7 +256,7 @@ class SingleDigimonViewer:
             return
         
         nav_text = f"Digimon {self.current_digimon_index + 1}/{len(self.digimon_list)}"
-        nav_surface = self.font.render(nav_text, True, HIGHLIGHT_COLOR)
+        nav_surface = self.text.render(self.font, nav_text, HIGHLIGHT_COLOR)
         nav_rect = nav_surface.get_rect()
         nav_rect.topright = (SCREEN_WIDTH - 10, 10)
         self.screen.blit(nav_surface, nav_rect)
@@ -259,7 +266,7 @@ class SingleDigimonViewer:
         if digimon:
             available_count = sum(1 for frame in digimon['frames'] if frame['exists'])
             frame_nav_text = f"Frame {self.current_frame}/14 ({available_count} available)"
-            frame_nav_surface = self.font.render(frame_nav_text, True, TEXT_COLOR)
+            frame_nav_surface = self.text.render(self.font, frame_nav_text, TEXT_COLOR)
             frame_nav_rect = frame_nav_surface.get_rect()
             frame_nav_rect.topright = (SCREEN_WIDTH - 10, 35)
             self.screen.blit(frame_nav_surface, frame_nav_rect)
@@ -405,6 +412,7 @@ class SingleDigimonViewer:
             pygame.display.flip()
             self.clock.tick(60)
         
+        print(f"Text cache: {self.text.stats()}")
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,185 @@
+"""
+Parallel asset loading for game startup.
+
+File reads and image decodes are fanned out to a thread pool (Pillow and file
+I/O release the GIL, so the idle cores on a Pi do real work). The decoded
+pixels are handed back as plain bytes; turning them into pygame Surfaces
+always happens on the main thread, when the game asks for the image.
+
+Usage:
+    loader = AssetLoader()
+    loader.prefetch_images(paths)          # starts decoding in the background
+    with loader.phase("digimon"):
+        image = load_image(path)           # picks up the prefetched result
+    loader.report()
+"""
+
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pygame
+
+from startup_profiler import mark as mark_startup
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Loader whose prefetched results load_image() consults (None outside startup)
+_active_loader = None
+
+
+def decode_image_file(path):
+    """
+    Worker job: read and decode an image file.
+    Returns ("pixels", mode, size, data) when Pillow could decode it,
+    otherwise ("file", data) with the raw file contents.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if Image is not None:
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGBA" if "transparency" in img.info or "A" in img.mode else "RGB")
+                else:
+                    img.load()
+                return ("pixels", img.mode, img.size, img.tobytes())
+        except Exception:
+            pass  # Let pygame decode it on the main thread
+    return ("file", data)
+
+
+def surface_from_decoded(result, path):
+    """Create a Surface on the main thread from a decode_image_file result"""
+    if result[0] == "pixels":
+        _, mode, size, data = result
+        return pygame.image.frombuffer(data, size, mode)
+    return pygame.image.load(io.BytesIO(result[1]), os.path.basename(path))
+
+
+def load_image(path, loader=None):
+    """
+    Load an image, using the prefetched decode of loader (the active loader
+    by default) when there is one and falling back to pygame.image.load otherwise.
+    """
+    if loader is None:
+        loader = _active_loader
+    if loader is not None:
+        result = loader.take(path)
+        if result is not None:
+            try:
+                return surface_from_decoded(result, path)
+            except Exception as e:
+                print(f"Prefetched decode unusable for {path}, loading directly: {e}")
+    return pygame.image.load(path)
+
+
+def get_active_loader():
+    """Return the loader currently serving load_image(), or None"""
+    return _active_loader
+
+
+class AssetLoader:
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            # Leave one core for the main thread; on a single core a pool only
+            # adds contention, so everything is loaded directly instead
+            max_workers = max(0, min(4, (os.cpu_count() or 1) - 1))
+        self.max_workers = max_workers
+        self._executor = None
+        if max_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset-loader")
+        self._pending = {}  # key -> Future
+        self.phase_times = []  # (phase name, seconds) in the order they ran
+        self.prefetched = 0
+        self.used = 0
+
+    def activate(self):
+        """Make load_image() consult this loader"""
+        global _active_loader
+        _active_loader = self
+
+    def deactivate(self):
+        """Stop serving load_image() and drop results nobody asked for"""
+        global _active_loader
+        if _active_loader is self:
+            _active_loader = None
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def submit(self, key, func, *args):
+        """Run func(*args) on the pool; the result is collected with take(key)"""
+        if self._executor is not None and key not in self._pending:
+            self._pending[key] = self._executor.submit(func, *args)
+            self.prefetched += 1
+
+    def cancel(self, key):
+        """
+        Drop the job for key if no worker has started it yet. Jobs already
+        running or finished are kept so their result can still be taken.
+        """
+        future = self._pending.get(key)
+        if future is not None and future.cancel():
+            del self._pending[key]
+
+    def discard(self, key):
+        """
+        Drop the job for key and any result it produced: cancelled if no
+        worker has started it, otherwise left to finish and thrown away.
+        """
+        future = self._pending.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def prefetch_images(self, paths):
+        """Start reading and decoding every path on the pool"""
+        for path in paths:
+            self.submit(path, decode_image_file, path)
+
+    def take(self, key):
+        """Wait for and return the result for key (None if never submitted or it failed)"""
+        future = self._pending.pop(key, None)
+        if future is None:
+            return None
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Background decode failed for {key}: {e}")
+            return None
+        self.used += 1
+        return result
+
+    def has_pending(self, key):
+        """Check if a job for key was submitted and not yet taken"""
+        return key in self._pending
+
+    @contextmanager
+    def phase(self, name):
+        """Time a startup phase (and mark it on the startup profile timeline)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times.append((name, time.perf_counter() - start))
+            mark_startup(name)
+
+    def report(self):
+        """Print how long each phase took"""
+        total = sum(seconds for _, seconds in self.phase_times)
+        print(f"Asset loading ({self.max_workers} workers, {self.used}/{self.prefetched} prefetched decodes used):")
+        for name, seconds in self.phase_times:
+            print(f"  {name:<20} {seconds * 1000:8.1f} ms")
+        print(f"  {'total':<20} {total * 1000:8.1f} ms")
+
+    def shutdown(self):
+        """Stop the worker threads"""
+        self.deactivate()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,169 @@
+"""
+Process-wide asset manager.
+
+Surfaces are cached by (path, transform) and shared by everything that asks
+for the same key, so two pets showing the same heart - or a pet swap that
+reloads the same food - never touch the disk twice. Base images are
+converted to the display format once when a display mode is set, so blits
+never convert pixels on the fly.
+
+A transform is a tuple of steps applied in order:
+    ("scale", (w, h))           scale to (w, h)
+    ("shrink", limit, (w, h))   scale to (w, h) only if a side exceeds limit
+    ("flip", flip_x, flip_y)    mirror
+    ("alpha", alpha)            copy with a surface alpha (0-255)
+    ("rle",)                    RLE-accelerated copy (see accelerate); put it last
+
+Every get() holds a reference until the matching release(). An AssetScope
+records what it acquired so an owner (a Digimon, the game) can release
+everything at once; entries whose count drops to zero are freed.
+
+Usage:
+    assets = get_asset_manager().scope()
+    heart = assets.get(heart_path, (("shrink", 30, (25, 25)),))
+    ...
+    assets.release()
+"""
+
+import pygame
+
+from asset_loader import load_image
+
+# Manager shared by the whole process (see get_asset_manager)
+_manager = None
+
+
+def apply_transform_step(surface, step):
+    """Apply one transform step to a surface"""
+    kind = step[0]
+    if kind == "scale":
+        return pygame.transform.scale(surface, step[1])
+    if kind == "shrink":
+        _, limit, size = step
+        if surface.get_width() > limit or surface.get_height() > limit:
+            return pygame.transform.scale(surface, size)
+        return surface
+    if kind == "flip":
+        return pygame.transform.flip(surface, step[1], step[2])
+    if kind == "alpha":
+        faded = surface.copy()
+        faded.set_alpha(step[1])
+        return faded
+    if kind == "rle":
+        return accelerate(surface)
+    raise ValueError(f"Unknown transform step: {step!r}")
+
+
+def convert_for_display(surface):
+    """Convert a surface to the display's pixel format, if a display mode is set"""
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def accelerate(surface):
+    """
+    Return an RLE-accelerated copy of a mostly transparent surface. Blits skip
+    the transparent runs, but reading or transforming the copy has to undo the
+    encoding, so only use it for surfaces that are just blitted.
+    """
+    accelerated = surface.copy()
+    alpha = surface.get_alpha()
+    accelerated.set_alpha(255 if alpha is None else alpha, pygame.RLEACCEL)
+    return accelerated
+
+
+class AssetManager:
+    def __init__(self):
+        self._entries = {}  # (path, transform) -> [surface, reference count]
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, transform=(), loader=None):
+        """
+        Return the shared surface for (path, transform), loading it on a miss,
+        and take a reference to it. loader(path) decodes the base image
+        (asset_loader.load_image by default) and may return None for missing
+        files, in which case None is returned and nothing is cached.
+        """
+        transform = tuple(transform)
+        key = (path, transform)
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1] += 1
+            self.hits += 1
+            return entry[0]
+
+        if transform:
+            # Derived surfaces hold a reference to their source until released
+            source = self.get(path, transform[:-1], loader)
+            if source is None:
+                return None
+            surface = apply_transform_step(source, transform[-1])
+        else:
+            surface = (loader or load_image)(path)
+            if surface is None:
+                return None
+            surface = convert_for_display(surface)
+        self.misses += 1
+        self._entries[key] = [surface, 1]
+        return surface
+
+    def release(self, path, transform=()):
+        """Drop a reference taken by get(); the surface is freed with the last one"""
+        transform = tuple(transform)
+        key = (path, transform)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._entries[key]
+            if transform:
+                self.release(path, transform[:-1])
+
+    def scope(self):
+        """Return a new AssetScope on this manager"""
+        return AssetScope(self)
+
+    def stats(self):
+        """Return hit/miss counters and the number of cached surfaces"""
+        return {"hits": self.hits, "misses": self.misses, "surfaces": len(self._entries)}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        path, transform = key
+        return (path, tuple(transform)) in self._entries
+
+
+class AssetScope:
+    """References taken through one owner, released together"""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self._held = []
+
+    def get(self, path, transform=(), loader=None):
+        """Get a surface from the manager and remember to release it"""
+        surface = self.manager.get(path, transform, loader)
+        if surface is not None:
+            self._held.append((path, tuple(transform)))
+        return surface
+
+    def release(self):
+        """Release every reference this scope holds"""
+        for path, transform in self._held:
+            self.manager.release(path, transform)
+        self._held = []
+
+
+def get_asset_manager():
+    """Return the process-wide AssetManager"""
+    global _manager
+    if _manager is None:
+        _manager = AssetManager()
+    return _manager
@@ -0,0 +1,154 @@
+"""
+Lazy, LRU-bounded background store.
+
+Only the background currently on screen has to be decoded at startup. Others
+are decoded and scaled on demand when the player cycles to them, and at most
+cache_size scaled surfaces are kept in memory at once. Surfaces are
+converted to the display's pixel format (e.g. RGB565 on a 16-bit panel) as
+they are cached.
+
+When Pillow is installed, backgrounds whose codec supports it are decoded at
+reduced resolution (JPEG DCT draft mode, then Image.reduce) instead of
+decoding the full 1536x1024 image and shrinking it with pygame.
+"""
+
+import os
+from collections import OrderedDict
+
+import pygame
+
+from asset_loader import get_active_loader
+from asset_manager import convert_for_display
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+BACKGROUND_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
+
+
+def list_background_files(background_dir):
+    """Return the sorted background file names in background_dir"""
+    if not os.path.exists(background_dir):
+        return []
+    return sorted(f for f in os.listdir(background_dir) if f.lower().endswith(BACKGROUND_EXTENSIONS))
+
+
+def decode_background_pixels(bg_path, size, full_decode=False):
+    """
+    Decode a background with Pillow at the smallest resolution that still
+    covers size and resize it. Returns the RGB bytes, or None when the codec
+    cannot decode at reduced size and full_decode is False.
+    Only touches Pillow, so it is safe to run on a worker thread.
+    """
+    with Image.open(bg_path) as img:
+        # Let the decoder scale by 1/2, 1/4 or 1/8 while decoding (JPEG).
+        # Pillow has no scaled decode for PNG or WebP, and decoding those in
+        # full with Pillow is slower than SDL_image, so leave them to pygame
+        # unless we are off the main thread anyway.
+        if img.draft("RGB", size) is None and not full_decode:
+            return None
+        img.load()
+        
+        # Box-reduce by any integer factor the draft scale left over
+        factor = min(img.width // size[0], img.height // size[1])
+        if factor >= 2:
+            img = img.reduce(factor)
+        
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        if img.size != size:
+            img = img.resize(size, Image.BILINEAR)
+        return img.tobytes()
+
+
+def decode_reduced_background(bg_path, size):
+    """
+    Reduced-size decode of a background, handed to pygame without a copy.
+    Returns None when the codec cannot decode at reduced size.
+    """
+    data = decode_background_pixels(bg_path, size)
+    if data is None:
+        return None
+    # frombuffer keeps a reference to the bytes instead of copying them
+    return pygame.image.frombuffer(data, size, "RGB")
+
+
+def load_scaled_background(bg_path, size, reduced_decode=True):
+    """Decode a background image and scale it to size"""
+    if reduced_decode and Image is not None:
+        try:
+            background = decode_reduced_background(bg_path, size)
+            if background is not None:
+                return background
+        except Exception as e:
+            print(f"Reduced decode failed for {os.path.basename(bg_path)}, using full decode: {e}")
+    
+    background = pygame.image.load(bg_path)
+    return pygame.transform.scale(background, size)
+
+
+class BackgroundStore:
+    def __init__(self, background_dir, size, cache_size=2):
+        self.background_dir = background_dir
+        self.size = size
+        self.cache_size = max(1, cache_size)
+        self.files = list_background_files(background_dir)
+        self.failed = set()  # Indices whose file could not be decoded
+        self._cache = OrderedDict()  # index -> scaled Surface, oldest first
+
+        # Counters for checking cache behaviour
+        self.decode_count = 0
+        self.hit_count = 0
+
+    def __len__(self):
+        return len(self.files)
+
+    def get(self, index):
+        """Return the scaled background at index, decoding it if not cached (None on failure)"""
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            self.hit_count += 1
+            return self._cache[index]
+
+        if index in self.failed or not 0 <= index < len(self.files):
+            return None
+
+        bg_file = self.files[index]
+        bg_path = os.path.join(self.background_dir, bg_file)
+        try:
+            # Use the pixels decoded on a worker thread during startup, if any
+            loader = get_active_loader()
+            data = loader.take(("background", bg_path)) if loader is not None else None
+            if data is not None:
+                background = pygame.image.frombuffer(data, self.size, "RGB")
+            else:
+                background = load_scaled_background(bg_path, self.size)
+        except Exception as e:
+            print(f"Error loading background {bg_file}: {e}")
+            self.failed.add(index)
+            return None
+
+        self.decode_count += 1
+        background = convert_for_display(background)
+        self._cache[index] = background
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        print(f"Loaded background: {bg_file} ({len(self._cache)}/{self.cache_size} cached)")
+        return background
+
+    def prefetch(self, index, loader):
+        """Start decoding the background at index on an AssetLoader's pool"""
+        if Image is None or index in self._cache or not 0 <= index < len(self.files):
+            return
+        bg_path = os.path.join(self.background_dir, self.files[index])
+        loader.submit(("background", bg_path), decode_background_pixels, bg_path, self.size, True)
+
+    def cached_indices(self):
+        """Return the cached indices, least recently used first"""
+        return list(self._cache)
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._cache.clear()
@@ -1,3 +1,7 @@
+# Imported first so the startup profile can tell interpreter startup from our imports
+from startup_profiler import StartupProfiler, get_active_profiler, mark as mark_startup
+mark_startup("interpreter")
+
 import pygame
 import sys
 import os
@@ -6,59 +10,131 @@ import platform
 import time
 import math
 import json
+import argparse
+from collections import deque
+from itertools import islice
 
-# Initialize Pygame
-pygame.init()
+from asset_loader import AssetLoader
+from asset_manager import accelerate, convert_for_display, get_asset_manager
+from sprite_atlas import load_sprite_file, load_sprite_frame, sprite_frame_paths, sprite_frame_region
+from sprite_catalog import load_catalog
+from background_store import BackgroundStore, list_background_files, load_scaled_background
+from text_cache import get_text_cache
+from perf_hud import PerfHUD
+from pet_states import PetState, STATE_CLIPS
+from pet_world import NearestIndex, PairCooldowns, hit_test, overlapping_pairs, sort_by_x, spread_positions
+from sim_core import SimulationCore, core_pet_class, numpy_available
+from texture_renderer import RENDERERS, TextureRenderer, texture_backend_available
+mark_startup("imports")
 
 # Constants
-SCREEN_WIDTH = 480
+SCREEN_WIDTH = 480  # Size of the canvas the game draws into; see VPetGame.set_display_mode
 SCREEN_HEIGHT = 320
+SCALE_MODES = ("auto", "none", "integer", "scaled")
+LETTERBOX_COLOR = (0, 0, 0)
 BACKGROUND_COLOR = (135, 206, 235)  # Sky blue
+BACKGROUND_CACHE_SIZE = 2  # Scaled backgrounds kept in memory (current + most recent)
+
+# The simulation advances in fixed steps; every per-tick constant below
+# (speeds, frame delays, hunger) assumes this rate. Rendering runs at its own
+# rate and interpolates sprite positions between steps.
+SIMULATION_RATE = 10  # Steps per second
+SIMULATION_STEP_MS = 1000 // SIMULATION_RATE
+MAX_STEPS_PER_FRAME = 50  # Catch up at most 5 seconds at once (e.g. after a suspend)
+DEFAULT_RENDER_FPS = 10
 DIGIMON_SPEED = 2
+HUNGER_INTERVAL_STEPS = 60  # Hunger drops once every 60 steps
+DEFAULT_PET_COUNT = 2
+GREETING_COOLDOWN_STEPS = 30  # A pair that just greeted walks past each other for 3 seconds
+SPAWN_DISTANCE = 100  # Pets start at least this far apart when the screen has room
+DIGIMON_FRAME_NUMBERS = (0, 1, 2, 5, 6, 11, 12)  # Walking, greeting, feeding and sleeping frames
 
 # Heart emotion constants
 HEART_DISPLAY_DURATION = 1000  # 1 second in milliseconds
 HEART_FLOAT_SPEED = 1  # Pixels per frame heart floats upward
+HEART_TRANSFORM = (("shrink", 30, (25, 25)),)  # Scale heart to appropriate size (smaller than Digimon)
+HEART_KEYFRAME_MS = 50  # The heart's fade and sway are sampled every 50 ms
+
+
+def heart_keyframe_steps():
+    """Return (alpha, sway offset) for each heart keyframe, in display order"""
+    steps = []
+    fade_start = HEART_DISPLAY_DURATION * 0.7  # Start fading in last 30% of duration
+    for keyframe in range(HEART_DISPLAY_DURATION // HEART_KEYFRAME_MS):
+        elapsed_time = keyframe * HEART_KEYFRAME_MS
+        alpha = 255
+        if elapsed_time > fade_start:
+            fade_progress = (elapsed_time - fade_start) / (HEART_DISPLAY_DURATION * 0.3)
+            alpha = int(255 * (1 - fade_progress))
+        # Gentle sway
+        sway_offset = int(2 * math.sin(elapsed_time * 0.005))
+        steps.append((alpha, sway_offset))
+    return steps
+
+
+HEART_KEYFRAME_STEPS = heart_keyframe_steps()
+
+def interpolate_position(previous, rect, alpha):
+    """Return where to draw rect, alpha of the way from its previous step's position"""
+    if previous is None or alpha >= 1:
+        return rect.topleft
+    return (round(previous[0] + (rect.x - previous[0]) * alpha),
+            round(previous[1] + (rect.y - previous[1]) * alpha))
+
+
+# Sprite frames are scaled for the smaller screen
+SPRITE_TRANSFORM = (("shrink", 60, (50, 50)),)
+MIRROR_TRANSFORM = (("flip", True, False),)  # Sprites face left, their mirror images face right
+RLE_TRANSFORM = (("rle",),)  # Mostly transparent sprites that are only blitted, applied last
 
 # Food constants
 FOOD_FALL_SPEED = 3  # Pixels per frame food falls
 FOOD_LIFETIME = 10000  # 10 seconds in milliseconds before food disappears
 FOOD_SIZE = (30, 30)  # Size to scale meat to
+FOOD_CLAIM_DISTANCE = 150  # Pets only walk to food within this many pixels
+MAX_FOOD_ITEMS = 64  # Food on screen at once; taps beyond this drop nothing
 
 # Swipe gesture constants
 SWIPE_THRESHOLD = 50  # Minimum distance to be considered a swipe
 SWIPE_TIME_LIMIT = 500  # Maximum time for a swipe gesture in milliseconds
 
+# Idle mode: once every pet sleeps, no food is out and nobody has touched the
+# screen for this long, the loop blocks on events until the next animation frame
+IDLE_AFTER_MS = 30000  # 30 seconds
+INPUT_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+                pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION, pygame.KEYDOWN)
+
 # Selection UI constants
 SELECTION_GRID_COLS = 3  # 3 columns
 SELECTION_GRID_ROWS = 2  # 2 rows
 SELECTION_CELL_SIZE = 110  # Fits: (480-40 margins - 30 spacing)/3 = 136, use 110 for safety
 SELECTION_MARGIN = 10  # Spacing between cells
+PREVIEW_PREFETCH_PAGES = 1  # Pages on each side of the current one whose previews are prefetched
+PREVIEW_PREFETCH_PER_TICK = 3  # Queued previews loaded per update() while the UI is open
+
+def init_pygame(headless=False):
+    """
+    Initialize only the SDL subsystems the game uses: video (which brings
+    events), the timer behind pygame.time.get_ticks() and fonts. Audio,
+    joysticks and the rest of pygame.init() are skipped.
+    With headless=True the dummy video driver is used, so no display is needed.
+    """
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.font.init()
+    try:
+        from pygame._sdl2 import sdl2
+        sdl2.init_subsystem(sdl2.INIT_TIMER)
+    except (ImportError, AttributeError, pygame.error):
+        # pygame without the SDL2 helpers: initialize everything instead
+        pygame.init()
 
 def ensure_initial_selection(selection_file, sprites_dir):
     """Ensure digimon_selection.json exists, create with random Digimon if missing"""
     if os.path.exists(selection_file):
         return
-    available_digimon = []
-    if os.path.exists(sprites_dir):
-        # First check direct children of sprites directory
-        for folder in os.listdir(sprites_dir):
-            folder_path = os.path.join(sprites_dir, folder)
-            if folder.endswith("_dmc") and os.path.isdir(folder_path):
-                frame_0 = os.path.join(folder_path, "0.png")
-                frame_1 = os.path.join(folder_path, "1.png")
-                if os.path.exists(frame_0) and os.path.exists(frame_1):
-                    available_digimon.append(folder)
-            elif os.path.isdir(folder_path):
-                # Check subdirectories (like "Digimon Color Ver. 1")
-                for subfolder in os.listdir(folder_path):
-                    if subfolder.endswith("_dmc"):
-                        subfolder_path = os.path.join(folder_path, subfolder)
-                        if os.path.isdir(subfolder_path):
-                            frame_0 = os.path.join(subfolder_path, "0.png")
-                            frame_1 = os.path.join(subfolder_path, "1.png")
-                            if os.path.exists(frame_0) and os.path.exists(frame_1):
-                                available_digimon.append(subfolder)
+    available_digimon = load_catalog(sprites_dir).available_digimon()
     if len(available_digimon) >= 2:
         selected = random.sample(available_digimon, 2)
     else:
@@ -75,11 +151,13 @@ def ensure_initial_selection(selection_file, sprites_dir):
         print(f"Error creating {selection_file}: {e}")
 
 class DigimonSelectionUI:
-    def __init__(self, screen, available_digimon, sprites_dir, digimon_paths=None):
+    def __init__(self, screen, available_digimon, sprites_dir, digimon_paths=None, asset_loader=None):
         self.screen = screen
         self.available_digimon = available_digimon
         self.sprites_dir = sprites_dir
         self.digimon_paths = digimon_paths or {}
+        # Names as shown in the grid (without the _dmc suffix), stripped once
+        self.display_names = {name: name.replace("_dmc", "") for name in available_digimon}
         self.active = False
         self.selected_digimon = []
         
@@ -91,15 +169,18 @@ class DigimonSelectionUI:
         # Load Digimon metadata
         self.digimon_metadata = self.load_digimon_metadata()
         
+        # Preview sprites (walking frames 0 and 1) are loaded on demand: the
+        # visible page when it is drawn, the neighbouring pages a few per tick
+        self.asset_loader = asset_loader  # Optional worker pool for PNG preview decodes
+        self.preview_sprites = {}
+        self.failed_previews = set()
+        self.prefetch_queue = deque()
+        
         # Filtering system
         self.current_filter = {"stage": "All", "attribute": "All", "source": "All"}
         self.filtered_digimon = available_digimon[:]  # Copy of available digimon
         self.apply_filters()
         
-        # Load preview sprites (walking animation frame 0)
-        self.preview_sprites = {}
-        self.load_preview_sprites()
-        
         # UI styling - Updated to match Figma design
         self.background_color = (180, 180, 180)  # Light gray background
         self.frame_color = (220, 220, 220)  # Lighter gray for main frame
@@ -115,9 +196,10 @@ class DigimonSelectionUI:
         self.filter_margin = 5
         self.nav_arrow_color = (100, 100, 100)  # Dark gray for navigation arrows
         
-        # Font for text
+        # Font for text; labels are rendered through the shared text cache
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
+        self.text = get_text_cache()
         
         # Animation for walking preview - match main game timing
         self.animation_timer = 0
@@ -130,44 +212,95 @@ class DigimonSelectionUI:
         # Load selection frame
         self.selection_frame = None
         self.load_selection_frame()
+        
+        # Grid and button geometry never changes, work it out once
+        self.compute_layout()
+        
+        # Static parts of the overlay (background, borders, buttons, names, page
+        # indicator) are pre-rendered into one layer, rebuilt only when what it
+        # shows changes; see chrome_state()
+        self.chrome_layer = None
+        self.chrome_layer_state = None
     
-    def load_preview_sprites(self):
-        """Load walking animation frames (0 and 1) for each Digimon"""
-        for digimon_name in self.available_digimon:
-            if digimon_name in self.digimon_paths:
-                folder_path = self.digimon_paths[digimon_name]
-            else:
-                # Fallback to old method if path not found
-                folder_path = os.path.join(self.sprites_dir, digimon_name)
+    def preview_folder(self, digimon_name):
+        """Return the sprite folder of a Digimon"""
+        if digimon_name in self.digimon_paths:
+            return self.digimon_paths[digimon_name]
+        # Fallback to old method if path not found
+        return os.path.join(self.sprites_dir, digimon_name)
+    
+    def load_preview(self, digimon_name):
+        """Load walking animation frames (0 and 1) for one Digimon, if not loaded yet"""
+        if digimon_name in self.preview_sprites or digimon_name in self.failed_previews:
+            return
+        folder_path = self.preview_folder(digimon_name)
+        
+        try:
+            # Load frame 0 and 1 for walking animation (from the atlas or a prefetched decode when available)
+            frame_0 = load_sprite_frame(folder_path, 0, self.asset_loader)
+            frame_1 = load_sprite_frame(folder_path, 1, self.asset_loader)
             
-            try:
-                # Load frame 0 and 1 for walking animation
-                frame_0_path = os.path.join(folder_path, "0.png")
-                frame_1_path = os.path.join(folder_path, "1.png")
+            if frame_0 is not None and frame_1 is not None:
+                # Keep sprites at original size or scale them to a reasonable size (smaller than before)
+                original_width = frame_0.get_width()
+                original_height = frame_0.get_height()
                 
-                if os.path.exists(frame_0_path) and os.path.exists(frame_1_path):
-                    frame_0 = pygame.image.load(frame_0_path)
-                    frame_1 = pygame.image.load(frame_1_path)
-                    
-                    # Keep sprites at original size or scale them to a reasonable size (smaller than before)
-                    original_width = frame_0.get_width()
-                    original_height = frame_0.get_height()
-                    
-                    # Only scale if the sprite is too large, otherwise keep original size
-                    max_sprite_size = min(60, SELECTION_CELL_SIZE - 40)  # Smaller max size
-                    if original_width > max_sprite_size or original_height > max_sprite_size:
-                        # Scale maintaining aspect ratio
-                        scale_factor = min(max_sprite_size / original_width, max_sprite_size / original_height)
-                        new_width = int(original_width * scale_factor)
-                        new_height = int(original_height * scale_factor)
-                        frame_0 = pygame.transform.scale(frame_0, (new_width, new_height))
-                        frame_1 = pygame.transform.scale(frame_1, (new_width, new_height))
-                    
-                    self.preview_sprites[digimon_name] = [frame_0, frame_1]
-                else:
-                    print(f"Warning: Could not load preview sprites for {digimon_name}")
-            except Exception as e:
-                print(f"Error loading preview for {digimon_name}: {e}")
+                # Only scale if the sprite is too large, otherwise keep original size
+                max_sprite_size = min(60, SELECTION_CELL_SIZE - 40)  # Smaller max size
+                if original_width > max_sprite_size or original_height > max_sprite_size:
+                    # Scale maintaining aspect ratio
+                    scale_factor = min(max_sprite_size / original_width, max_sprite_size / original_height)
+                    new_width = int(original_width * scale_factor)
+                    new_height = int(original_height * scale_factor)
+                    frame_0 = pygame.transform.scale(frame_0, (new_width, new_height))
+                    frame_1 = pygame.transform.scale(frame_1, (new_width, new_height))
+                
+                # Previews are only blitted: display format plus RLE
+                self.preview_sprites[digimon_name] = [accelerate(convert_for_display(frame_0)),
+                                                      accelerate(convert_for_display(frame_1))]
+            else:
+                print(f"Warning: Could not load preview sprites for {digimon_name}")
+                self.failed_previews.add(digimon_name)
+        except Exception as e:
+            print(f"Error loading preview for {digimon_name}: {e}")
+            self.failed_previews.add(digimon_name)
+    
+    def page_digimon(self, page):
+        """Return the filtered Digimon shown on a page"""
+        start = page * self.items_per_page
+        return self.filtered_digimon[start:start + self.items_per_page]
+    
+    def preview_paths(self, digimon_name):
+        """Return the PNG files a preview decodes (none when an atlas covers it)"""
+        return sprite_frame_paths(self.preview_folder(digimon_name), (0, 1))
+    
+    def schedule_prefetch(self):
+        """
+        Queue the previews of the pages next to the current one, nearest first.
+        Called whenever the page or the filters change so the queue follows the player;
+        while the UI is closed the queue is emptied.
+        """
+        queue = []
+        if self.active and self.max_pages > 1:
+            for distance in range(1, PREVIEW_PREFETCH_PAGES + 1):
+                for page in ((self.page + distance) % self.max_pages, (self.page - distance) % self.max_pages):  # Arrows wrap around
+                    for digimon_name in self.page_digimon(page):
+                        if (digimon_name not in queue and digimon_name not in self.preview_sprites
+                                and digimon_name not in self.failed_previews):
+                            queue.append(digimon_name)
+        
+        if self.asset_loader is not None:
+            # Previews still wanted: drop decodes no worker has started yet and requeue
+            # in the new order. The rest are discarded, finished decodes included
+            for digimon_name in self.prefetch_queue:
+                for path in self.preview_paths(digimon_name):
+                    if digimon_name in queue:
+                        self.asset_loader.cancel(path)
+                    else:
+                        self.asset_loader.discard(path)
+            for digimon_name in queue:
+                self.asset_loader.prefetch_images(self.preview_paths(digimon_name))
+        self.prefetch_queue = deque(queue)
     
     def load_selection_frame(self):
         """Load and scale the selection frame image"""
@@ -176,10 +309,9 @@ class DigimonSelectionUI:
             project_root = os.path.dirname(os.path.dirname(self.sprites_dir))
             frame_path = os.path.join(project_root, "assets", "others", "frame.png")
             if os.path.exists(frame_path):
-                self.selection_frame = pygame.image.load(frame_path)
                 # Scale frame to fit around selection cell (slightly larger than cell)
                 frame_size = SELECTION_CELL_SIZE + 10
-                self.selection_frame = pygame.transform.scale(self.selection_frame, (frame_size, frame_size))
+                self.selection_frame = get_asset_manager().get(frame_path, (("scale", (frame_size, frame_size)),))
             else:
                 print(f"Warning: frame.png not found at {frame_path}")
                 self.selection_frame = None
@@ -187,6 +319,38 @@ class DigimonSelectionUI:
             print(f"Error loading selection frame: {e}")
             self.selection_frame = None
     
+    def compute_layout(self):
+        """Calculate the grid, arrow and button rects"""
+        self.grid_width = SELECTION_GRID_COLS * SELECTION_CELL_SIZE + (SELECTION_GRID_COLS - 1) * SELECTION_MARGIN
+        self.grid_height = SELECTION_GRID_ROWS * SELECTION_CELL_SIZE + (SELECTION_GRID_ROWS - 1) * SELECTION_MARGIN
+        
+        # Position grid in center area (buttons are now at top, no need for extra spacing)
+        content_start_y = 60  # Start below the top buttons
+        content_height = SCREEN_HEIGHT - content_start_y - 40  # Leave bottom margin
+        
+        # Center the grid in available space
+        self.grid_x = (SCREEN_WIDTH - self.grid_width) // 2  # Center horizontally
+        self.grid_y = content_start_y + ((content_height - self.grid_height) // 2)
+        
+        # Cell rects in page order (row by row)
+        self.cell_rects = []
+        for row in range(SELECTION_GRID_ROWS):
+            for col in range(SELECTION_GRID_COLS):
+                cell_x = self.grid_x + col * (SELECTION_CELL_SIZE + SELECTION_MARGIN)
+                cell_y = self.grid_y + row * (SELECTION_CELL_SIZE + SELECTION_MARGIN)
+                self.cell_rects.append(pygame.Rect(cell_x, cell_y, SELECTION_CELL_SIZE, SELECTION_CELL_SIZE))
+        
+        # Side navigation arrows - made smaller to match design
+        arrow_width = 30
+        arrow_height = 50
+        arrow_y = self.grid_y + (self.grid_height - arrow_height) // 2  # Center vertically with grid
+        self.left_arrow_rect = pygame.Rect(self.grid_x - arrow_width - 15, arrow_y, arrow_width, arrow_height)
+        self.right_arrow_rect = pygame.Rect(self.grid_x + self.grid_width + 15, arrow_y, arrow_width, arrow_height)
+        
+        # Close (X in top left) and confirm (checkmark in top right) buttons
+        self.close_button_rect = pygame.Rect(15, 15, 40, 40)
+        self.confirm_button_rect = pygame.Rect(SCREEN_WIDTH - 55, 15, 40, 40)
+    
     def open(self, current_selection=None):
         """Open the selection UI with current Digimon selection"""
         self.active = True
@@ -194,10 +358,12 @@ class DigimonSelectionUI:
         self.page = 0
         self.animation_timer = 0
         self.animation_frame = 0
+        self.schedule_prefetch()
     
     def close(self):
         """Close the selection UI"""
         self.active = False
+        self.schedule_prefetch()
     
     def handle_click(self, mouse_pos):
         """Handle mouse clicks in the selection UI"""
@@ -217,80 +383,49 @@ class DigimonSelectionUI:
             self.cycle_filter('source')
             return 'filter_changed'
         
-        # Calculate grid layout for click detection
-        grid_width = SELECTION_GRID_COLS * SELECTION_CELL_SIZE + (SELECTION_GRID_COLS - 1) * SELECTION_MARGIN
-        grid_height = SELECTION_GRID_ROWS * SELECTION_CELL_SIZE + (SELECTION_GRID_ROWS - 1) * SELECTION_MARGIN
-        
-        # Position grid in center area (buttons are now at top, no need for extra spacing)
-        content_start_y = 60  # Start below the top buttons
-        content_height = SCREEN_HEIGHT - content_start_y - 40  # Leave bottom margin
-        
-        # Center the grid in available space
-        start_x = (SCREEN_WIDTH - grid_width) // 2  # Center horizontally
-        start_y = content_start_y + ((content_height - grid_height) // 2)
-        
         # Check if clicked on a Digimon cell
-        for row in range(SELECTION_GRID_ROWS):
-            for col in range(SELECTION_GRID_COLS):
-                index = self.page * self.items_per_page + row * SELECTION_GRID_COLS + col
-                if index >= len(self.filtered_digimon):
-                    break
-                
-                cell_x = start_x + col * (SELECTION_CELL_SIZE + SELECTION_MARGIN)
-                cell_y = start_y + row * (SELECTION_CELL_SIZE + SELECTION_MARGIN)
-                cell_rect = pygame.Rect(cell_x, cell_y, SELECTION_CELL_SIZE, SELECTION_CELL_SIZE)
+        for digimon_name, cell_rect in zip(self.page_digimon(self.page), self.cell_rects):
+            if cell_rect.collidepoint(mouse_pos):
+                if digimon_name in self.selected_digimon:
+                    # Deselect
+                    self.selected_digimon.remove(digimon_name)
+                elif len(self.selected_digimon) < 2:
+                    # Select (max 2)
+                    self.selected_digimon.append(digimon_name)
+                else:
+                    # If 2 already selected, shift the list: remove first, add new
+                    self.selected_digimon.pop(0)  # Remove the oldest selection
+                    self.selected_digimon.append(digimon_name)  # Add the new one
                 
-                if cell_rect.collidepoint(mouse_pos):
-                    digimon_name = self.filtered_digimon[index]
-                    
-                    if digimon_name in self.selected_digimon:
-                        # Deselect
-                        self.selected_digimon.remove(digimon_name)
-                    elif len(self.selected_digimon) < 2:
-                        # Select (max 2)
-                        self.selected_digimon.append(digimon_name)
-                    else:
-                        # If 2 already selected, shift the list: remove first, add new
-                        self.selected_digimon.pop(0)  # Remove the oldest selection
-                        self.selected_digimon.append(digimon_name)  # Add the new one
-                    
-                    return 'selection_changed'
-        
-        # Check if clicked on side navigation arrows - updated sizes
-        grid_height = SELECTION_GRID_ROWS * SELECTION_CELL_SIZE + (SELECTION_GRID_ROWS - 1) * SELECTION_MARGIN
-        arrow_width = 30  # Match the new arrow size
-        arrow_height = 50  # Match the new arrow size
-        arrow_y = start_y + (grid_height - arrow_height) // 2  # Center vertically with grid
+                return 'selection_changed'
         
         # Left arrow (Previous page or wrap to last page)
         if self.max_pages > 1:  # Show if there are multiple pages
-            left_arrow_rect = pygame.Rect(start_x - arrow_width - 15, arrow_y, arrow_width, arrow_height)
-            if left_arrow_rect.collidepoint(mouse_pos):
+            if self.left_arrow_rect.collidepoint(mouse_pos):
                 if self.page > 0:
                     self.page -= 1
                 else:
                     self.page = self.max_pages - 1  # Wrap to last page
+                self.schedule_prefetch()
                 return 'page_changed'
         
         # Right arrow (Next page or wrap to first page)
         if self.max_pages > 1:  # Show if there are multiple pages
-            right_arrow_rect = pygame.Rect(start_x + grid_width + 15, arrow_y, arrow_width, arrow_height)
-            if right_arrow_rect.collidepoint(mouse_pos):
+            if self.right_arrow_rect.collidepoint(mouse_pos):
                 if self.page < self.max_pages - 1:
                     self.page += 1
                 else:
                     self.page = 0  # Wrap to first page
+                self.schedule_prefetch()
                 return 'page_changed'
         
-        # Close button (X in top left) - Updated to match new size
-        close_button_rect = pygame.Rect(15, 15, 40, 40)
-        if close_button_rect.collidepoint(mouse_pos):
+        # Close button (X in top left)
+        if self.close_button_rect.collidepoint(mouse_pos):
             return 'close'
         
         # Confirm button (✓ in top right) - Only if 2 Digimon selected
         if len(self.selected_digimon) == 2:
-            confirm_button_rect = pygame.Rect(SCREEN_WIDTH - 55, 15, 40, 40)
-            if confirm_button_rect.collidepoint(mouse_pos):
+            if self.confirm_button_rect.collidepoint(mouse_pos):
                 return 'confirm'
         
         return None
@@ -305,95 +440,106 @@ class DigimonSelectionUI:
             
             # Update button animation
             self.button_animation_timer += 1
+            
+            # Load a few queued previews of the neighbouring pages
+            for _ in range(min(PREVIEW_PREFETCH_PER_TICK, len(self.prefetch_queue))):
+                self.load_preview(self.prefetch_queue.popleft())
     
     def draw(self):
         """Draw the selection UI"""
         if not self.active:
             return
         
-        # Create semi-transparent light gray overlay background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)  # Make background slightly transparent (0-255, 255 = opaque)
-        overlay.fill(self.background_color)
-        self.screen.blit(overlay, (0, 0))
+        # Static overlay, rebuilt only when filters, page or selection changed
+        state = self.chrome_state()
+        if state != self.chrome_layer_state:
+            self.chrome_layer = self.build_chrome_layer()
+            self.chrome_layer_state = state
+        self.screen.blit(self.chrome_layer, (0, 0))
+        
+        # Draw walking animation (the visible page is loaded as soon as it is shown)
+        for digimon_name, cell_rect in zip(self.page_digimon(self.page), self.cell_rects):
+            self.load_preview(digimon_name)
+            if digimon_name in self.preview_sprites:
+                sprite = self.preview_sprites[digimon_name][self.animation_frame]
+                sprite_rect = sprite.get_rect(center=(cell_rect.centerx, cell_rect.centery - 10))
+                self.screen.blit(sprite, sprite_rect)
         
-        # Draw filter buttons
-        self.draw_filter_buttons()
-        
-        # Calculate grid layout
-        grid_width = SELECTION_GRID_COLS * SELECTION_CELL_SIZE + (SELECTION_GRID_COLS - 1) * SELECTION_MARGIN
-        grid_height = SELECTION_GRID_ROWS * SELECTION_CELL_SIZE + (SELECTION_GRID_ROWS - 1) * SELECTION_MARGIN
+        # Confirm button (✓ in top right) - Only if 2 Digimon selected
+        if len(self.selected_digimon) == 2:
+            confirm_button_rect = self.confirm_button_rect
+            # Add subtle pulse animation
+            pulse = int(10 * math.sin(self.button_animation_timer * 0.2))
+            button_color = (100 + pulse, 200, 100 + pulse)
+            
+            pygame.draw.rect(self.screen, button_color, confirm_button_rect)
+            pygame.draw.rect(self.screen, (70, 150, 70), confirm_button_rect, 2)  # Thinner border
+            
+            # Draw checkmark (✓) - larger
+            check_color = (255, 255, 255)
+            # Draw checkmark as two lines forming a tick - larger size
+            pygame.draw.line(self.screen, check_color,
+                            (confirm_button_rect.left + 8, confirm_button_rect.centery),
+                            (confirm_button_rect.centerx - 2, confirm_button_rect.bottom - 10), 4)
+            pygame.draw.line(self.screen, check_color,
+                            (confirm_button_rect.centerx - 2, confirm_button_rect.bottom - 10),
+                            (confirm_button_rect.right - 6, confirm_button_rect.top + 6), 4)
+    
+    def chrome_state(self):
+        """Everything the static overlay layer depends on"""
+        return (tuple(self.current_filter.values()), self.page, self.max_pages,
+                len(self.filtered_digimon), tuple(self.selected_digimon))
+    
+    def build_chrome_layer(self):
+        """Pre-render the static parts of the overlay into a screen-sized layer"""
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         
-        # Position grid in center area (buttons are now at top, no need for extra spacing)
-        content_start_y = 60  # Start below the top buttons
-        content_height = SCREEN_HEIGHT - content_start_y - 40  # Leave bottom margin
+        # Semi-transparent light gray overlay background (alpha 200 of 255)
+        layer.fill(self.background_color + (200,))
         
-        # Center the grid in available space
-        start_x = (SCREEN_WIDTH - grid_width) // 2  # Center horizontally
-        start_y = content_start_y + ((content_height - grid_height) // 2)
+        # Draw filter buttons
+        self.draw_filter_buttons(layer)
         
         # Draw Digimon grid
-        for row in range(SELECTION_GRID_ROWS):
-            for col in range(SELECTION_GRID_COLS):
-                index = self.page * self.items_per_page + row * SELECTION_GRID_COLS + col
-                if index >= len(self.filtered_digimon):
-                    break
-                
-                digimon_name = self.filtered_digimon[index]
-                cell_x = start_x + col * (SELECTION_CELL_SIZE + SELECTION_MARGIN)
-                cell_y = start_y + row * (SELECTION_CELL_SIZE + SELECTION_MARGIN)
-                
-                # Draw cell background with clean styling
-                cell_rect = pygame.Rect(cell_x, cell_y, SELECTION_CELL_SIZE, SELECTION_CELL_SIZE)
-                
-                # Only draw highlights for selected cells, no background frames
-                if digimon_name in self.selected_digimon:
-                    # Selected cell - highlighted with green border only
-                    pygame.draw.rect(self.screen, self.selected_color, cell_rect, 4)
-                    
-                    # Draw selection number in top-right corner
-                    selection_order = self.selected_digimon.index(digimon_name) + 1
-                    number_radius = 12
-                    number_center = (cell_x + SELECTION_CELL_SIZE - 15, cell_y + 15)
-                    pygame.draw.circle(self.screen, self.selected_color, number_center, number_radius)
-                    pygame.draw.circle(self.screen, self.text_color, number_center, number_radius, 2)
-                    
-                    number_surface = self.small_font.render(str(selection_order), True, self.text_color)
-                    number_rect = number_surface.get_rect(center=number_center)
-                    self.screen.blit(number_surface, number_rect)
-                # No background drawn for unselected cells
+        for digimon_name, cell_rect in zip(self.page_digimon(self.page), self.cell_rects):
+            cell_x, cell_y = cell_rect.topleft
+            
+            # Only draw highlights for selected cells, no background frames
+            if digimon_name in self.selected_digimon:
+                # Selected cell - highlighted with green border only
+                pygame.draw.rect(layer, self.selected_color, cell_rect, 4)
                 
-                # Draw walking animation
-                if digimon_name in self.preview_sprites:
-                    sprite = self.preview_sprites[digimon_name][self.animation_frame]
-                    sprite_rect = sprite.get_rect(center=(cell_x + SELECTION_CELL_SIZE // 2, cell_y + SELECTION_CELL_SIZE // 2 - 10))
-                    self.screen.blit(sprite, sprite_rect)
+                # Draw selection number in top-right corner
+                selection_order = self.selected_digimon.index(digimon_name) + 1
+                number_radius = 12
+                number_center = (cell_x + SELECTION_CELL_SIZE - 15, cell_y + 15)
+                pygame.draw.circle(layer, self.selected_color, number_center, number_radius)
+                pygame.draw.circle(layer, self.text_color, number_center, number_radius, 2)
                 
-                # Digimon name (remove _dmc suffix)
-                display_name = digimon_name.replace("_dmc", "")
-                name_text = self.small_font.render(display_name, True, self.text_color)
-                name_rect = name_text.get_rect(center=(cell_x + SELECTION_CELL_SIZE // 2, cell_y + SELECTION_CELL_SIZE - 15))
-                self.screen.blit(name_text, name_rect)
+                number_surface = self.text.render(self.small_font, str(selection_order), self.text_color)
+                number_rect = number_surface.get_rect(center=number_center)
+                layer.blit(number_surface, number_rect)
+            # No background drawn for unselected cells
+            
+            # Digimon name (without _dmc suffix)
+            name_text = self.text.render(self.small_font, self.display_names[digimon_name], self.text_color)
+            name_rect = name_text.get_rect(center=(cell_x + SELECTION_CELL_SIZE // 2, cell_y + SELECTION_CELL_SIZE - 15))
+            layer.blit(name_text, name_rect)
         
         # Page indicator - position under the grid
         if self.max_pages > 1:
-            grid_bottom = start_y + grid_height
+            grid_bottom = self.grid_y + self.grid_height
             page_text = f"Page {self.page + 1} / {self.max_pages} ({len(self.filtered_digimon)} Digimon)"
-            page_surface = self.small_font.render(page_text, True, self.text_color)
+            page_surface = self.text.render(self.small_font, page_text, self.text_color)
             page_y = grid_bottom + 15  # 15 pixels below the grid
             page_rect = page_surface.get_rect(center=(SCREEN_WIDTH // 2, page_y))
-            self.screen.blit(page_surface, page_rect)
-        
-        # Draw side navigation arrows - made smaller to match design
-        arrow_width = 30  # Reduced from 50
-        arrow_height = 50  # Reduced from 80
-        arrow_y = start_y + (grid_height - arrow_height) // 2  # Center vertically with grid
+            layer.blit(page_surface, page_rect)
         
         # Left arrow (Previous page or wrap to last page)
         if self.max_pages > 1:  # Show if there are multiple pages
-            left_arrow_rect = pygame.Rect(start_x - arrow_width - 15, arrow_y, arrow_width, arrow_height)
-            pygame.draw.rect(self.screen, self.nav_arrow_color, left_arrow_rect)
-            pygame.draw.rect(self.screen, (60, 60, 60), left_arrow_rect, 2)  # Thinner border
+            left_arrow_rect = self.left_arrow_rect
+            pygame.draw.rect(layer, self.nav_arrow_color, left_arrow_rect)
+            pygame.draw.rect(layer, (60, 60, 60), left_arrow_rect, 2)  # Thinner border
             
             # Draw left arrow shape - smaller
             arrow_center_x = left_arrow_rect.centerx
@@ -403,13 +549,13 @@ class DigimonSelectionUI:
                 (arrow_center_x - 5, arrow_center_y),
                 (arrow_center_x + 8, arrow_center_y + 10)
             ]
-            pygame.draw.polygon(self.screen, (255, 255, 255), arrow_points)
+            pygame.draw.polygon(layer, (255, 255, 255), arrow_points)
         
         # Right arrow (Next page or wrap to first page)
         if self.max_pages > 1:  # Show if there are multiple pages
-            right_arrow_rect = pygame.Rect(start_x + grid_width + 15, arrow_y, arrow_width, arrow_height)
-            pygame.draw.rect(self.screen, self.nav_arrow_color, right_arrow_rect)
-            pygame.draw.rect(self.screen, (60, 60, 60), right_arrow_rect, 2)  # Thinner border
+            right_arrow_rect = self.right_arrow_rect
+            pygame.draw.rect(layer, self.nav_arrow_color, right_arrow_rect)
+            pygame.draw.rect(layer, (60, 60, 60), right_arrow_rect, 2)  # Thinner border
             
             # Draw right arrow shape - smaller
             arrow_center_x = right_arrow_rect.centerx
@@ -419,42 +565,26 @@ class DigimonSelectionUI:
                 (arrow_center_x + 5, arrow_center_y),
                 (arrow_center_x - 8, arrow_center_y + 10)
             ]
-            pygame.draw.polygon(self.screen, (255, 255, 255), arrow_points)
+            pygame.draw.polygon(layer, (255, 255, 255), arrow_points)
         
         # Close button (X in top left) - increased size
-        close_button_rect = pygame.Rect(15, 15, 40, 40)  # Increased back to 40x40
-        pygame.draw.rect(self.screen, (200, 100, 100), close_button_rect)
-        pygame.draw.rect(self.screen, (150, 70, 70), close_button_rect, 2)  # Thinner border
+        close_button_rect = self.close_button_rect
+        pygame.draw.rect(layer, (200, 100, 100), close_button_rect)
+        pygame.draw.rect(layer, (150, 70, 70), close_button_rect, 2)  # Thinner border
         
         # Draw X symbol - larger
         x_color = (255, 255, 255)
         # Draw X as two lines with larger size
-        pygame.draw.line(self.screen, x_color, 
+        pygame.draw.line(layer, x_color, 
                         (close_button_rect.left + 8, close_button_rect.top + 8),
                         (close_button_rect.right - 8, close_button_rect.bottom - 8), 4)
-        pygame.draw.line(self.screen, x_color,
+        pygame.draw.line(layer, x_color,
                         (close_button_rect.right - 8, close_button_rect.top + 8),
                         (close_button_rect.left + 8, close_button_rect.bottom - 8), 4)
         
-        # Confirm button (✓ in top right) - Only if 2 Digimon selected
-        if len(self.selected_digimon) == 2:
-            confirm_button_rect = pygame.Rect(SCREEN_WIDTH - 55, 15, 40, 40)  # Increased back to 40x40
-            # Add subtle pulse animation
-            pulse = int(10 * math.sin(self.button_animation_timer * 0.2))
-            button_color = (100 + pulse, 200, 100 + pulse)
-            
-            pygame.draw.rect(self.screen, button_color, confirm_button_rect)
-            pygame.draw.rect(self.screen, (70, 150, 70), confirm_button_rect, 2)  # Thinner border
-            
-            # Draw checkmark (✓) - larger
-            check_color = (255, 255, 255)
-            # Draw checkmark as two lines forming a tick - larger size
-            pygame.draw.line(self.screen, check_color,
-                            (confirm_button_rect.left + 8, confirm_button_rect.centery),
-                            (confirm_button_rect.centerx - 2, confirm_button_rect.bottom - 10), 4)
-            pygame.draw.line(self.screen, check_color,
-                            (confirm_button_rect.centerx - 2, confirm_button_rect.bottom - 10),
-                            (confirm_button_rect.right - 6, confirm_button_rect.top + 6), 4)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert_alpha()
+        return layer
 
     def load_digimon_metadata(self):
         """Load Digimon metadata from digimon_list.json"""
@@ -542,6 +672,7 @@ class DigimonSelectionUI:
         # Reset page and update pagination after filtering
         self.page = 0
         self.update_pagination()
+        self.schedule_prefetch()
     
     def update_pagination(self):
         """Update pagination based on filtered Digimon"""
@@ -573,8 +704,8 @@ class DigimonSelectionUI:
         
         self.apply_filters()
     
-    def draw_filter_buttons(self):
-        """Draw filter buttons spanning the full grid width"""
+    def draw_filter_buttons(self, surface):
+        """Draw filter buttons spanning the full grid width onto surface"""
         # Button dimensions - same height as cancel/confirm buttons
         button_height = 40  # Same as cancel/confirm buttons
         button_spacing = 10  # Spacing between buttons
@@ -592,34 +723,34 @@ class DigimonSelectionUI:
         
         # Stage filter button
         stage_rect = pygame.Rect(start_x, button_y, button_width, button_height)
-        pygame.draw.rect(self.screen, self.button_color, stage_rect)
-        pygame.draw.rect(self.screen, (80, 80, 80), stage_rect, 2)
+        pygame.draw.rect(surface, self.button_color, stage_rect)
+        pygame.draw.rect(surface, (80, 80, 80), stage_rect, 2)
         
         stage_text = f"Stage: {self.current_filter['stage']}"
         if len(stage_text) > 18:
             stage_text = f"Stage: {self.current_filter['stage'][:8]}.."
         
-        stage_surface = self.small_font.render(stage_text, True, self.text_color)
+        stage_surface = self.text.render(self.small_font, stage_text, self.text_color)
         stage_text_rect = stage_surface.get_rect(center=stage_rect.center)
-        self.screen.blit(stage_surface, stage_text_rect)
+        surface.blit(stage_surface, stage_text_rect)
         
         # Attribute filter button
         attr_rect = pygame.Rect(start_x + button_width + button_spacing, button_y, button_width, button_height)
-        pygame.draw.rect(self.screen, self.button_color, attr_rect)
-        pygame.draw.rect(self.screen, (80, 80, 80), attr_rect, 2)
+        pygame.draw.rect(surface, self.button_color, attr_rect)
+        pygame.draw.rect(surface, (80, 80, 80), attr_rect, 2)
         
         attr_text = f"Attr: {self.current_filter['attribute']}"
         if len(attr_text) > 18:
             attr_text = f"Attr: {self.current_filter['attribute'][:8]}.."
         
-        attr_surface = self.small_font.render(attr_text, True, self.text_color)
+        attr_surface = self.text.render(self.small_font, attr_text, self.text_color)
         attr_text_rect = attr_surface.get_rect(center=attr_rect.center)
-        self.screen.blit(attr_surface, attr_text_rect)
+        surface.blit(attr_surface, attr_text_rect)
         
         # Source filter button
         source_rect = pygame.Rect(start_x + 2 * (button_width + button_spacing), button_y, button_width, button_height)
-        pygame.draw.rect(self.screen, self.button_color, source_rect)
-        pygame.draw.rect(self.screen, (80, 80, 80), source_rect, 2)
+        pygame.draw.rect(surface, self.button_color, source_rect)
+        pygame.draw.rect(surface, (80, 80, 80), source_rect, 2)
         
         # Shorten source text for display
         source_display = self.current_filter['source']
@@ -641,9 +772,9 @@ class DigimonSelectionUI:
             if len(source_text) > 18:
                 source_text = f"Src: {source_display[:10]}.."
         
-        source_surface = self.small_font.render(source_text, True, self.text_color)
+        source_surface = self.text.render(self.small_font, source_text, self.text_color)
         source_text_rect = source_surface.get_rect(center=source_rect.center)
-        self.screen.blit(source_surface, source_text_rect)
+        surface.blit(source_surface, source_text_rect)
         
         # Store button rects for click detection
         self.stage_button_rect = stage_rect
@@ -651,23 +782,31 @@ class DigimonSelectionUI:
         self.source_button_rect = source_rect
 
 class Food:
-    def __init__(self, x, y, food_image):
+    # Records are reused by FoodPool, so they only ever hold these
+    __slots__ = ("image", "rect", "previous_position", "fall_velocity", "creation_time",
+                 "ground_y", "on_ground", "consumed", "claimed_by")
+    
+    def __init__(self, x, y, food_image, creation_time=None):
         self.image = food_image
         # Use the actual image size instead of hardcoded FOOD_SIZE
         image_width = food_image.get_width()
         image_height = food_image.get_height()
-        self.rect = pygame.Rect(x - image_width//2, y, image_width, image_height)
+        self.rect = pygame.Rect(0, 0, image_width, image_height)
         self.fall_velocity = FOOD_FALL_SPEED
-        self.creation_time = pygame.time.get_ticks()
         self.ground_y = SCREEN_HEIGHT - 30 - image_height  # Same ground level as Digimon
+        self.place(x, y, pygame.time.get_ticks() if creation_time is None else creation_time)
+    
+    def place(self, x, y, creation_time):
+        """Start over as a fresh piece dropped at (x, y) at creation_time (ms)"""
+        self.rect.topleft = (x - self.rect.width // 2, y)
+        self.previous_position = None  # Position before the last simulation step
+        self.creation_time = creation_time
         self.on_ground = False
         self.consumed = False  # Flag to mark when food has been eaten
         self.claimed_by = None  # Which Digimon has claimed this food (None if unclaimed)
     
-    def update(self):
-        """Update food falling and lifetime"""
-        current_time = pygame.time.get_ticks()
-        
+    def update(self, current_time):
+        """Update food falling and lifetime (current_time in ms)"""
         # Check if food has been consumed
         if self.consumed:
             return False  # Food should be removed
@@ -688,37 +827,63 @@ class Food:
         
         return True  # Food should stay
     
-    def draw(self, screen):
-        """Draw the food item"""
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        """Draw the food item (alpha of the way through the current step) and return the screen area it covered"""
+        return screen.blit(self.image, interpolate_position(self.previous_position, self.rect, alpha))
     
     def check_collision_with_digimon(self, digimon):
         """Check if Digimon collides with this food"""
         return self.rect.colliderect(digimon.rect)
 
+class FoodPool:
+    """
+    A fixed number of Food records, allocated up front. The first len(pool)
+    records are the food on screen, the rest are free for drop() to reuse.
+    remove() moves the last live record into the gap, so dropping and
+    removing food never allocates (and food order changes on removal).
+    """
+    
+    def __init__(self, food_image, capacity):
+        self.records = [Food(0, 0, food_image, 0) for _ in range(capacity)]
+        self.count = 0
+    
+    def drop(self, x, y, creation_time):
+        """Place a free record at (x, y) and return it, or None when every record is on screen"""
+        if self.count == len(self.records):
+            return None
+        food = self.records[self.count]
+        food.place(x, y, creation_time)
+        self.count += 1
+        return food
+    
+    def remove(self, position):
+        """Free the live record at position; the last live record takes its place"""
+        records = self.records
+        self.count -= 1
+        records[position], records[self.count] = records[self.count], records[position]
+    
+    def __len__(self):
+        return self.count
+    
+    def __iter__(self):
+        return islice(self.records, self.count)
+
 class Digimon:
-    def __init__(self, sprite_folder, speed=DIGIMON_SPEED):
-        self.frames = []
-        self.current_frame = 0
-        self.frame_timer = 0
-        self.frame_delay = 5  # Change frame every 5 game ticks (0.5 seconds at 10 FPS)
+    def __init__(self, sprite_folder, speed=DIGIMON_SPEED, texture_frames=False):
+        # texture_frames: drawn by the texture backend, which copies frames out of
+        # the atlas sheets and mirrors them with a flip flag (see frame_regions)
         self.speed = speed  # Individual speed for each Digimon
+        self.original_speed = speed  # Speed to restore after eating
+        self.speed_backup = speed  # Speed to restore after greeting
         
-        # Greeting animation state
-        self.is_greeting = False
-        self.greeting_timer = 0
-        self.greeting_frame = 0
-        self.greeting_cycles = 0
-        self.greeting_frames = []  # Will store frames 2 and 0 for greeting
-        self.post_greeting_direction = None  # Store direction to change to after greeting
+        # Behavior state (see pet_states) and the position in its animation clip
+        self.state = PetState.SLEEPING  # Start sleeping
+        self.clip_timer = 0  # Steps the current clip frame has been shown
+        self.clip_step = 0  # Position in the clip's sequence
         
-        # Sleeping animation state
-        self.is_sleeping = True  # Start sleeping
-        self.sleeping_timer = 0
-        self.sleeping_frame = 0
-        self.sleeping_frames = []  # Will store frames 11 and 12 for sleeping
+        self.post_greeting_direction = None  # Store direction to change to after greeting
         
-        # Jumping animation state
+        # Jumping physics (runs alongside walking and greeting)
         self.is_jumping = False
         self.jump_velocity = 0
         self.ground_y = 0  # Will be set after rect is created
@@ -726,20 +891,18 @@ class Digimon:
         self.jump_strength = -8  # Negative because pygame y-axis goes down
         
         # Heart emotion state
+        self.clock = pygame.time.get_ticks  # Time in ms for hearts and feeding; the game's simulation clock in play
         self.heart_visible = False
         self.heart_start_time = 0
         self.heart_float_offset = 0
         self.heart_image = None
+        self.heart_keyframes = []  # (surface, sway offset) per HEART_KEYFRAME_MS, see HEART_KEYFRAME_STEPS
+        self.heart_keyframe = 0
+        
+        self.frame_regions = None  # Set for the texture backend, see below
         
-        # Feeding animation state
-        self.is_feeding = False
-        self.feeding_timer = 0
-        self.feeding_frame = 0
-        self.feeding_frames = []  # Will store frames 5 and 6 for feeding
-        self.feeding_cycles = 0
-        self.target_food = None  # Food item the Digimon is moving towards
-        self.moving_to_food = False
-        self.eating_position_reached = False
+        # Food the Digimon is walking to or eating
+        self.target_food = None
         
         # Hunger system
         self.hunger = 100  # Start with full hunger (0-100)
@@ -747,123 +910,167 @@ class Digimon:
         self.hunger_timer = 0
         self.last_fed_time = 0
         
-        # Load heart emotion from others folder
-        assets_dir = os.path.dirname(os.path.dirname(sprite_folder))  # Go up two levels from sprite folder
-        others_dir = os.path.join(assets_dir, "others")
-        heart_path = os.path.join(others_dir, "heart.png")
+        # Images are shared through the process-wide asset manager; this scope
+        # holds this Digimon's references until release_assets()
+        self.assets = get_asset_manager().scope()
+        
+        # Load heart emotion from the assets/others folder
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        heart_path = os.path.join(project_root, "assets", "others", "heart.png")
         
         try:
             if os.path.exists(heart_path):
-                self.heart_image = pygame.image.load(heart_path)
-                # Scale heart to appropriate size (smaller than Digimon)
-                if self.heart_image.get_width() > 30 or self.heart_image.get_height() > 30:
-                    self.heart_image = pygame.transform.scale(self.heart_image, (25, 25))
-                print(f"Loaded heart emotion: {heart_path}")
+                self.heart_image = self.assets.get(heart_path, HEART_TRANSFORM + RLE_TRANSFORM)
+                # Faded copies are shared by every pet through the asset manager
+                for alpha, sway_offset in HEART_KEYFRAME_STEPS:
+                    if alpha < 255:
+                        surface = self.assets.get(heart_path, HEART_TRANSFORM + (("alpha", alpha),) + RLE_TRANSFORM)
+                    else:
+                        surface = self.heart_image
+                    self.heart_keyframes.append((surface, sway_offset))
             else:
                 print(f"Heart emotion not found: {heart_path}")
         except Exception as e:
             print(f"Could not load heart emotion: {e}")
             self.heart_image = None
+            self.heart_keyframes = []
         
         # Load walking animation frames (0.png and 1.png), greeting frames (2.png), sleeping frames (11.png and 12.png), and feeding frames (5.png and 6.png)
+        # Frames come from the source folder's packed atlas when one exists, otherwise from the PNGs
         try:
-            # Load frame 0 and frame 1 for walking animation
-            frame_0_path = os.path.join(sprite_folder, "0.png")
-            frame_1_path = os.path.join(sprite_folder, "1.png")
-            frame_2_path = os.path.join(sprite_folder, "2.png")
-            frame_5_path = os.path.join(sprite_folder, "5.png")
-            frame_6_path = os.path.join(sprite_folder, "6.png")
-            frame_11_path = os.path.join(sprite_folder, "11.png")
-            frame_12_path = os.path.join(sprite_folder, "12.png")
+            sprite_frames = {}
+            for frame_num in DIGIMON_FRAME_NUMBERS:
+                frame_path = os.path.join(sprite_folder, f"{frame_num}.png")
+                frame = self.assets.get(frame_path, SPRITE_TRANSFORM + RLE_TRANSFORM, load_sprite_file)
+                if frame is not None:
+                    sprite_frames[frame_num] = frame
             
-            if os.path.exists(frame_0_path) and os.path.exists(frame_1_path):
-                # Load walking frames
-                frame_0 = pygame.image.load(frame_0_path)
-                frame_1 = pygame.image.load(frame_1_path)
-                
-                # Scale the frames for the smaller screen
-                if frame_0.get_width() > 60 or frame_0.get_height() > 60:
-                    frame_0 = pygame.transform.scale(frame_0, (50, 50))
-                if frame_1.get_width() > 60 or frame_1.get_height() > 60:
-                    frame_1 = pygame.transform.scale(frame_1, (50, 50))
+            if 0 in sprite_frames and 1 in sprite_frames:
+                clip_frame_numbers = {
+                    "walking": (0, 1),
+                    # Greeting frames (2 and 0), fallback: use walking frames for greeting
+                    "greeting": (2, 0) if 2 in sprite_frames else (1, 0),  # 2 -> 0 -> 2 -> 0
+                    # Sleeping frames (11 and 12), fallback: use frame 0 for sleeping
+                    "sleeping": (11, 12) if 11 in sprite_frames and 12 in sprite_frames else (0,),  # 11 -> 12 -> 11 -> 12
+                    # Feeding frames (5 and 6), fallback: use walking frames for feeding
+                    "feeding": (5, 6) if 5 in sprite_frames and 6 in sprite_frames else (1, 0),  # 5 -> 6 -> 5 -> 6 -> 5
+                }
                 
-                self.frames = [frame_0, frame_1]
-                self.image = self.frames[0]
+                # Mirror every frame once here (shared with other pets of the same
+                # species) so turning around never has to flip surfaces. The texture
+                # backend flips on the copy instead, so it faces both ways with one set
+                mirrored_frames = {}
+                for frame_num in sprite_frames:
+                    frame_path = os.path.join(sprite_folder, f"{frame_num}.png")
+                    if texture_frames:
+                        mirrored_frames[frame_num] = sprite_frames[frame_num]
+                    else:
+                        mirrored_frames[frame_num] = self.assets.get(frame_path, SPRITE_TRANSFORM + MIRROR_TRANSFORM + RLE_TRANSFORM, load_sprite_file)
                 
-                # Load greeting frames (2 and 0)
-                if os.path.exists(frame_2_path):
-                    frame_2 = pygame.image.load(frame_2_path)
-                    if frame_2.get_width() > 60 or frame_2.get_height() > 60:
-                        frame_2 = pygame.transform.scale(frame_2, (50, 50))
-                    self.greeting_frames = [frame_2, frame_0]  # 2 -> 0 -> 2 -> 0
-                else:
-                    # Fallback: use walking frames for greeting
-                    self.greeting_frames = [frame_1, frame_0]
+                if texture_frames:
+                    # Frame surface -> (source, area) to copy from: the atlas sheet and the
+                    # frame's rect in it, or the frame itself when it is not packed
+                    self.frame_regions = {}
+                    for frame_num, frame in sprite_frames.items():
+                        self.frame_regions[frame] = sprite_frame_region(sprite_folder, frame_num) or (frame, None)
                 
-                # Load sleeping frames (11 and 12)
-                if os.path.exists(frame_11_path) and os.path.exists(frame_12_path):
-                    frame_11 = pygame.image.load(frame_11_path)
-                    frame_12 = pygame.image.load(frame_12_path)
-                    if frame_11.get_width() > 60 or frame_11.get_height() > 60:
-                        frame_11 = pygame.transform.scale(frame_11, (50, 50))
-                    if frame_12.get_width() > 60 or frame_12.get_height() > 60:
-                        frame_12 = pygame.transform.scale(frame_12, (50, 50))
-                    self.sleeping_frames = [frame_11, frame_12]  # 11 -> 12 -> 11 -> 12
-                else:
-                    # Fallback: use frame 0 for sleeping
-                    self.sleeping_frames = [frame_0]
-                
-                # Load feeding frames (5 and 6)
-                if os.path.exists(frame_5_path) and os.path.exists(frame_6_path):
-                    frame_5 = pygame.image.load(frame_5_path)
-                    frame_6 = pygame.image.load(frame_6_path)
-                    if frame_5.get_width() > 60 or frame_5.get_height() > 60:
-                        frame_5 = pygame.transform.scale(frame_5, (50, 50))
-                    if frame_6.get_width() > 60 or frame_6.get_height() > 60:
-                        frame_6 = pygame.transform.scale(frame_6, (50, 50))
-                    self.feeding_frames = [frame_5, frame_6]  # 5 -> 6 -> 5 -> 6 -> 5
-                else:
-                    # Fallback: use walking frames for feeding
-                    self.feeding_frames = [frame_1, frame_0]
-                    
+                # Clip name -> (frames facing left, frames facing right)
+                self.clips = {}
+                for clip, frame_nums in clip_frame_numbers.items():
+                    self.clips[clip] = ([sprite_frames[frame_num] for frame_num in frame_nums],
+                                        [mirrored_frames[frame_num] for frame_num in frame_nums])
             else:
-                raise Exception(f"Walking frames not found: {frame_0_path} or {frame_1_path}")
+                raise Exception(f"Walking frames not found in {sprite_folder}")
                 
         except Exception as e:
             print(f"Could not load sprite: {e}")
-            # Create a simple colored rectangle as fallback
-            self.image = pygame.Surface((40, 40))
-            self.image.fill((255, 165, 0))  # Orange color
-            self.frames = [self.image]
-            self.greeting_frames = [self.image]  # Same fallback for greeting
-            self.sleeping_frames = [self.image]  # Same fallback for sleeping
+            # Create a simple colored rectangle as fallback (same for every clip and orientation)
+            fallback_image = pygame.Surface((40, 40))
+            fallback_image.fill((255, 165, 0))  # Orange color
+            self.clips = {clip: ([fallback_image], [fallback_image]) for clip in ("walking", "greeting", "sleeping", "feeding")}
+            if texture_frames:
+                self.frame_regions = {fallback_image: (fallback_image, None)}
+        
+        # Start sleeping, so show the first sleeping frame
+        self.set_orientation(False)
+        self.show_frame()
         
         self.rect = self.image.get_rect()
         self.rect.x = 0
         self.rect.y = SCREEN_HEIGHT - 30 - self.rect.height  # Position on the invisible ground line
+        self.previous_position = None  # Position before the last simulation step
         self.ground_y = self.rect.y  # Store ground position for jumping
         self.direction = 1  # 1 for right, -1 for left
-        self.flipped = False
-        self.original_frames = self.frames.copy()  # Keep original frames for flipping
-        self.original_greeting_frames = self.greeting_frames.copy()  # Keep original greeting frames
-        self.original_sleeping_frames = self.sleeping_frames.copy()  # Keep original sleeping frames
-        self.original_feeding_frames = self.feeding_frames.copy()  # Keep original feeding frames
         self.direction_timer = 0  # Timer for random direction changes
         self.next_direction_change = random.randint(60, 300)  # Random time between 1-5 seconds at 10fps
-        
-        # Start sleeping, so set image to first sleeping frame
-        if self.sleeping_frames:
-            self.image = self.sleeping_frames[0]
-        
-        # Ensure Digimon starts facing right by flipping if needed (but only when not sleeping)
-        # Assume the original sprite faces left, so flip it to face right initially
-        if not self.is_sleeping:
-            self.frames = [pygame.transform.flip(frame, True, False) for frame in self.frames]
-            self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.greeting_frames]
-            self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.sleeping_frames]
-            self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.feeding_frames]
-            self.image = self.frames[self.current_frame]
-            self.flipped = True  # Mark as flipped since we're now facing right
+    
+    def set_orientation(self, flipped):
+        """
+        Face right (flipped) or left. The frame lists below are the precomputed
+        clips for the current orientation, so turning allocates nothing.
+        """
+        self.flipped = flipped
+    
+    @property
+    def frames(self):
+        """Walking frames 0 and 1"""
+        return self.clips["walking"][self.flipped]
+    
+    @property
+    def greeting_frames(self):
+        """Frames 2 and 0 for greeting"""
+        return self.clips["greeting"][self.flipped]
+    
+    @property
+    def sleeping_frames(self):
+        """Frames 11 and 12 for sleeping"""
+        return self.clips["sleeping"][self.flipped]
+    
+    @property
+    def feeding_frames(self):
+        """Frames 5 and 6 for feeding"""
+        return self.clips["feeding"][self.flipped]
+    
+    def show_frame(self):
+        """Show the current clip frame, facing the current way"""
+        clip = STATE_CLIPS[self.state]
+        frames = self.clips[clip.sprites][self.flipped]
+        self.image = frames[clip.sequence[self.clip_step] % len(frames)]
+    
+    def set_state(self, state):
+        """
+        Switch to state: run the exit handler of the state being left, then
+        start the new state's clip (or keep it running when both share it)
+        """
+        previous = self.state
+        self.state = state
+        exit_handler = self.state_exits.get(previous)
+        if exit_handler is not None:
+            exit_handler(self)
+        if STATE_CLIPS[state] is not STATE_CLIPS[previous]:
+            self.clip_timer = 0
+            self.clip_step = 0
+        self.show_frame()
+    
+    def advance_clip(self):
+        """Advance the current state's clip one step; a finished one-shot clip moves on to its next state"""
+        clip = STATE_CLIPS[self.state]
+        self.clip_timer += 1
+        if self.clip_timer < clip.delay:
+            return
+        self.clip_timer = 0
+        if self.clip_step + 1 < len(clip.sequence):
+            self.clip_step += 1
+        elif clip.loop:
+            self.clip_step = 0
+        else:
+            self.set_state(clip.next_state)
+            return
+        self.show_frame()
+    
+    def release_assets(self):
+        """Give this Digimon's shared images back to the asset manager"""
+        self.assets.release()
     
     def start_greeting(self, face_direction=None, post_greeting_direction=None):
         """Start the greeting animation
@@ -872,16 +1079,12 @@ class Digimon:
             post_greeting_direction: 1 for right, -1 for left (direction to move after greeting)
         """
         # Don't start greeting if already engaged in other activities
-        if self.is_feeding or self.moving_to_food or self.is_sleeping or self.is_greeting:
+        if self.state != PetState.WALKING:
             return
-            
-        self.is_greeting = True
-        self.greeting_timer = 0
-        self.greeting_frame = 0
-        self.greeting_cycles = 0
+        
         # Stop moving while greeting
-        # If the Digimon was feeding (has original_speed stored), use that instead of current speed
-        if hasattr(self, 'original_speed') and self.speed == 0:
+        # If the Digimon was stopped for eating, restore its original speed afterwards instead
+        if self.speed == 0:
             self.speed_backup = self.original_speed
         else:
             self.speed_backup = self.speed
@@ -894,89 +1097,69 @@ class Digimon:
         if face_direction is not None:
             if face_direction == 1:  # Face right
                 if not self.flipped:
-                    self.frames = [pygame.transform.flip(frame, True, False) for frame in self.original_frames]
-                    self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_greeting_frames]
-                    self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_sleeping_frames]
-                    self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_feeding_frames]
-                    self.flipped = True
+                    self.set_orientation(True)
             else:  # Face left
                 if self.flipped:
-                    self.frames = self.original_frames.copy()
-                    self.greeting_frames = self.original_greeting_frames.copy()
-                    self.sleeping_frames = self.original_sleeping_frames.copy()
-                    self.feeding_frames = self.original_feeding_frames.copy()
-                    self.flipped = False
+                    self.set_orientation(False)
         
-        # Immediately set to first greeting frame to avoid any walking animation
-        self.image = self.greeting_frames[self.greeting_frame]
+        # Immediately show the first greeting frame to avoid any walking animation
+        self.set_state(PetState.GREETING)
     
     def wake_up(self):
         """Wake up the Digimon from sleep"""
-        if self.is_sleeping:
-            self.is_sleeping = False
-            self.sleeping_timer = 0
-            self.sleeping_frame = 0
-            
-            # Switch back to walking animation
-            self.current_frame = 0
-            
+        if self.state == PetState.SLEEPING:
             # Randomize direction when waking up
             self.direction = random.choice([-1, 1])
             
             # Set sprite orientation to match the direction
             if self.direction == 1:  # Moving right
                 # Flip sprites to face right
-                self.frames = [pygame.transform.flip(frame, True, False) for frame in self.original_frames]
-                self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_greeting_frames]
-                self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_sleeping_frames]
-                self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_feeding_frames]
-                self.flipped = True
+                self.set_orientation(True)
                 print(f"Digimon woke up and will walk right!")
             else:  # Moving left
                 # Use original sprites (facing left)
-                self.frames = self.original_frames.copy()
-                self.greeting_frames = self.original_greeting_frames.copy()
-                self.sleeping_frames = self.original_sleeping_frames.copy()
-                self.feeding_frames = self.original_feeding_frames.copy()
-                self.flipped = False
+                self.set_orientation(False)
                 print(f"Digimon woke up and will walk left!")
             
-            self.image = self.frames[self.current_frame]
+            self.set_state(PetState.WALKING)  # Walking animation from its first frame
             self.show_heart()  # Show heart when waking up
     
     def jump(self):
         """Make the Digimon jump (only if awake and not already jumping)"""
-        if not self.is_sleeping and not self.is_jumping and not self.is_greeting and not self.is_feeding and not self.moving_to_food:
+        if self.state == PetState.WALKING and not self.is_jumping:
             self.is_jumping = True
             self.jump_velocity = self.jump_strength
             self.show_heart()  # Show heart when jumping
             print(f"Digimon jumped!")
     
+    def ticks_until_animation_change(self):
+        """Return how many update() ticks until this Digimon looks different (1 unless asleep)"""
+        if self.state == PetState.SLEEPING and len(self.sleeping_frames) > 1:
+            return STATE_CLIPS[PetState.SLEEPING].delay - self.clip_timer
+        return 1
+    
     def show_heart(self):
         """Show heart emotion above Digimon's head"""
         if self.heart_image:
             self.heart_visible = True
-            self.heart_start_time = pygame.time.get_ticks()
+            self.heart_start_time = self.clock()
             self.heart_float_offset = 0
+            self.heart_keyframe = 0
             print("💖 Digimon shows love!")
     
     def feed(self, food_value=20):
         """Feed the Digimon - increases hunger, shows heart, and plays feeding animation"""
         self.hunger = min(100, self.hunger + food_value)
-        self.last_fed_time = pygame.time.get_ticks()
+        self.last_fed_time = self.clock()
         self.show_heart()
-        
-        # Start feeding animation
-        self.is_feeding = True
-        self.feeding_timer = 0
-        self.feeding_frame = 0
-        self.feeding_cycles = 0
-        
         print(f"Digimon fed! Hunger: {self.hunger}/100")
+        
+        # Play the feeding animation
+        self.start_eating()
     
     def move_to_food(self, food_item):
         """Make the Digimon move towards a food item"""
-        if not self.is_sleeping and not self.is_greeting and not self.is_feeding:
+        if self.state in (PetState.WALKING, PetState.MOVING_TO_FOOD):
             # Check if food is already claimed by another Digimon
             if food_item.claimed_by is not None and food_item.claimed_by != self:
                 print(f"Sushi already claimed by another Digimon!")
@@ -985,8 +1168,6 @@ class Digimon:
             # Claim the food for this Digimon
             food_item.claimed_by = self
             self.target_food = food_item
-            self.moving_to_food = True
-            self.eating_position_reached = False
             
             # Determine direction to face the food
             if food_item.rect.centerx > self.rect.centerx:
@@ -997,245 +1178,157 @@ class Digimon:
             # Update sprite direction immediately
             if self.direction == 1:  # Moving right
                 if not self.flipped:
-                    self.frames = [pygame.transform.flip(frame, True, False) for frame in self.original_frames]
-                    self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_greeting_frames]
-                    self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_sleeping_frames]
-                    self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_feeding_frames]
-                    self.flipped = True
+                    self.set_orientation(True)
             else:  # Moving left
                 if self.flipped:
-                    self.frames = self.original_frames.copy()
-                    self.greeting_frames = self.original_greeting_frames.copy()
-                    self.sleeping_frames = self.original_sleeping_frames.copy()
-                    self.feeding_frames = self.original_feeding_frames.copy()
-                    self.flipped = False
+                    self.set_orientation(False)
             
-            self.image = self.frames[self.current_frame]
+            self.set_state(PetState.MOVING_TO_FOOD)  # Keeps the walking animation going
             print(f"Digimon claimed and moving towards sushi at ({food_item.rect.centerx}, {food_item.rect.centery})")
             return True  # Successfully claimed the food
     
     def stop_moving_to_food(self):
         """Stop moving towards food and unclaim it"""
-        if self.target_food and self.moving_to_food:
+        if self.state == PetState.MOVING_TO_FOOD:
             # Unclaim the food so another Digimon can target it
-            if self.target_food.claimed_by == self:
+            if self.target_food and self.target_food.claimed_by == self:
                 self.target_food.claimed_by = None
                 print(f"Digimon unclaimed sushi (stopped moving)")
+            self.set_state(PetState.WALKING)
         
-        self.moving_to_food = False
         self.target_food = None
     
     def check_eating_position(self):
         """Check if Digimon is close enough to food to start eating"""
-        if self.target_food and self.moving_to_food:
+        if self.target_food and self.state == PetState.MOVING_TO_FOOD:
             # Safety check: verify target food is still valid
-            if self.target_food.consumed or not hasattr(self.target_food, 'rect'):
+            if self.target_food.consumed:
                 print("Target food became invalid during approach - stopping")
                 self.stop_moving_to_food()
                 return False
                 
             distance = abs(self.rect.centerx - self.target_food.rect.centerx)
             if distance <= 35:  # Close enough to eat (food is 30px wide + 5px margin)
-                self.eating_position_reached = True
-                self.moving_to_food = False
                 self.start_eating()
                 return True
         return False
     
     def start_eating(self):
         """Start the eating animation for two chews (5→6→5→6→5)"""
-        if not self.is_feeding:
-            self.is_feeding = True
-            self.feeding_timer = 0
-            self.feeding_frame = 0  # Start with frame 0 (5.png)
-            self.feeding_frame_count = 0  # Track total frame transitions
-            
+        if self.state != PetState.FEEDING:
             # Store original speed and stop moving while eating
             self.original_speed = self.speed
             self.speed = 0
             
+            self.set_state(PetState.FEEDING)  # Starts with frame 5.png
             print("Digimon started eating animation - will chew twice (56565 sequence)")
     
+    def finish_eating(self):
+        """Leaving FEEDING: the chews are done, so the food is eaten"""
+        print(f"Feeding completed! Two chews finished (56565 sequence)")
+        
+        # Restore original movement speed
+        self.speed = self.original_speed
+        
+        # Increase hunger when eating finishes
+        self.hunger = min(100, self.hunger + 20)
+        self.show_heart()
+        
+        # Mark food for removal
+        if self.target_food:
+            self.target_food.consumed = True
+            self.target_food = None
+        print("Eating completed! Sushi consumed. Resuming normal movement.")
+    
     def update(self):
+        """Advance the Digimon one simulation step"""
         # Update hunger system
         self.hunger_timer += 1
-        if self.hunger_timer >= 60:  # Every 6 seconds at 10 FPS
-            self.hunger = max(0, self.hunger - self.hunger_decrease_rate * 60)
+        if self.hunger_timer >= HUNGER_INTERVAL_STEPS:  # Every 6 seconds at 10 FPS
+            self.hunger = max(0, self.hunger - self.hunger_decrease_rate * HUNGER_INTERVAL_STEPS)
             self.hunger_timer = 0
             if self.hunger <= 0:
                 print(f"Digimon is very hungry!")
         
-        # Update heart emotion animation
         if self.heart_visible:
-            current_time = pygame.time.get_ticks()
-            elapsed_time = current_time - self.heart_start_time
-            
-            if elapsed_time >= HEART_DISPLAY_DURATION:
-                # Heart animation finished
-                self.heart_visible = False
-                self.heart_float_offset = 0
-            else:
-                # Update heart floating animation
-                self.heart_float_offset += HEART_FLOAT_SPEED
+            self.update_heart()
+        self.update_behavior()
+    
+    def update_heart(self):
+        """Update heart emotion animation (while heart_visible)"""
+        current_time = self.clock()
+        elapsed_time = current_time - self.heart_start_time
+        
+        if elapsed_time >= HEART_DISPLAY_DURATION:
+            # Heart animation finished
+            self.heart_visible = False
+            self.heart_float_offset = 0
+        else:
+            # Update heart floating animation and pick its fade/sway keyframe
+            self.heart_float_offset += HEART_FLOAT_SPEED
+            self.heart_keyframe = min(elapsed_time // HEART_KEYFRAME_MS, len(self.heart_keyframes) - 1)
+    
+    def update_behavior(self):
+        """Advance whatever the Digimon is doing: one dispatch to its state's handler"""
+        self.state_handlers[self.state](self)
+    
+    def update_jump(self):
+        """Handle jumping physics (while is_jumping)"""
+        self.jump_velocity += self.gravity
+        self.rect.y += self.jump_velocity
+        
+        # Check if landed back on ground
+        if self.rect.y >= self.ground_y:
+            self.rect.y = self.ground_y
+            self.is_jumping = False
+            self.jump_velocity = 0
+    
+    def update_greeting(self):
+        """Greeting: stand (or land) and play the greeting twice; the clip ends the state (finish_greeting)"""
+        if self.is_jumping:
+            self.update_jump()
+        self.advance_clip()
+    
+    def update_moving_to_food(self):
+        """Walking to claimed food, until close enough to eat or blocked by an edge"""
+        if self.is_jumping:
+            self.update_jump()
         
-        # Handle feeding animation
-        if self.is_feeding:
-            self.feeding_timer += 1
-            
-            # Animate feeding frames for two complete chews (5→6→5→6→5)
-            if len(self.feeding_frames) > 1 and self.feeding_timer % self.frame_delay == 0:
-                # Initialize frame counter if not exists
-                if not hasattr(self, 'feeding_frame_count'):
-                    self.feeding_frame_count = 0
-                
-                self.feeding_frame_count += 1
-                
-                # Define the chewing sequence: 5→6→5→6→5 (2 complete chews)
-                chew_sequence = [0, 1, 0, 1, 0]  # Frame indices (0=5.png, 1=6.png)
-                
-                if self.feeding_frame_count <= len(chew_sequence):
-                    # Set the frame according to the sequence
-                    self.feeding_frame = chew_sequence[self.feeding_frame_count - 1]
-                    self.image = self.feeding_frames[self.feeding_frame]
-                    print(f"Chew frame {self.feeding_frame_count}: {self.feeding_frame} ({'5.png' if self.feeding_frame == 0 else '6.png'})")                    # After completing the sequence (5 frames = 2 chews)
-                if self.feeding_frame_count >= len(chew_sequence):
-                    print(f"Feeding completed! Two chews finished (56565 sequence)")
-                    self.is_feeding = False
-                    self.feeding_timer = 0
-                    self.feeding_frame = 0
-                    self.feeding_frame_count = 0
-                    self.eating_position_reached = False
-                    
-                    # Restore original movement speed
-                    self.speed = self.original_speed
-                    
-                    # Increase hunger when eating finishes
-                    self.hunger = min(100, self.hunger + 20)
-                    self.show_heart()
-                    
-                    # Mark food for removal
-                    if self.target_food:
-                        self.target_food.consumed = True
-                        self.target_food = None
-                    
-                    # Return to normal walking frame
-                    self.current_frame = 0
-                    self.image = self.frames[self.current_frame]
-                    print("Eating completed! Sushi consumed. Resuming normal movement.")
-            
-            return  # Don't do normal updates while feeding
+        # Safety check: verify target food still exists and is valid
+        if self.target_food is None or self.target_food.consumed:
+            print("Target food became invalid - stopping movement")
+            self.stop_moving_to_food()
+            return
         
-        # Handle sleeping animation
-        if self.is_sleeping:
-            self.sleeping_timer += 1
-            
-            # Animate sleeping frames
-            if len(self.sleeping_frames) > 1 and self.sleeping_timer % self.frame_delay == 0:
-                self.sleeping_frame = (self.sleeping_frame + 1) % len(self.sleeping_frames)
-                self.image = self.sleeping_frames[self.sleeping_frame]
-            
-            return  # Don't do normal updates while sleeping
+        # Check if we've reached eating position
+        if self.check_eating_position():
+            return  # Start eating, don't continue with normal movement
+        
+        # Continue moving towards food with boundary checking
+        new_x = self.rect.x + self.speed * self.direction
+        
+        # Check boundaries before moving
+        if new_x < 0:
+            self.rect.x = 0
+            # Stop moving towards food if we hit a boundary
+            self.stop_moving_to_food()
+            self.direction = 1  # Face right
+        elif new_x + self.rect.width > SCREEN_WIDTH:
+            self.rect.x = SCREEN_WIDTH - self.rect.width
+            # Stop moving towards food if we hit a boundary
+            self.stop_moving_to_food()
+            self.direction = -1  # Face left
+        else:
+            self.rect.x = new_x
         
-        # Handle jumping physics
+        # Walking animation while moving to food
+        self.advance_clip()
+    
+    def update_walking(self):
+        """Walking around: random direction changes and bouncing off the screen edges"""
         if self.is_jumping:
-            self.jump_velocity += self.gravity
-            self.rect.y += self.jump_velocity
-            
-            # Check if landed back on ground
-            if self.rect.y >= self.ground_y:
-                self.rect.y = self.ground_y
-                self.is_jumping = False
-                self.jump_velocity = 0
-        
-        # Handle greeting animation
-        if self.is_greeting:
-            self.greeting_timer += 1
-            if self.greeting_timer >= self.frame_delay:
-                self.greeting_timer = 0
-                self.greeting_frame = (self.greeting_frame + 1) % len(self.greeting_frames)
-                self.image = self.greeting_frames[self.greeting_frame]
-                
-                # Check if we completed a full cycle (2 -> 0)
-                if self.greeting_frame == 0 and self.greeting_timer == 0:
-                    self.greeting_cycles += 1
-                    
-                # After 2 cycles, stop greeting
-                if self.greeting_cycles >= 2:
-                    self.is_greeting = False
-                    self.speed = self.speed_backup  # Restore movement
-                    # Switch to walking animation
-                    self.current_frame = 0
-                    
-                    # Apply post-greeting direction change if specified
-                    if self.post_greeting_direction is not None:
-                        self.direction = self.post_greeting_direction
-                        self.post_greeting_direction = None  # Clear it
-                    
-                    # Update sprite direction to match movement direction after greeting
-                    if self.direction == 1:  # Moving right
-                        if not self.flipped:
-                            self.frames = [pygame.transform.flip(frame, True, False) for frame in self.original_frames]
-                            self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_greeting_frames]
-                            self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_sleeping_frames]
-                            self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_feeding_frames]
-                            self.flipped = True
-                    else:  # Moving left
-                        if self.flipped:
-                            self.frames = self.original_frames.copy()
-                            self.greeting_frames = self.original_greeting_frames.copy()
-                            self.sleeping_frames = self.original_sleeping_frames.copy()
-                            self.feeding_frames = self.original_feeding_frames.copy()
-                            self.flipped = False
-                    
-                    self.image = self.frames[self.current_frame]
-            return  # Don't do normal updates while greeting
-        
-        # Handle movement towards food
-        if self.moving_to_food and self.target_food:
-            # Safety check: verify target food still exists and is valid
-            if self.target_food.consumed or not hasattr(self.target_food, 'rect'):
-                print("Target food became invalid - stopping movement")
-                self.stop_moving_to_food()
-                return
-            
-            # Check if we've reached eating position
-            if self.check_eating_position():
-                return  # Start eating, don't continue with normal movement
-            
-            # Continue moving towards food with boundary checking
-            new_x = self.rect.x + self.speed * self.direction
-            
-            # Check boundaries before moving
-            if new_x < 0:
-                self.rect.x = 0
-                # Stop moving towards food if we hit a boundary
-                self.stop_moving_to_food()
-                self.direction = 1  # Face right
-            elif new_x + self.rect.width > SCREEN_WIDTH:
-                self.rect.x = SCREEN_WIDTH - self.rect.width
-                # Stop moving towards food if we hit a boundary
-                self.stop_moving_to_food()
-                self.direction = -1  # Face left
-            else:
-                self.rect.x = new_x
-            
-            # Update walking animation while moving to food
-            if len(self.frames) > 1:
-                self.frame_timer += 1
-                if self.frame_timer >= self.frame_delay:
-                    self.frame_timer = 0
-                    self.current_frame = (self.current_frame + 1) % len(self.frames)
-                    self.image = self.frames[self.current_frame]
-            
-            return  # Don't do normal updates while moving to food
-        
-        # Update animation frame (normal walking)
-        if len(self.frames) > 1:
-            self.frame_timer += 1
-            if self.frame_timer >= self.frame_delay:
-                self.frame_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.frames)
-                self.image = self.frames[self.current_frame]
+            self.update_jump()
+        self.advance_clip()
         
         # Update direction timer for random direction changes
         self.direction_timer += 1
@@ -1244,25 +1337,7 @@ class Digimon:
         if self.direction_timer >= self.next_direction_change:
             self.direction *= -1  # Flip direction
             self.direction_timer = 0
-            self.next_direction_change = random.randint(60, 300)  # Next change in 1-5 seconds
-            
-            # Flip sprite to match new direction
-            if self.direction == 1:  # Moving right
-                if not self.flipped:
-                    self.frames = [pygame.transform.flip(frame, True, False) for frame in self.original_frames]
-                    self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_greeting_frames]
-                    self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_sleeping_frames]
-                    self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_feeding_frames]
-                    self.image = self.frames[self.current_frame]
-                    self.flipped = True
-            else:  # Moving left
-                if self.flipped:
-                    self.frames = self.original_frames.copy()
-                    self.greeting_frames = self.original_greeting_frames.copy()
-                    self.sleeping_frames = self.original_sleeping_frames.copy()
-                    self.feeding_frames = self.original_feeding_frames.copy()
-                    self.image = self.frames[self.current_frame]
-                    self.flipped = False
+            self.turned_around()
         
         # Move Digimon
         self.rect.x += self.speed * self.direction
@@ -1274,60 +1349,92 @@ class Digimon:
             self.direction = -1  # Always force left direction
             # Reset timer for more natural movement after hitting boundary
             self.direction_timer = 0
-            self.next_direction_change = random.randint(30, 120)
-            
-            # Always face left when hitting right boundary
-            self.frames = self.original_frames.copy()
-            self.greeting_frames = self.original_greeting_frames.copy()
-            self.sleeping_frames = self.original_sleeping_frames.copy()
-            self.feeding_frames = self.original_feeding_frames.copy()
-            self.image = self.frames[self.current_frame]
-            self.flipped = False
-            print("Hit right boundary - forced direction left")
+            self.bounced()
                 
         elif self.rect.left <= 0:
             self.rect.left = 1  # Clamp to boundary
             self.direction = 1  # Always force right direction
             # Reset timer for more natural movement after hitting boundary
             self.direction_timer = 0
-            self.next_direction_change = random.randint(30, 120)
-            
+            self.bounced()
+    
+    def finish_greeting(self):
+        """Leaving GREETING: walk on, in the post-greeting direction if one was given"""
+        self.speed = self.speed_backup  # Restore movement
+        
+        # Apply post-greeting direction change if specified
+        if self.post_greeting_direction is not None:
+            self.direction = self.post_greeting_direction
+            self.post_greeting_direction = None  # Clear it
+        
+        # Update sprite direction to match movement direction after greeting
+        if self.direction == 1:  # Moving right
+            if not self.flipped:
+                self.set_orientation(True)
+        else:  # Moving left
+            if self.flipped:
+                self.set_orientation(False)
+    
+    def turned_around(self):
+        """After a random direction change: schedule the next one and flip the sprite to match"""
+        self.next_direction_change = random.randint(60, 300)  # Next change in 1-5 seconds
+        if self.direction == 1:  # Moving right
+            if not self.flipped:
+                self.set_orientation(True)
+                self.show_frame()
+        else:  # Moving left
+            if self.flipped:
+                self.set_orientation(False)
+                self.show_frame()
+    
+    def bounced(self):
+        """After being turned around at a screen edge: change direction again sooner, face the new way"""
+        self.next_direction_change = random.randint(30, 120)
+        if self.direction == 1:
             # Always face right when hitting left boundary
-            self.frames = [pygame.transform.flip(frame, True, False) for frame in self.original_frames]
-            self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_greeting_frames]
-            self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_sleeping_frames]
-            self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_feeding_frames]
-            self.image = self.frames[self.current_frame]
-            self.flipped = True
+            self.set_orientation(True)
+            self.show_frame()
             print("Hit left boundary - forced direction right")
+        else:
+            # Always face left when hitting right boundary
+            self.set_orientation(False)
+            self.show_frame()
+            print("Hit right boundary - forced direction left")
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw the Digimon (and its heart) alpha of the way from its previous
+        step's position to its current one, and return the screen areas covered.
+        screen is the canvas Surface, or the TextureRenderer with texture_frames
+        """
         # Safety check: Ensure Digimon is always within screen bounds
         self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
         self.rect.y = max(0, min(self.rect.y, SCREEN_HEIGHT - self.rect.height))
         
-        screen.blit(self.image, self.rect)
+        draw_rect = self.rect.copy()
+        draw_rect.topleft = interpolate_position(self.previous_position, self.rect, alpha)
+        if self.frame_regions is not None:
+            # Texture backend: copy from the atlas sheet, mirrored on the way
+            source, area = self.frame_regions[self.image]
+            drawn_rects = [screen.copy(source, area, draw_rect, flip_x=self.flipped)]
+        else:
+            drawn_rects = [screen.blit(self.image, draw_rect)]
         
         # Draw heart emotion if active
-        if self.heart_visible and self.heart_image:
-            # Position heart 10 pixels above Digimon's head
-            heart_x = self.rect.centerx - self.heart_image.get_width() // 2
-            heart_y = self.rect.top - 20 - self.heart_float_offset
-            
-            # Add gentle swaying animation
-            sway_offset = int(2 * math.sin(pygame.time.get_ticks() * 0.005))
-            heart_x += sway_offset
+        if self.heart_visible and self.heart_keyframes:
+            # Pre-faded surface and sway offset for this point of the animation
+            heart_surface, sway_offset = self.heart_keyframes[self.heart_keyframe]
             
-            # Draw heart with slight transparency fade effect
-            elapsed_time = pygame.time.get_ticks() - self.heart_start_time
-            if elapsed_time > HEART_DISPLAY_DURATION * 0.7:  # Start fading in last 30% of duration
-                fade_progress = (elapsed_time - HEART_DISPLAY_DURATION * 0.7) / (HEART_DISPLAY_DURATION * 0.3)
-                alpha = int(255 * (1 - fade_progress))
-                heart_surface = self.heart_image.copy()
-                heart_surface.set_alpha(alpha)
-                screen.blit(heart_surface, (heart_x, heart_y))
-            else:
-                screen.blit(self.heart_image, (heart_x, heart_y))
+            # Position heart above Digimon's head
+            heart_x = draw_rect.centerx - heart_surface.get_width() // 2 + sway_offset
+            heart_y = draw_rect.top - 20 - self.heart_float_offset
+            drawn_rects.append(screen.blit(heart_surface, (heart_x, heart_y)))
+        
+        return drawn_rects
+    
+    def is_available(self):
+        """Awake and not busy greeting, eating or walking to food"""
+        return self.state == PetState.WALKING
     
     def check_collision(self, other_digimon):
         """Check if this Digimon collides with another Digimon"""
@@ -1343,23 +1450,65 @@ class Digimon:
         # Flip sprite to match new direction
         if self.direction == 1:  # Moving right
             if not self.flipped:
-                self.frames = [pygame.transform.flip(frame, True, False) for frame in self.original_frames]
-                self.greeting_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_greeting_frames]
-                self.sleeping_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_sleeping_frames]
-                self.feeding_frames = [pygame.transform.flip(frame, True, False) for frame in self.original_feeding_frames]
-                self.image = self.frames[self.current_frame]
-                self.flipped = True
+                self.set_orientation(True)
+                self.show_frame()
         else:  # Moving left
             if self.flipped:
-                self.frames = self.original_frames.copy()
-                self.greeting_frames = self.original_greeting_frames.copy()
-                self.sleeping_frames = self.original_sleeping_frames.copy()
-                self.feeding_frames = self.original_feeding_frames.copy()
-                self.image = self.frames[self.current_frame]
-                self.flipped = False
+                self.set_orientation(False)
+                self.show_frame()
+    
+    # State -> per-step handler, and the cleanup run when a state is left (see pet_states).
+    # Sleeping and feeding only play their clip; feeding's clip ends it (finish_eating)
+    state_handlers = {
+        PetState.SLEEPING: advance_clip,
+        PetState.WALKING: update_walking,
+        PetState.GREETING: update_greeting,
+        PetState.MOVING_TO_FOOD: update_moving_to_food,
+        PetState.FEEDING: advance_clip,
+    }
+    state_exits = {
+        PetState.GREETING: finish_greeting,
+        PetState.FEEDING: finish_eating,
+    }
+
+# Digimon whose per-step state lives in a SimulationCore's arrays (--sim-core)
+CoreDigimon = core_pet_class(Digimon)
 
 class VPetGame:
-    def __init__(self):
+    def __init__(self, headless=False, dirty_rects=False, idle_after=IDLE_AFTER_MS, render_fps=DEFAULT_RENDER_FPS,
+                 scale_mode="auto", window_size=None, renderer="surface", pet_count=DEFAULT_PET_COUNT,
+                 sim_core=False, max_food=MAX_FOOD_ITEMS):
+        # Headless games draw into an offscreen dummy display and run uncapped,
+        # for simulations, benchmarks and tests on machines without a screen
+        self.headless = headless
+        
+        # Idle mode (see is_idle) after idle_after ms without input; None or 0 disables it
+        self.idle_after = idle_after
+        self.idle = False
+        
+        # The pets (see initialize_digimon): pet_count Digimon, topped up with random
+        # ones when the selection is shorter. pet_order indexes pets sorted by x
+        self.pet_count = pet_count
+        self.pets = []
+        self.pet_names = []  # Digimon folder names, parallel to pets
+        self.pet_order = []
+        self.greeting_cooldowns = PairCooldowns(0)
+        self.simulation_steps = 0  # update() calls that ran the world, for cooldowns and the simulation clock
+        
+        # Optional NumPy core stepping pets as arrays (see sim_core)
+        if sim_core and not numpy_available():
+            print("NumPy is not installed - stepping pets one by one")
+        self.use_sim_core = sim_core and numpy_available()
+        self.sim_core = None
+        
+        # Dirty-rect rendering: only the areas pets and food covered last frame
+        # and this frame are restored and pushed to the display
+        self.dirty_rects = dirty_rects
+        self.previous_rects = []  # Screen areas drawn last frame
+        self.needs_full_redraw = True  # Background changed or an overlay covered the screen
+        init_pygame(headless)
+        mark_startup("pygame.init")
+        
         # Check if running on Raspberry Pi
         self.is_raspberry_pi_device = self.is_raspberry_pi()
         
@@ -1367,17 +1516,31 @@ class VPetGame:
         pygame.mouse.set_visible(True)
         print("Mouse cursor visible - will auto-hide after 2 seconds of inactivity")
         
-        if self.is_raspberry_pi_device:
-            # Force fullscreen mode on Raspberry Pi
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.NOFRAME)
-            print("Running on Raspberry Pi - using fullscreen mode")
+        # self.screen is the canvas everything draws into, self.display the real output.
+        # The texture backend draws with self.renderer instead (see open_texture_renderer)
+        self.renderer = None
+        if renderer == "texture" and not texture_backend_available():
+            print("pygame._sdl2.video is not available - using the surface renderer")
+            renderer = "surface"
+        if renderer == "texture":
+            self.open_texture_renderer(window_size)
         else:
-            # Set up a windowed mode for desktop testing
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-            print("Running on desktop - using windowed mode")
+            self.set_display_mode(scale_mode, window_size)
+        if headless:
+            print("Running headless - drawing offscreen")
+        elif self.is_raspberry_pi_device:
+            print(f"Running on Raspberry Pi - using fullscreen mode (scale: {self.scale_mode})")
+        else:
+            print(f"Running on desktop - using windowed mode (scale: {self.scale_mode})")
             
         pygame.display.set_caption("Vpet")
         self.clock = pygame.time.Clock()
+        self.frame_rate = 0 if headless else render_fps  # Render rate, 0 = as fast as possible
+        # Fixed-timestep simulation: real time is banked here and spent in
+        # SIMULATION_STEP_MS steps (headless games take one step per frame)
+        self.accumulator = 0
+        self.last_step_time = 0
+        mark_startup("set_mode")
         
         # Set up asset paths - use file location for reliable path detection
         # Get the directory where main.py is located (src folder)
@@ -1393,34 +1556,57 @@ class VPetGame:
         self.background_dir = os.path.join(assets_dir, "background")
         food_dir = os.path.join(assets_dir, "food")
         
-        # Load food assets
-        self.sushi_image = None
-        sushi_path = os.path.join(food_dir, "sushi.png")
-        try:
-            if os.path.exists(sushi_path):
-                self.sushi_image = pygame.image.load(sushi_path)
-                print(f"Loaded sushi image: {sushi_path}")
-            else:
-                print(f"Sushi image not found: {sushi_path}")
-        except Exception as e:
-            print(f"Could not load sushi image: {e}")
+        # Decode startup assets on worker threads; Surfaces are still created on
+        # this thread when each phase below asks for its images
+        self.asset_loader = AssetLoader()
+        self.asset_loader.activate()
+        
+        with self.asset_loader.phase("scan sprites"):
+            # Initialize selection file path and available Digimon
+            self.selection_file = os.path.join(project_root, "digimon_selection.json")
+            self.sprites_dir = sprites_dir
+            self.available_digimon = self.get_available_digimon(sprites_dir)
+            print(f"Found {len(self.available_digimon)} available Digimon")
+            # Ensure selection file exists before loading
+            ensure_initial_selection(self.selection_file, self.sprites_dir)
+            
+            # Set up background cycling - only the current background is decoded now,
+            # the rest are decoded on demand and kept in a small LRU cache
+            self.current_background_index = 0
+            self.load_backgrounds()
         
-        # Food management
-        self.food_items = []  # List to store dropped food items
+        self.prefetch_startup_assets(food_dir)
         
-        # Load all background images and set up cycling
-        self.background_files = []
-        self.current_background_index = 0
-        self.backgrounds = []
-        self.load_all_backgrounds()
+        # Images the game itself holds on to, shared through the asset manager
+        self.assets = get_asset_manager().scope()
         
-        # Set initial background
-        if self.backgrounds:
-            self.background = self.backgrounds[0]
-        else:
-            # Fallback to solid color background
-            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.background.fill(BACKGROUND_COLOR)
+        with self.asset_loader.phase("food"):
+            # Load food assets (sushi_image and food_image share one surface)
+            self.sushi_image = None
+            self.food_image = None
+            sushi_path = os.path.join(food_dir, "sushi.png")
+            try:
+                if os.path.exists(sushi_path):
+                    self.sushi_image = self.assets.get(sushi_path, RLE_TRANSFORM)
+                    self.food_image = self.assets.get(sushi_path, RLE_TRANSFORM)
+                    print(f"Loaded sushi image: {sushi_path}")
+                else:
+                    print(f"Sushi image not found: {sushi_path}")
+            except Exception as e:
+                print(f"Could not load sushi image: {e}")
+        
+        # Food management: up to max_food pieces on screen, reusing records
+        self.food_items = FoodPool(self.sushi_image, max_food if self.sushi_image else 0)
+        
+        with self.asset_loader.phase("backgrounds"):
+            # Set initial background
+            initial_background = self.get_initial_background()
+            if initial_background is not None:
+                self.background = initial_background
+            else:
+                # Fallback to solid color background
+                self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+                self.background.fill(BACKGROUND_COLOR)
         
         # Double-tap detection for background changing
         self.last_tap_time = 0
@@ -1430,50 +1616,165 @@ class VPetGame:
         self.last_mouse_move_time = pygame.time.get_ticks()
         self.mouse_hide_delay = 1000  # 1s in milliseconds
         self.cursor_visible = True  # Always start with cursor visible on all platforms
-        self.last_mouse_pos = pygame.mouse.get_pos()
+        self.last_mouse_pos = self.get_mouse_pos()
+        self.last_input_time = pygame.time.get_ticks()  # For idle mode
         
         # Swipe gesture detection
         self.swipe_start_pos = None
         self.swipe_start_time = 0
         self.is_tracking_swipe = False
         
-        # Initialize selection file path and available Digimon
-        self.selection_file = os.path.join(project_root, "digimon_selection.json")
-        self.sprites_dir = sprites_dir
-        self.available_digimon = self.get_available_digimon(sprites_dir)
-        print(f"Found {len(self.available_digimon)} available Digimon")
-        # Ensure selection file exists before loading
-        ensure_initial_selection(self.selection_file, self.sprites_dir)
-        # Initialize selection UI
-        self.selection_ui = DigimonSelectionUI(self.screen, self.available_digimon, sprites_dir, self.digimon_paths)
-        
-        # Initialize Digimon with saved or random selection (with error handling)
-        try:
-            self.initialize_digimon()
-            print(f"Game started with {self.digimon1_name} and {self.digimon2_name}!")
-        except Exception as e:
-            print(f"Error initializing Digimon: {e}")
-            # Create fallback values
-            self.digimon1 = None
-            self.digimon2 = None
-            self.digimon1_name = "Default1"
-            self.digimon2_name = "Default2"
-            print("Using fallback Digimon names")
-        
-        # Load sushi food image  
+        with self.asset_loader.phase("selection ui"):
+            # Initialize selection UI
+            self.selection_ui = DigimonSelectionUI(self.screen, self.available_digimon, sprites_dir, self.digimon_paths, self.asset_loader)
+            
+            # Performance overlay (F3 or swipe left)
+            self.perf_hud = PerfHUD(pygame.font.Font(None, 18))
+        
+        with self.asset_loader.phase("digimon"):
+            # Initialize Digimon with saved or random selection (with error handling)
+            try:
+                self.initialize_digimon()
+                print(f"Game started with {', '.join(name.replace('_dmc', '') for name in self.pet_names)}!")
+            except Exception as e:
+                print(f"Error initializing Digimon: {e}")
+                # Run with an empty world rather than not at all
+                self.pets = []
+                self.pet_names = []
+                self.pet_order = []
+                print("Starting without Digimon")
+        
+        # Startup is done: drop unused prefetches and show where the time went. The
+        # workers stay up to decode selection previews while the UI is open
+        self.asset_loader.deactivate()
+        self.asset_loader.report()
+        
+        self.running = True
+    
+    def prefetch_startup_assets(self, food_dir):
+        """Queue every image startup will need on the asset loader's worker pool, in the order it is used"""
+        # The initial background is the largest decode, start it first
+        if len(self.background_store):
+            self.background_store.prefetch(0, self.asset_loader)
+        
         sushi_path = os.path.join(food_dir, "sushi.png")
+        paths = [sushi_path] if os.path.exists(sushi_path) else []
         
-        try:
-            if os.path.exists(sushi_path):
-                self.food_image = pygame.image.load(sushi_path)
-                print(f"Loaded sushi image: {sushi_path}")
+        # Frames of the saved pets (selection previews are loaded when the UI opens)
+        catalog = load_catalog(self.sprites_dir)
+        saved_selection = self.load_selection() or []
+        for digimon_name in saved_selection:
+            frame_nums = [frame_num for frame_num in DIGIMON_FRAME_NUMBERS if frame_num in catalog.frames(digimon_name)]
+            paths.extend(sprite_frame_paths(self.digimon_paths[digimon_name], frame_nums))
+        
+        self.asset_loader.prefetch_images(paths)
+    
+    def set_display_mode(self, scale_mode="auto", window_size=None):
+        """
+        Open the display. The game always draws into a SCREEN_WIDTH x SCREEN_HEIGHT
+        canvas (self.screen); scale_mode decides how it reaches the display:
+            "none"     the canvas is the display surface
+            "scaled"   pygame.SCALED, SDL scales the canvas to fit and maps input
+            "integer"  one nearest-neighbour scale by the largest whole factor that
+                       fits, centered with letterbox bars (crisp pixels)
+            "auto"     fullscreen on a Raspberry Pi: integer when 2x or more fits,
+                       otherwise scaled; a plain window everywhere else
+        window_size sets the window size in integer mode (default: twice the
+        canvas in a window, the whole screen when fullscreen).
+        """
+        canvas_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        fullscreen = self.is_raspberry_pi_device and not self.headless
+        flags = pygame.FULLSCREEN | pygame.NOFRAME if fullscreen else 0
+        
+        if scale_mode == "auto":
+            scale_mode = "none"
+            if fullscreen:
+                desktop_size = pygame.display.get_desktop_sizes()[0]
+                if desktop_size != canvas_size:
+                    factor = min(desktop_size[0] // SCREEN_WIDTH, desktop_size[1] // SCREEN_HEIGHT)
+                    scale_mode = "integer" if factor >= 2 else "scaled"
+        self.scale_mode = scale_mode
+        
+        self.present_scale = 1
+        self.present_rect = pygame.Rect((0, 0), canvas_size)  # Where the canvas lands on the display
+        self.letterbox_pending = False
+        if scale_mode == "integer":
+            if window_size is None:
+                window_size = (0, 0) if fullscreen else (SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2)
+            self.display = pygame.display.set_mode(window_size, flags)
+            display_width, display_height = self.display.get_size()
+            self.present_scale = max(1, min(display_width // SCREEN_WIDTH, display_height // SCREEN_HEIGHT))
+            self.present_rect.size = (SCREEN_WIDTH * self.present_scale, SCREEN_HEIGHT * self.present_scale)
+            self.present_rect.center = self.display.get_rect().center
+            self.present_surface = self.display.subsurface(self.present_rect)
+            self.screen = pygame.Surface(canvas_size).convert()  # Same pixel format as the display
+            self.letterbox_pending = True  # Bars are painted with the first frame
+        else:
+            if scale_mode == "scaled":
+                flags |= pygame.SCALED
+            self.display = pygame.display.set_mode(canvas_size, flags)
+            self.screen = self.display
+    
+    def open_texture_renderer(self, window_size=None):
+        """
+        Open a window drawn by the SDL2 texture backend (see texture_renderer).
+        SDL scales the canvas to the window (window_size, default the canvas
+        size, the whole screen on a Pi); self.screen becomes a transparent
+        overlay canvas for the selection UI and performance HUD.
+        """
+        fullscreen = self.is_raspberry_pi_device and not self.headless
+        self.renderer = TextureRenderer("Vpet", (SCREEN_WIDTH, SCREEN_HEIGHT), window_size, fullscreen,
+                                        software=self.headless)
+        self.scale_mode = "texture"
+        self.display = None
+        self.present_rect, self.present_scale = self.renderer.present_rect()
+        self.letterbox_pending = False
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    
+    def present(self, rects=None):
+        """Show the canvas: the whole frame, or only the given canvas areas"""
+        if self.screen is self.display:
+            if rects is None:
+                pygame.display.flip()
             else:
-                print(f"Sushi image not found: {sushi_path}")
-        except Exception as e:
-            print(f"Could not load sushi image: {e}")
-            self.food_image = None
+                pygame.display.update(rects)
+            return
         
-        self.running = True
+        if self.letterbox_pending:
+            self.display.fill(LETTERBOX_COLOR)
+            self.letterbox_pending = False
+            rects = None
+        
+        # Integer scaling: one nearest-neighbour scale straight into the display
+        scale = self.present_scale
+        if rects is None:
+            pygame.transform.scale(self.screen, self.present_rect.size, self.present_surface)
+            pygame.display.flip()
+            return
+        
+        display_rects = []
+        canvas_rect = self.screen.get_rect()
+        for rect in rects:
+            rect = rect.clip(canvas_rect)
+            if not rect:
+                continue
+            target = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+            pygame.transform.scale(self.screen.subsurface(rect), target.size, self.present_surface.subsurface(target))
+            display_rects.append(target.move(self.present_rect.topleft))
+        pygame.display.update(display_rects)
+    
+    def canvas_position(self, display_pos):
+        """Map a display position to canvas coordinates (SDL already does this for SCALED)"""
+        if self.screen is self.display:
+            return display_pos
+        # The texture backend's scale can be fractional
+        x = int((display_pos[0] - self.present_rect.x) // self.present_scale)
+        y = int((display_pos[1] - self.present_rect.y) // self.present_scale)
+        return (max(0, min(x, SCREEN_WIDTH - 1)), max(0, min(y, SCREEN_HEIGHT - 1)))
+    
+    def get_mouse_pos(self):
+        """Mouse position on the canvas"""
+        return self.canvas_position(pygame.mouse.get_pos())
     
     def is_raspberry_pi(self):
         """Check if running on a Raspberry Pi"""
@@ -1485,39 +1786,12 @@ class VPetGame:
     
     def get_available_digimon(self, sprites_dir):
         """Get list of available Digimon from sprites directory and subdirectories"""
-        available_digimon = []
-        digimon_paths = {}  # Store the full path for each Digimon
-        
-        if os.path.exists(sprites_dir):
-            # First check direct children of sprites directory
-            for folder in os.listdir(sprites_dir):
-                folder_path = os.path.join(sprites_dir, folder)
-                if folder.endswith("_dmc") and os.path.isdir(folder_path):
-                    # Check if the folder has required sprite files
-                    if (os.path.exists(os.path.join(folder_path, "0.png")) and 
-                        os.path.exists(os.path.join(folder_path, "1.png"))):
-                        if folder not in available_digimon:  # Avoid duplicates
-                            available_digimon.append(folder)
-                        digimon_paths[folder] = folder_path
-                elif os.path.isdir(folder_path):
-                    # Check subdirectories (like "Digimon Color Ver. 1")
-                    for subfolder in os.listdir(folder_path):
-                        if subfolder.endswith("_dmc"):
-                            subfolder_path = os.path.join(folder_path, subfolder)
-                            if os.path.isdir(subfolder_path):
-                                # Check if the folder has required sprite files
-                                if (os.path.exists(os.path.join(subfolder_path, "0.png")) and 
-                                    os.path.exists(os.path.join(subfolder_path, "1.png"))):
-                                    if subfolder not in available_digimon:  # Avoid duplicates
-                                        available_digimon.append(subfolder)
-                                    # Keep the path mapping (later paths will overwrite earlier ones)
-                                    digimon_paths[subfolder] = subfolder_path
-        
-        # Sort for consistent ordering
-        available_digimon.sort()
+        # The shared sprite catalog walks the tree once and caches it on disk
+        catalog = load_catalog(sprites_dir)
+        available_digimon = catalog.available_digimon()
         
         # Store the paths mapping for later use
-        self.digimon_paths = digimon_paths
+        self.digimon_paths = catalog.paths(available_digimon)
         
         return available_digimon
     
@@ -1534,7 +1808,7 @@ class VPetGame:
                         if digimon in self.available_digimon:
                             valid_selection.append(digimon)
                     
-                    if len(valid_selection) == 2:
+                    if valid_selection:
                         print(f"Loaded selection: {[name.replace('_dmc', '') for name in valid_selection]}")
                         return valid_selection
                     else:
@@ -1567,10 +1841,13 @@ class VPetGame:
             print(f"Error saving selection: {e}")
     
     def initialize_digimon(self, selected_digimon=None):
-        """Initialize the two Digimon based on selection or random choice"""
-        if selected_digimon and len(selected_digimon) == 2:
+        """
+        Create the pets: the given selection, else the saved one, else a random
+        pair, topped up with random Digimon (or cut) to self.pet_count
+        """
+        if selected_digimon:
             # Use provided selection
-            digimon_names = selected_digimon
+            digimon_names = list(selected_digimon)
             print(f"Using selected Digimon: {[name.replace('_dmc', '') for name in digimon_names]}")
         else:
             # Load saved selection or use random
@@ -1579,155 +1856,87 @@ class VPetGame:
                 digimon_names = saved_selection
                 print(f"Loaded saved selection: {[name.replace('_dmc', '') for name in digimon_names]}")
             else:
-                # Random selection as fallback (prefer 2 Digimon)
-                if len(self.available_digimon) >= 2:
-                    digimon_names = random.sample(self.available_digimon, 2)
-                    print(f"Using random selection: {[name.replace('_dmc', '') for name in digimon_names]}")
+                digimon_names = random.sample(self.available_digimon, min(2, len(self.available_digimon)))
+                print(f"Using random selection: {[name.replace('_dmc', '') for name in digimon_names]}")
+        
+        # Parks with more pets than were selected get random extra Digimon
+        digimon_names = digimon_names[:self.pet_count]
+        while self.available_digimon and len(digimon_names) < self.pet_count:
+            digimon_names.append(random.choice(self.available_digimon))
+        
+        # Pets being replaced keep their images until the new ones are loaded,
+        # so assets both share (the heart, common frames) are not reloaded
+        old_digimon = self.pets
+        
+        self.pets = []
+        self.pet_names = []
+        if self.use_sim_core:
+            self.sim_core = SimulationCore(len(digimon_names), SCREEN_WIDTH, HUNGER_INTERVAL_STEPS,
+                                           HEART_DISPLAY_DURATION, HEART_FLOAT_SPEED, HEART_KEYFRAME_MS)
+        for digimon_name in digimon_names:
+            if digimon_name not in self.digimon_paths:
+                print(f"Warning: Path not found for {digimon_name}")
+                continue
+            try:
+                folder = self.digimon_paths[digimon_name]
+                if self.sim_core is not None:
+                    digimon = CoreDigimon(self.sim_core, folder, speed=2, texture_frames=self.renderer is not None)
                 else:
-                    # Ultimate fallback - ensure these exist in available list
-                    fallback_names = ["Agumon_dmc", "Gabumon_dmc"]
-                    digimon_names = []
-                    for name in fallback_names:
-                        if name in self.available_digimon:
-                            digimon_names.append(name)
-                    
-                    # If fallbacks don't exist, use first two available
-                    if len(digimon_names) < 2 and len(self.available_digimon) >= 2:
-                        digimon_names = self.available_digimon[:2]
-                    elif len(digimon_names) < 2:
-                        # Last resort - use any available or create defaults
-                        if len(self.available_digimon) >= 1:
-                            digimon_names = [self.available_digimon[0], self.available_digimon[0]]
-                        else:
-                            digimon_names = ["Agumon_dmc", "Gabumon_dmc"]
-                    elif len(digimon_names) < 1:
-                        # Last resort - create defaults
-                        digimon_names = ["Agumon_dmc", "Gabumon_dmc"]
-                    
-                    print(f"Using fallback selection: {[name.replace('_dmc', '') for name in digimon_names]}")
+                    digimon = Digimon(folder, speed=2, texture_frames=self.renderer is not None)
+                digimon.clock = self.simulation_time
+                self.pets.append(digimon)
+                self.pet_names.append(digimon_name)
+            except Exception as e:
+                print(f"Error creating {digimon_name}: {e}")
         
-        # Validate that sprite folders exist before creating Digimon
-        try:
-            # Create first Digimon
-            if digimon_names[0] in self.digimon_paths:
-                digimon1_folder = self.digimon_paths[digimon_names[0]]
-            else:
-                print(f"Warning: Path not found for {digimon_names[0]}")
-                # Use first available Digimon instead
-                if self.available_digimon:
-                    digimon_names[0] = self.available_digimon[0]
-                    digimon1_folder = self.digimon_paths[digimon_names[0]]
-                else:
-                    raise Exception("No available Digimon sprites found")
-            
-            self.digimon1 = Digimon(digimon1_folder, speed=2)
-            self.digimon1_name = digimon_names[0].replace("_dmc", "")
-            
-            # Create second Digimon
-            if digimon_names[1] in self.digimon_paths:
-                digimon2_folder = self.digimon_paths[digimon_names[1]]
-            else:
-                print(f"Warning: Path not found for {digimon_names[1]}")
-                # Use second available Digimon instead, or first if only one available
-                if len(self.available_digimon) >= 2:
-                    digimon_names[1] = self.available_digimon[1]
-                elif len(self.available_digimon) >= 1:
-                    digimon_names[1] = self.available_digimon[0]
-                else:
-                    raise Exception("No available Digimon sprites found")
-                digimon2_folder = self.digimon_paths[digimon_names[1]]
-            
-            self.digimon2 = Digimon(digimon2_folder, speed=2)
-            self.digimon2_name = digimon_names[1].replace("_dmc", "")
-            
-        except Exception as e:
-            print(f"Error creating Digimon objects: {e}")
-            # Last resort fallback - create simple colored rectangles if sprite loading fails
-            print("Creating fallback Digimon...")
-            self.digimon1 = None
-            self.digimon2 = None
-            self.digimon1_name = "Default1"
-            self.digimon2_name = "Default2"
+        for digimon in old_digimon:
+            digimon.release_assets()
+        asset_stats = get_asset_manager().stats()
+        print(f"Asset manager: {asset_stats['hits']} hits, {asset_stats['misses']} misses, {asset_stats['surfaces']} surfaces")
         
         # Randomize starting positions ensuring they don't start side by side
-        min_distance = 100  # Minimum distance between them
-        max_attempts = 10  # Prevent infinite loop
-        
-        for attempt in range(max_attempts):
-            # Random positions within screen bounds (accounting for sprite size)
-            digimon1_x = random.randint(0, SCREEN_WIDTH - 60)
-            digimon2_x = random.randint(0, SCREEN_WIDTH - 60)
-            
-            # Check if they're far enough apart
-            if abs(digimon1_x - digimon2_x) >= min_distance:
-                break
-            
-            # If this is the last attempt, force them apart
-            if attempt == max_attempts - 1:
-                digimon1_x = random.randint(0, SCREEN_WIDTH // 2 - 60)
-                digimon2_x = random.randint(SCREEN_WIDTH // 2 + min_distance, SCREEN_WIDTH - 60)
-        
-        # Set the randomized positions
-        self.digimon1.rect.x = digimon1_x
-        self.digimon2.rect.x = digimon2_x
-        
-        # Randomize initial directions
-        self.digimon1.direction = random.choice([-1, 1])
-        self.digimon2.direction = random.choice([-1, 1])
-        
-        # Set proper sprite directions to match movement
-        # Digimon1 sprite direction
-
-        if self.digimon1.direction == -1:  # Moving left
-            if self.digimon1.flipped:
-                self.digimon1.frames = self.digimon1.original_frames.copy()
-                self.digimon1.greeting_frames = self.digimon1.original_greeting_frames.copy()
-                self.digimon1.image = self.digimon1.frames[self.digimon1.current_frame]
-                self.digimon1.flipped = False
-        
-        # Digimon2 sprite direction  
-        if self.digimon2.direction == -1:  # Moving left
-            if self.digimon2.flipped:
-                self.digimon2.frames = self.digimon2.original_frames.copy()
-                self.digimon2.greeting_frames = self.digimon2.original_greeting_frames.copy()
-                self.digimon2.image = self.digimon2.frames[self.digimon2.current_frame]
-                self.digimon2.flipped = False
-                
-    def load_all_backgrounds(self):
+        positions = spread_positions(len(self.pets), SCREEN_WIDTH - 60, SPAWN_DISTANCE)
+        for digimon, x in zip(self.pets, positions):
+            digimon.rect.x = x
+            # Randomize initial direction and turn the sprite to match (sprites start facing left)
+            digimon.direction = random.choice([-1, 1])
+            if digimon.direction == -1 and digimon.flipped:
+                digimon.set_orientation(False)
+                digimon.show_frame()
+        
+        self.pet_order = list(range(len(self.pets)))
+        sort_by_x(self.pet_order, self.pets)
+        self.greeting_cooldowns = PairCooldowns(len(self.pets))
+    
+    def pet_at(self, pos):
+        """Return the index of the pet under a canvas position, or None"""
+        sort_by_x(self.pet_order, self.pets)
+        return hit_test(self.pet_order, self.pets, pos)
+    
+    def load_backgrounds(self):
         """
-        Load all background images from the background directory.
+        Set up the background store. Backgrounds are decoded on demand,
+        so this only lists the files in the background directory.
         """
-        try:
-            # Get list of background files
-            if os.path.exists(self.background_dir):
-                self.background_files = [f for f in os.listdir(self.background_dir) 
-                                      if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif'))]
-                
-                # Sort the files for consistent order
-                self.background_files.sort()
-                
-                if self.background_files:
-                    # Load all backgrounds
-                    for bg_file in self.background_files:
-                        bg_path = os.path.join(self.background_dir, bg_file)
-                        
-                        try:
-                            # Load and scale the background
-                            background = pygame.image.load(bg_path)
-                            background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                            self.backgrounds.append(background)
-                            print(f"Loaded background: {bg_file}")
-                        except Exception as e:
-                            print(f"Error loading background {bg_file}: {e}")
-                    
-                    print(f"Loaded {len(self.backgrounds)} backgrounds total")
-                else:
-                    print("No background images found in background directory")
-            else:
-                print(f"Background directory not found: {self.background_dir}")
-                
-        except Exception as e:
-            print(f"Error loading backgrounds: {e}")
+        self.background_store = BackgroundStore(self.background_dir, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                cache_size=BACKGROUND_CACHE_SIZE)
+        self.background_files = self.background_store.files
+        
+        if self.background_files:
+            print(f"Found {len(self.background_files)} backgrounds (caching up to {BACKGROUND_CACHE_SIZE})")
+        elif os.path.exists(self.background_dir):
+            print("No background images found in background directory")
+        else:
+            print(f"Background directory not found: {self.background_dir}")
+    
+    def get_initial_background(self):
+        """Decode the first background that loads successfully, or None"""
+        for index in range(len(self.background_store)):
+            background = self.background_store.get(index)
+            if background is not None:
+                self.current_background_index = index
+                return background
+        return None
     
     def load_random_background(self, background_dir):
         """
@@ -1737,8 +1946,7 @@ class VPetGame:
         try:
             # Get list of background files
             if os.path.exists(background_dir):
-                background_files = [f for f in os.listdir(background_dir) 
-                                  if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif'))]
+                background_files = list_background_files(background_dir)
                 
                 if background_files:
                     # Randomly select a background
@@ -1746,8 +1954,7 @@ class VPetGame:
                     bg_path = os.path.join(background_dir, selected_bg)
                     
                     # Load and scale the background
-                    background = pygame.image.load(bg_path)
-                    background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                    background = load_scaled_background(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
                     print(f"Loaded random background: {selected_bg}")
                     return background
                 else:
@@ -1767,42 +1974,43 @@ class VPetGame:
     def change_background(self, direction=1):
         """
         Cycle to the next or previous background image.
+        The target background is decoded on demand if it is not in the cache.
         Args:
             direction: 1 for next background, -1 for previous background
         """
-        if self.backgrounds:
-            if direction == 1:
-                # Move to next background (cycle back to 0 if at end)
-                self.current_background_index = (self.current_background_index + 1) % len(self.backgrounds)
-                direction_text = "Next"
-            else:
-                # Move to previous background (cycle to end if at 0)
-                self.current_background_index = (self.current_background_index - 1) % len(self.backgrounds)
-                direction_text = "Previous"
+        background_count = len(self.background_store)
+        if background_count:
+            step = 1 if direction == 1 else -1
+            direction_text = "Next" if direction == 1 else "Previous"
             
-            self.background = self.backgrounds[self.current_background_index]
+            # Skip over files that fail to decode
+            for _ in range(background_count):
+                self.current_background_index = (self.current_background_index + step) % background_count
+                background = self.background_store.get(self.current_background_index)
+                if background is not None:
+                    self.background = background
+                    self.needs_full_redraw = True
+                    break
             
             # Get the filename for display
-            if self.current_background_index < len(self.background_files):
-                current_bg_name = self.background_files[self.current_background_index]
-                print(f"{direction_text} background: {current_bg_name} ({self.current_background_index + 1}/{len(self.backgrounds)})")
-            else:
-                print(f"{direction_text} background: {self.current_background_index + 1}/{len(self.backgrounds)}")
+            current_bg_name = self.background_files[self.current_background_index]
+            print(f"{direction_text} background: {current_bg_name} ({self.current_background_index + 1}/{background_count})")
         else:
             print("No backgrounds available to cycle through")
     
     def drop_food(self, x, y):
         """Drop a piece of sushi at the specified coordinates"""
         if self.sushi_image:
-            food = Food(x, y, self.sushi_image)
-            self.food_items.append(food)
-            print(f"Dropped sushi at ({x}, {y})")
+            if self.food_items.drop(x, y, self.simulation_time()) is not None:
+                print(f"Dropped sushi at ({x}, {y})")
+            else:
+                print(f"Food limit reached ({len(self.food_items)} on screen)")
         else:
             print("No sushi image available to drop!")
     
     def handle_events(self):
         current_time = pygame.time.get_ticks()
-        current_mouse_pos = pygame.mouse.get_pos()
+        current_mouse_pos = self.get_mouse_pos()
         
         # Check for mouse movement to show/hide cursor
         if current_mouse_pos != self.last_mouse_pos:
@@ -1821,14 +2029,22 @@ class VPetGame:
                 self.cursor_visible = False
         
         for event in pygame.event.get():
+            if event.type in INPUT_EVENTS:
+                self.last_input_time = current_time
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F3:
+                    self.perf_hud.toggle()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window contents were lost, repaint everything
+                self.needs_full_redraw = True
+                self.letterbox_pending = self.screen is not self.display
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = self.get_mouse_pos()
                     current_time = pygame.time.get_ticks()
                     
                     # If selection UI is active, handle its events
@@ -1868,36 +2084,25 @@ class VPetGame:
                             self.last_tap_time = current_time
                     else:
                         # Lower half - check for Digimon interaction or food dropping
-                        digimon_clicked = False
-                        
-                        # Check if clicked on first Digimon
-                        if self.digimon1.rect.collidepoint(mouse_pos):
-                            digimon_clicked = True
-                            if self.digimon1.is_sleeping:
-                                self.digimon1.wake_up()
-                                print(f"Clicked on {self.digimon1_name} - waking up!")
-                            else:
-                                self.digimon1.jump()
-                                print(f"Clicked on {self.digimon1_name} - jumping!")
-                        # Check if clicked on second Digimon  
-                        elif self.digimon2.rect.collidepoint(mouse_pos):
-                            digimon_clicked = True
-                            if self.digimon2.is_sleeping:
-                                self.digimon2.wake_up()
-                                print(f"Clicked on {self.digimon2_name} - waking up!")
+                        index = self.pet_at(mouse_pos)
+                        if index is not None:
+                            digimon = self.pets[index]
+                            digimon_name = self.pet_names[index].replace("_dmc", "")
+                            if digimon.state == PetState.SLEEPING:
+                                digimon.wake_up()
+                                print(f"Clicked on {digimon_name} - waking up!")
                             else:
-                                self.digimon2.jump()
-                                print(f"Clicked on {self.digimon2_name} - jumping!")
-                        
-                        # If didn't click on Digimon, drop food
-                        if not digimon_clicked and self.sushi_image:
+                                digimon.jump()
+                                print(f"Clicked on {digimon_name} - jumping!")
+                        elif self.sushi_image:
+                            # Didn't click on a Digimon, drop food
                             self.drop_food(mouse_pos[0], mouse_pos[1])
             
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1 and self.is_tracking_swipe:  # Left mouse button release
                     # Check for swipe gesture
                     current_time = pygame.time.get_ticks()
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = self.get_mouse_pos()
                     
                     if self.swipe_start_pos:
                         # Calculate swipe distance and time
@@ -1913,12 +2118,16 @@ class VPetGame:
                             abs(dy) <= SWIPE_THRESHOLD):  # Mainly horizontal movement
                             
                             print("Swipe right detected - opening Digimon selection")
-                            # Get current selection for the UI
-                            current_selection = [
-                                self.digimon1_name + "_dmc",
-                                self.digimon2_name + "_dmc"
-                            ]
-                            self.selection_ui.open(current_selection)
+                            # The UI picks two Digimon, show the first two pets as selected
+                            self.selection_ui.open(self.pet_names[:2])
+                        
+                        # Check for swipe left gesture
+                        elif (distance >= SWIPE_THRESHOLD and
+                              time_elapsed <= SWIPE_TIME_LIMIT and
+                              dx <= -SWIPE_THRESHOLD and
+                              abs(dy) <= SWIPE_THRESHOLD):
+                            print("Swipe left detected - toggling performance HUD")
+                            self.perf_hud.toggle()
                     
                     # Reset swipe tracking
                     self.is_tracking_swipe = False
@@ -1932,136 +2141,348 @@ class VPetGame:
         if self.selection_ui.active:
             return
         
-        # Store previous positions
-        prev_digimon1_x = self.digimon1.rect.x
-        prev_digimon2_x = self.digimon2.rect.x
+        self.simulation_steps += 1
         
-        # Update both Digimon
-        self.digimon1.update()
-        self.digimon2.update()
+        # Store previous positions, then update every Digimon
+        current_time = self.simulation_time()
+        food_pool = self.food_items
+        if self.sim_core is not None:
+            previous_x = self.sim_core.arrays["x"].tolist()  # Slots are pet indices
+            self.sim_core.step(current_time)
+        else:
+            previous_x = [digimon.rect.x for digimon in self.pets]
+            for digimon in self.pets:
+                digimon.update()
         
         # Update food items and handle Digimon interactions
-        active_food = []
-        removed_food = []
-        
-        for food in self.food_items:
-            if food.update():  # Food returns True if it should stay
-                # Check if food is on ground and if any Digimon should move towards it
-                if food.on_ground and not food.consumed and food.claimed_by is None:
-                    # Check if either Digimon is available to move towards food
-                    digimon1_available = (not self.digimon1.is_sleeping and not self.digimon1.is_greeting 
-                                        and not self.digimon1.is_feeding and not self.digimon1.moving_to_food)
-                    digimon2_available = (not self.digimon2.is_sleeping and not self.digimon2.is_greeting 
-                                        and not self.digimon2.is_feeding and not self.digimon2.moving_to_food)
-                    
-                    # Find which Digimon is closer to the food
-                    if digimon1_available or digimon2_available:
-                        dist1 = abs(self.digimon1.rect.centerx - food.rect.centerx) if digimon1_available else float('inf')
-                        dist2 = abs(self.digimon2.rect.centerx - food.rect.centerx) if digimon2_available else float('inf')
-                        
-                        # Make the closer available Digimon move towards food
-                        if dist1 <= dist2 and digimon1_available and dist1 <= 150:  # Only if within reasonable distance
-                            self.digimon1.move_to_food(food)
-                        elif digimon2_available and dist2 <= 150:  # Only if within reasonable distance
-                            self.digimon2.move_to_food(food)
-                
-                active_food.append(food)  # Keep this food
-            else:
-                # Food is being removed (lifetime expired or consumed)
-                removed_food.append(food)
-        
-        # Clean up Digimon references to removed food
-        for food in removed_food:
-            if self.digimon1.target_food == food:
-                print("Digimon1's target food disappeared - stopping movement")
-                self.digimon1.stop_moving_to_food()
-            if self.digimon2.target_food == food:
-                print("Digimon2's target food disappeared - stopping movement")
-                self.digimon2.stop_moving_to_food()
-        
-        self.food_items = active_food
-        
-        # Check for collision between the two Digimon (only if neither is greeting, sleeping, feeding, or moving to food)
-        # Handle collision detection only if both Digimon exist
-        if (self.digimon2 and 
-            self.digimon1.check_collision(self.digimon2) and 
-            not self.digimon1.is_greeting and not self.digimon2.is_greeting and
-            not self.digimon1.is_sleeping and not self.digimon2.is_sleeping and
-            not self.digimon1.is_feeding and not self.digimon2.is_feeding and
-            not self.digimon1.moving_to_food and not self.digimon2.moving_to_food):
-            
-            # Move them back to prevent overlap
-            self.digimon1.rect.x = prev_digimon1_x
-            self.digimon2.rect.x = prev_digimon2_x
+        available = None  # Available pets by centerx, built when the first food needs a claimant
+        position = 0
+        while position < len(food_pool):
+            food = food_pool.records[position]
+            if not food.update(current_time):
+                # Food is being removed (lifetime expired or consumed); the claim names
+                # the only Digimon that can still hold it
+                digimon = food.claimed_by
+                if digimon is not None and digimon.target_food is food:
+                    print("Target food disappeared - stopping movement")
+                    digimon.stop_moving_to_food()
+                food_pool.remove(position)  # The last food moves here and is handled next
+                continue
             
-            # Determine which direction each should face to look at each other
-            # and which direction they should move after greeting
-            if self.digimon1.rect.centerx < self.digimon2.rect.centerx:
-                # Digimon1 is on the left, Digimon2 on the right
-                digimon1_face_direction = 1  # Digimon1 faces right
-                digimon2_face_direction = -1  # Digimon2 faces left
-                # After greeting, they should move away from each other
-                digimon1_post_direction = -1  # Digimon1 moves left (away)
-                digimon2_post_direction = 1  # Digimon2 moves right (away)
-            else:
-                # Digimon1 is on the right, Digimon2 on the left
-                digimon1_face_direction = -1  # Digimon1 faces left
-                digimon2_face_direction = 1  # Digimon2 faces right
-                # After greeting, they should move away from each other
-                digimon1_post_direction = 1  # Digimon1 moves right (away)
-                digimon2_post_direction = -1  # Digimon2 moves left (away)
-            
-            # Start greeting animation with proper facing directions and post-greeting directions
-            self.digimon1.start_greeting(digimon1_face_direction, digimon1_post_direction)
-            self.digimon2.start_greeting(digimon2_face_direction, digimon2_post_direction)
-            
-            # Reset timers for more natural movement after greeting
-            self.digimon1.direction_timer = 0
-            self.digimon2.direction_timer = 0
-            self.digimon1.next_direction_change = random.randint(30, 120)
-            self.digimon2.next_direction_change = random.randint(30, 120)
-            
-            # Move them slightly apart to prevent getting stuck
-            if self.digimon1.rect.centerx < self.digimon2.rect.centerx:
-                self.digimon1.rect.x -= 5
-                self.digimon2.rect.x += 5
-            else:
-                self.digimon1.rect.x += 5
-                self.digimon2.rect.x -= 5
-                
-    def draw(self):
-        # Draw background image instead of solid color
-        self.screen.blit(self.background, (0, 0))
-        self.digimon1.draw(self.screen)
-        self.digimon2.draw(self.screen)
+            # Check if food is on ground and if any Digimon should move towards it
+            if food.on_ground and not food.consumed and food.claimed_by is None:
+                if available is None:
+                    if self.sim_core is not None:
+                        available = NearestIndex(self.sim_core.available_centers())
+                    else:
+                        available = NearestIndex((digimon.rect.centerx, index)
+                                                 for index, digimon in enumerate(self.pets) if digimon.is_available())
+                # The closest available Digimon within reach walks to it (the first one on a tie)
+                index = available.nearest(food.rect.centerx, FOOD_CLAIM_DISTANCE)
+                if index is not None:
+                    digimon = self.pets[index]
+                    available.remove(digimon.rect.centerx, index)  # Busy with this food now
+                    digimon.move_to_food(food)
+            position += 1
+        
+        # Greetings: sweep the free pets sorted by x, so only pairs that overlap on x are checked
+        if self.sim_core is not None:
+            self.pet_order = self.sim_core.sort_by_x(self.pet_order)
+            pairs = self.sim_core.free_pairs(self.pet_order)
+        else:
+            sort_by_x(self.pet_order, self.pets)
+            free_pets = [index for index in self.pet_order if self.pets[index].is_available()]
+            pairs = overlapping_pairs(free_pets, self.pets)
+        for first, second in pairs:
+            self.greet(first, second, previous_x)
+    
+    def greet(self, first, second, previous_x):
+        """
+        Start a greeting between two pets (indices) if they collide, are both free
+        and did not just greet each other. previous_x holds every pet's x before
+        this step's movement.
+        """
+        digimon1 = self.pets[first]
+        digimon2 = self.pets[second]
+        if not (digimon1.is_available() and digimon2.is_available() and digimon1.check_collision(digimon2)):
+            return
+        if not self.greeting_cooldowns.ready(first, second, self.simulation_steps):
+            return
+        
+        # Move them back to prevent overlap
+        digimon1.rect.x = previous_x[first]
+        digimon2.rect.x = previous_x[second]
+        
+        # Face each other, then move away from each other after greeting
+        if digimon1.rect.centerx < digimon2.rect.centerx:
+            left, right = digimon1, digimon2
+        else:
+            left, right = digimon2, digimon1
+        left.start_greeting(1, -1)
+        right.start_greeting(-1, 1)
+        
+        # Reset timers for more natural movement after greeting
+        for digimon in (digimon1, digimon2):
+            digimon.direction_timer = 0
+            digimon.next_direction_change = random.randint(30, 120)
+        
+        # Move them slightly apart to prevent getting stuck
+        left.rect.x -= 5
+        right.rect.x += 5
+        self.greeting_cooldowns.start(first, second, self.simulation_steps, GREETING_COOLDOWN_STEPS)
+    
+    def draw(self, alpha=1.0):
+        """Draw a frame, sprites alpha of the way through the current simulation step"""
+        if self.renderer is not None:
+            self.draw_textures(alpha)
+            return
+        
+        # Dirty-rect frames only repaint the background under last frame's
+        # sprites; anything else (new background, selection UI) is a full frame
+        full_frame = not self.dirty_rects or self.needs_full_redraw or self.selection_ui.active
+        
+        if full_frame:
+            # Draw background image instead of solid color
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+        
+        drawn_rects = []
+        for digimon in self.pets:
+            drawn_rects.extend(digimon.draw(self.screen, alpha))
         
         # Draw all active food items
         for food in self.food_items:
-            food.draw(self.screen)
+            drawn_rects.append(food.draw(self.screen, alpha))
         
         # Draw selection UI on top if active
         self.selection_ui.draw()
         
+        # Performance overlay on top of everything
+        hud_rect = self.perf_hud.draw(self.screen, self.perf_counters)
+        if hud_rect:
+            drawn_rects.append(hud_rect)
+        
         # Ground line exists but is invisible (no drawing)
         # pygame.draw.line(self.screen, (34, 139, 34), 
         #                 (0, SCREEN_HEIGHT - 30), 
         #                 (SCREEN_WIDTH, SCREEN_HEIGHT - 30), 2)
         
-        pygame.display.flip()
+        if full_frame:
+            self.present()
+        else:
+            # Old areas show restored background, new ones the sprites
+            self.present(self.previous_rects + drawn_rects)
+        
+        self.previous_rects = drawn_rects
+        # The frame after the selection UI closes must repaint over it
+        self.needs_full_redraw = self.selection_ui.active
+    
+    def draw_textures(self, alpha=1.0):
+        """Draw a frame with the texture backend; every frame is a full frame"""
+        renderer = self.renderer
+        renderer.clear()
+        renderer.blit(self.background, (0, 0))
+        for digimon in self.pets:
+            digimon.draw(renderer, alpha)
+        for food in self.food_items:
+            food.draw(renderer, alpha)
+        
+        # Overlays are still drawn with surface calls, onto the transparent canvas
+        if self.selection_ui.active or self.perf_hud.visible:
+            self.screen.fill((0, 0, 0, 0))
+            self.selection_ui.draw()
+            self.perf_hud.draw(self.screen, self.perf_counters)
+            renderer.draw_overlay(self.screen)
+        renderer.present()
     
-    def run(self):
+    def run(self, max_frames=None):
+        """Run the game loop until quit (or for max_frames frames)"""
+        frame_count = 0
+        self.accumulator = SIMULATION_STEP_MS  # The first frame takes one step
+        self.last_step_time = pygame.time.get_ticks()
         while self.running:
+            frame_start = time.perf_counter()
             self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(10)  # 10 FPS
-        
+            events_done = time.perf_counter()
+            self.advance_simulation()
+            update_done = time.perf_counter()
+            self.draw(self.interpolation_alpha())
+            draw_done = time.perf_counter()
+            self.perf_hud.record(events_done - frame_start, update_done - events_done, draw_done - update_done, draw_done)
+            
+            frame_count += 1
+            if frame_count == 1:
+                self.finish_startup_profile()
+            if max_frames is not None and frame_count >= max_frames:
+                self.running = False
+            
+            if self.is_idle():
+                if not self.idle:
+                    print("Idle mode - waiting for input")
+                    self.idle = True
+                self.idle_wait()
+            else:
+                if self.idle:
+                    print("Leaving idle mode")
+                    self.idle = False
+                self.clock.tick(self.frame_rate)  # Render rate, uncapped when headless
+        
+        text_stats = get_text_cache().stats()
+        print(f"Text cache: {text_stats['hits']} hits, {text_stats['misses']} misses ({text_stats['hit_rate']:.0%} hit rate)")
+        self.asset_loader.shutdown()
         pygame.quit()
-        sys.exit()
+    
+    def perf_counters(self):
+        """Counts shown by the performance HUD"""
+        hearts = sum(1 for digimon in self.pets if digimon.heart_visible)
+        cached_surfaces = (len(get_asset_manager()) + len(get_text_cache())
+                           + len(self.background_store.cached_indices()))
+        return {"food": len(self.food_items),
+                "sprites": len(self.pets) + hearts + len(self.food_items),
+                "surfaces": cached_surfaces}
+    
+    def simulation_time(self):
+        """
+        The simulation clock in ms: SIMULATION_STEP_MS per step run. Food and
+        hearts are timed with it, so catch-up steps in a long frame each see
+        their own time
+        """
+        return self.simulation_steps * SIMULATION_STEP_MS
+    
+    def step(self):
+        """Advance the simulation by one fixed step"""
+        # Remember where sprites were so frames can be drawn between steps
+        if self.sim_core is not None:
+            self.sim_core.remember_positions()
+        else:
+            for digimon in self.pets:
+                digimon.previous_position = digimon.rect.topleft
+        for food in self.food_items:
+            food.previous_position = food.rect.topleft
+        self.update()
+    
+    def advance_simulation(self):
+        """Run as many fixed steps as the real time since the last frame covers"""
+        if not self.frame_rate:
+            self.step()  # Uncapped: exactly one step per frame
+            return
+        
+        current_time = pygame.time.get_ticks()
+        self.accumulator += current_time - self.last_step_time
+        self.last_step_time = current_time
+        
+        # A long frame runs several steps, so the game catches up instead of slowing down
+        steps = 0
+        while self.accumulator >= SIMULATION_STEP_MS:
+            if steps == MAX_STEPS_PER_FRAME:
+                print(f"Simulation fell {self.accumulator} ms behind - skipping ahead")
+                self.accumulator = 0
+                break
+            self.step()
+            self.accumulator -= SIMULATION_STEP_MS
+            steps += 1
+    
+    def interpolation_alpha(self):
+        """How far real time is between the last simulation step and the next (0-1)"""
+        if not self.frame_rate:
+            return 1.0
+        return self.accumulator / SIMULATION_STEP_MS
+    
+    def is_idle(self):
+        """True when nothing on screen can change until an animation frame or input"""
+        if not self.idle_after or not self.frame_rate or not self.running:
+            return False
+        if self.selection_ui.active or self.food_items:
+            return False
+        if not all(digimon.state == PetState.SLEEPING for digimon in self.pets):
+            return False
+        if any(digimon.heart_visible for digimon in self.pets):
+            return False
+        return pygame.time.get_ticks() - self.last_input_time >= self.idle_after
+    
+    def idle_wait(self):
+        """
+        Block until an event arrives or the next sleeping frame is due. The
+        simulation steps covering the wait run on the next frame, so timers
+        (hunger, animation) stay on schedule
+        """
+        ticks = min((digimon.ticks_until_animation_change() for digimon in self.pets), default=SIMULATION_RATE)
+        timeout = max(0, ticks * SIMULATION_STEP_MS - self.accumulator)
+        if self.cursor_visible:
+            timeout = min(timeout, max(SIMULATION_STEP_MS, self.mouse_hide_delay - (pygame.time.get_ticks() - self.last_mouse_move_time)))
+        
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)  # Handled by the next handle_events()
+        self.clock.tick()  # Restart the frame clock so the next tick does not wait
+    
+    def finish_startup_profile(self):
+        """Record the first flip; with --profile-startup, report the timeline and quit"""
+        mark_startup("first flip")
+        profiler = get_active_profiler()
+        if profiler is not None:
+            profiler.uninstall()
+            profiler.report()
+            profiler.write_json()
+            self.running = False
+
+def parse_size(text):
+    """Parse a WxH size such as 800x480"""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WxH, got {text!r}")
+    return (width, height)
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Vpet - virtual pet game")
+    parser.add_argument("--profile-startup", nargs="?", const="startup_profile.json", metavar="JSON_PATH",
+                        help="time each startup phase up to the first frame, count file opens and decoded bytes, "
+                             "print a table, write it as JSON (default startup_profile.json) and quit")
+    parser.add_argument("--headless", action="store_true",
+                        help="use SDL's dummy video driver, draw offscreen and run uncapped (no display needed)")
+    parser.add_argument("--frames", type=int, metavar="N", help="quit after N frames")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only repaint and present the areas that changed (falls back to full frames "
+                             "when the background changes or the selection UI is open)")
+    parser.add_argument("--fps", type=int, default=DEFAULT_RENDER_FPS, metavar="N",
+                        help=f"frames drawn per second (default {DEFAULT_RENDER_FPS}); the simulation always runs "
+                             f"at {SIMULATION_RATE} steps per second and sprites are interpolated between steps")
+    parser.add_argument("--scale", choices=SCALE_MODES, default="auto",
+                        help="how the 480x320 canvas reaches the display: none, integer (nearest-neighbour, "
+                             "letterboxed) or scaled (pygame.SCALED); auto picks integer or scaled fullscreen "
+                             "on a Raspberry Pi and none elsewhere")
+    parser.add_argument("--window-size", type=parse_size, metavar="WxH",
+                        help="window size for --scale integer (default 960x640, the whole screen on a Pi)")
+    parser.add_argument("--renderer", choices=RENDERERS, default="surface",
+                        help="surface composes each frame in software and flips it; texture uploads images "
+                             "once and draws them with SDL's renderer (pygame._sdl2.video), scaled to the window")
+    parser.add_argument("--pets", type=int, default=DEFAULT_PET_COUNT, metavar="N",
+                        help=f"number of pets (default {DEFAULT_PET_COUNT}); pets beyond the saved selection are "
+                             "picked at random")
+    parser.add_argument("--sim-core", action="store_true",
+                        help="step pet physics and animation as NumPy array operations (needs numpy; "
+                             "for parks with many pets)")
+    parser.add_argument("--max-food", type=int, default=MAX_FOOD_ITEMS, metavar="N",
+                        help=f"most food on screen at once (default {MAX_FOOD_ITEMS}); further taps drop nothing")
+    parser.add_argument("--idle-after", type=float, default=IDLE_AFTER_MS / 1000, metavar="SECONDS",
+                        help="stop ticking and wait for input once every pet sleeps, no food is out and "
+                             f"nothing was touched for SECONDS (default {IDLE_AFTER_MS // 1000}, 0 disables)")
+    return parser.parse_args(argv)
 
 def main():
-    game = VPetGame()
-    game.run()
+    args = parse_args()
+    if args.profile_startup:
+        StartupProfiler(args.profile_startup).install()
+    game = VPetGame(headless=args.headless, dirty_rects=args.dirty_rects, idle_after=int(args.idle_after * 1000),
+                    render_fps=args.fps, scale_mode=args.scale, window_size=args.window_size,
+                    renderer=args.renderer, pet_count=args.pets, sim_core=args.sim_core,
+                    max_food=args.max_food)
+    game.run(max_frames=args.frames)
+    sys.exit()
 
 if __name__ == "__main__":
     main()
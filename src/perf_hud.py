@@ -0,0 +1,144 @@
+"""
+Performance overlay.
+
+Toggled in game with F3 or a swipe left. Shows a rolling FPS, the p50/p95
+times of each frame phase (handle_events, update, draw), the food and sprite
+counts, the surfaces held by the asset caches and the process RSS.
+
+The overlay is built to stay out of its own numbers: labels are rendered
+once, numbers are drawn from digit glyphs rendered once, values are
+recomputed only every HUD_REFRESH_MS, and timings are only collected while
+the overlay is shown.
+"""
+
+import os
+from collections import deque
+
+import pygame
+
+from text_cache import get_text_cache
+
+HUD_SAMPLES = 120  # Frames in the rolling window
+HUD_REFRESH_MS = 500  # Values are recomputed twice a second
+HUD_PHASES = ("events", "update", "draw")
+HUD_DIGITS = "0123456789.-"
+HUD_POSITION = (4, 4)
+HUD_TEXT_COLOR = (255, 255, 255)
+HUD_BACKGROUND = (0, 0, 0, 160)
+HUD_LABEL_WIDTH = 90
+HUD_VALUE_WIDTH = 44
+
+
+def percentile(sorted_samples, fraction):
+    """Return the sample at fraction (0-1) of a sorted list (0.0 when empty)"""
+    if not sorted_samples:
+        return 0.0
+    return sorted_samples[min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))]
+
+
+def process_rss():
+    """Return the resident set size of this process in bytes, or None where unknown (non-Linux)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class PerfHUD:
+    def __init__(self, font):
+        self.visible = False
+        self.font = font
+        self.line_height = font.get_linesize()
+        self.samples = {phase: deque(maxlen=HUD_SAMPLES) for phase in HUD_PHASES}  # ms per frame
+        self.frame_ends = deque(maxlen=HUD_SAMPLES)  # perf_counter() at the end of each frame
+
+        # Everything drawn is rendered here, once
+        self.glyphs = {digit: font.render(digit, True, HUD_TEXT_COLOR) for digit in HUD_DIGITS}
+        text = get_text_cache()
+        # None is the p50/p95 heading row
+        self.row_labels = ["FPS", None] + [f"{phase} ms" for phase in HUD_PHASES] + ["food/sprites", "surfaces", "RSS MB"]
+        self.labels = {label: text.render(font, label, HUD_TEXT_COLOR)
+                       for label in self.row_labels[:1] + self.row_labels[2:] + ["p50", "p95"]}
+        width = HUD_LABEL_WIDTH + 2 * HUD_VALUE_WIDTH + 8
+        height = len(self.row_labels) * self.line_height + 8
+        self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.panel.fill(HUD_BACKGROUND)
+        self.rect = self.panel.get_rect(topleft=HUD_POSITION)
+
+        self.values = {}  # row label -> value strings, see refresh()
+        self.last_refresh = None
+
+    def toggle(self):
+        """Show or hide the overlay; every show starts a fresh window"""
+        self.visible = not self.visible
+        for samples in self.samples.values():
+            samples.clear()
+        self.frame_ends.clear()
+        self.last_refresh = None
+        print(f"Performance HUD {'shown' if self.visible else 'hidden'}")
+
+    def record(self, events_seconds, update_seconds, draw_seconds, frame_end):
+        """Add one frame's phase times (seconds) and its perf_counter() end time"""
+        if not self.visible:
+            return
+        for phase, seconds in zip(HUD_PHASES, (events_seconds, update_seconds, draw_seconds)):
+            self.samples[phase].append(seconds * 1000)
+        self.frame_ends.append(frame_end)
+
+    def fps(self):
+        """Frames per second over the rolling window"""
+        if len(self.frame_ends) < 2:
+            return 0.0
+        span = self.frame_ends[-1] - self.frame_ends[0]
+        return (len(self.frame_ends) - 1) / span if span > 0 else 0.0
+
+    def refresh(self, counters):
+        """Recompute the values shown from the samples and counters (food, sprites, surfaces)"""
+        self.values = {"FPS": [f"{self.fps():.1f}"]}
+        for phase in HUD_PHASES:
+            ordered = sorted(self.samples[phase])
+            self.values[f"{phase} ms"] = [f"{percentile(ordered, 0.5):.2f}", f"{percentile(ordered, 0.95):.2f}"]
+        self.values["food/sprites"] = [str(counters["food"]), str(counters["sprites"])]
+        self.values["surfaces"] = [str(counters["surfaces"])]
+        rss = process_rss()
+        self.values["RSS MB"] = [f"{rss / (1024 * 1024):.1f}" if rss is not None else "-"]
+
+    def draw_number(self, surface, text, position):
+        """Blit a number from the digit glyphs"""
+        x, y = position
+        for digit in text:
+            glyph = self.glyphs[digit]
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+    def draw(self, surface, counters):
+        """
+        Draw the overlay if shown and return the area it covered (None when
+        hidden). counters() returns the counts for refresh() and is only
+        called when the values are due to be recomputed.
+        """
+        if not self.visible:
+            return None
+        now = pygame.time.get_ticks()
+        if self.last_refresh is None or now - self.last_refresh >= HUD_REFRESH_MS:
+            self.refresh(counters())
+            self.last_refresh = now
+
+        surface.blit(self.panel, self.rect)
+        x = self.rect.x + 4
+        y = self.rect.y + 4
+        value_x = x + HUD_LABEL_WIDTH
+        for label in self.row_labels:
+            if label is None:
+                # Column headings for the phase rows
+                surface.blit(self.labels["p50"], (value_x, y))
+                surface.blit(self.labels["p95"], (value_x + HUD_VALUE_WIDTH, y))
+                y += self.line_height
+                continue
+            surface.blit(self.labels[label], (x, y))
+            for column, value in enumerate(self.values.get(label, ())):
+                self.draw_number(surface, value, (value_x + column * HUD_VALUE_WIDTH, y))
+            y += self.line_height
+        return self.rect
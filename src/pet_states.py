@@ -0,0 +1,56 @@
+"""
+Digimon behavior states and their animation clips.
+
+A Digimon is in exactly one PetState at a time, and Digimon.update_behavior
+makes one dispatch through Digimon.state_handlers to that state's handler.
+Each state plays one AnimationClip from STATE_CLIPS: positions in one of the
+Digimon's frame lists (walking, greeting, sleeping or feeding), each shown
+for delay simulation steps. A looping clip starts over after its last
+frame; a one-shot clip ends its state one delay after its last frame
+appears, switching to next_state. States sharing a clip (walking and
+walking to food) keep it running across a switch.
+
+Jumping and the heart are not states: they run alongside whichever state
+the Digimon is in. Adding a state means a PetState member, its STATE_CLIPS
+entry and a handler (plus an exit handler if leaving it needs cleanup);
+the other states are untouched.
+"""
+
+from enum import IntEnum
+
+FRAME_DELAY = 5  # Change frame every 5 game ticks (0.5 seconds at 10 FPS)
+
+
+class PetState(IntEnum):
+    SLEEPING = 0
+    WALKING = 1
+    GREETING = 2
+    MOVING_TO_FOOD = 3
+    FEEDING = 4
+
+
+class AnimationClip:
+    """
+    sprites: which of the Digimon's frame lists to show; sequence: positions
+    in that list, in order (wrapped when the list is shorter, as for the
+    fallback sprite). A one-shot clip (loop=False) switches to next_state when done.
+    """
+    __slots__ = ("sprites", "sequence", "delay", "loop", "next_state")
+
+    def __init__(self, sprites, sequence, delay=FRAME_DELAY, loop=True, next_state=None):
+        self.sprites = sprites
+        self.sequence = sequence
+        self.delay = delay
+        self.loop = loop
+        self.next_state = next_state
+
+
+WALKING_CLIP = AnimationClip("walking", (0, 1))
+
+STATE_CLIPS = {
+    PetState.SLEEPING: AnimationClip("sleeping", (0, 1)),  # 11 -> 12 -> 11 -> 12
+    PetState.WALKING: WALKING_CLIP,
+    PetState.MOVING_TO_FOOD: WALKING_CLIP,
+    PetState.GREETING: AnimationClip("greeting", (0, 1, 0, 1), loop=False, next_state=PetState.WALKING),  # 2 -> 0, twice
+    PetState.FEEDING: AnimationClip("feeding", (0, 1, 0, 1, 0), loop=False, next_state=PetState.WALKING),  # 5 -> 6 -> 5 -> 6 -> 5, two chews
+}
@@ -0,0 +1,130 @@
+"""
+Broad-phase helpers for a world of N pets.
+
+The game keeps its pets in a list and an "order" list of indices into it,
+sorted by each pet's rect.x. Pets only walk a few pixels per step, so the
+order is almost sorted already and re-sorting it every step is close to
+linear. Walking it left to right finds every pair whose rects overlap on x
+(sweep and prune) without checking all pairs, and tap hit-testing walks the
+same order.
+
+NearestIndex answers "which pet is closest on x" with bisect, for handing
+out food to the closest available pet.
+
+Anything with a pygame.Rect in .rect works as a pet here.
+"""
+
+from array import array
+from bisect import bisect_left
+import random
+
+
+def sort_by_x(order, pets):
+    """Re-sort order (indices into pets) by left edge, in place"""
+    order.sort(key=lambda index: pets[index].rect.x)
+
+
+def overlapping_pairs(order, pets):
+    """
+    Yield (left, right) index pairs of pets whose rects overlap on x, from an
+    order sorted with sort_by_x. Callers still check y (a jumping pet can pass
+    over another).
+    """
+    count = len(order)
+    for position, left in enumerate(order):
+        right_edge = pets[left].rect.right
+        for other in range(position + 1, count):
+            right = order[other]
+            if pets[right].rect.x >= right_edge:
+                break  # Sorted by x: nothing further along can reach back to left
+            yield left, right
+
+
+def hit_test(order, pets, pos):
+    """Return the index of the pet under pos (the one drawn last, on top), or None"""
+    x = pos[0]
+    hit = None
+    for index in order:
+        rect = pets[index].rect
+        if rect.x > x:
+            break  # Sorted by x: the rest start right of pos
+        if rect.collidepoint(pos) and (hit is None or index > hit):
+            hit = index
+    return hit
+
+
+def spread_positions(count, max_x, min_distance):
+    """Random x positions in 0..max_x for count pets, min_distance apart when there is room"""
+    for attempt in range(10):
+        positions = [random.randint(0, max_x) for _ in range(count)]
+        ordered = sorted(positions)
+        if all(b - a >= min_distance for a, b in zip(ordered, ordered[1:])):
+            return positions
+
+    # Too crowded for random picks: one random spot in each of count equal slots
+    slot = max_x / max(count, 1)
+    spread = max(0, int(slot - min_distance))
+    return [int(i * slot) + random.randint(0, spread) for i in range(count)]
+
+
+class NearestIndex:
+    """
+    Indices kept sorted by an x coordinate for nearest-on-x queries. Entries
+    are (x, index) pairs; among equally close entries the lowest index wins.
+    """
+
+    def __init__(self, entries):
+        self.keys = sorted(entries)
+
+    def nearest(self, x, max_distance):
+        """Return the index closest to x within max_distance, or None"""
+        keys = self.keys
+        best = None
+        position = bisect_left(keys, (x, -1))
+        if position < len(keys):
+            # First entry at or right of x (lowest index among equal x)
+            right_x, right_index = keys[position]
+            if right_x - x <= max_distance:
+                best = (right_x - x, right_index)
+        if position > 0:
+            # Closest entry left of x: jump to the start of its run for the lowest index
+            left_x, left_index = keys[bisect_left(keys, (keys[position - 1][0], -1))]
+            if x - left_x <= max_distance and (best is None or (x - left_x, left_index) < best):
+                best = (x - left_x, left_index)
+        return None if best is None else best[1]
+
+    def remove(self, x, index):
+        """Drop the entry for index (added at x)"""
+        del self.keys[bisect_left(self.keys, (x, index))]
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class PairCooldowns:
+    """
+    Per-pair cooldowns for N pets in one flat array of unsigned ints (the step
+    each pair may act again), one slot per unordered pair: N * (N - 1) / 2.
+    """
+
+    def __init__(self, count):
+        self.count = count
+        self.ready_at = array("I", bytes(array("I").itemsize * (count * (count - 1) // 2)))
+
+    @staticmethod
+    def pair_index(first, second):
+        """Slot of the unordered pair (first, second)"""
+        if first > second:
+            first, second = second, first
+        return second * (second - 1) // 2 + first
+
+    def ready(self, first, second, step):
+        """True if the pair's cooldown is over at step"""
+        return step >= self.ready_at[self.pair_index(first, second)]
+
+    def start(self, first, second, step, duration):
+        """Start the pair's cooldown at step, lasting duration steps"""
+        self.ready_at[self.pair_index(first, second)] = step + duration
+
+    def __len__(self):
+        return len(self.ready_at)
@@ -0,0 +1,357 @@
+"""
+Optional NumPy simulation core (--sim-core).
+
+Digimon.update walks each pet through its state checks one attribute at a
+time, which is what limits parks with hundreds of pets. With the core, a
+pet's per-step numbers (position, facing, animation clip, timers, hunger,
+heart) live in NumPy arrays with one slot per pet (struct of arrays), and
+every step runs, as array operations:
+    - hunger decay and the heart animation for every pet
+    - animation clip timers for sleeping, greeting, eating and walking pets
+      (from the clip table in pet_states), including the end of a greeting
+    - jump gravity for greeting and walking pets, and direction changes,
+      movement and edge bouncing for walking ones
+Pets walking to food run their Digimon state handler, and a finished meal
+runs finish_eating: both are bounded by the food on screen. The game's
+greeting sweep and food claims read the arrays too (sort_by_x, free_pairs,
+available_centers).
+
+Pets stay ordinary objects for the rest of the game: core_pet_class()
+derives a Digimon class whose per-step attributes are properties over the
+arrays. The image is derived from the state, clip position and facing, and
+the rect is a CoreRect that is brought up to date when it is read (so only
+for pets being drawn or handled) and writes position changes back.
+
+Random direction changes draw from the core's NumPy generator rather than
+the random module.
+
+NumPy is optional; numpy_available() says whether the core can be used.
+"""
+
+import pygame
+
+from pet_states import PetState, STATE_CLIPS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Flag bits (the flags array) for what runs alongside a pet's state
+JUMPING = 1
+HEART = 2
+FLIPPED = 4
+
+# Digimon attribute -> array, for core_pet_class
+INT_FIELDS = ("state", "clip_timer", "clip_step", "direction", "speed", "speed_backup", "original_speed",
+              "direction_timer", "next_direction_change", "hunger_timer", "jump_velocity", "gravity", "ground_y",
+              "heart_start_time", "heart_float_offset", "heart_keyframe")
+FLOAT_FIELDS = ("hunger", "hunger_decrease_rate")
+FLAG_FIELDS = {"is_jumping": JUMPING, "heart_visible": HEART, "flipped": FLIPPED}
+# Arrays the core keeps for itself; post_greeting_direction is 0 for None
+CORE_FIELDS = ("x", "y", "width", "previous_x", "previous_y", "post_greeting_direction", "heart_keyframe_count")
+
+_set_topleft = pygame.Rect.topleft.__set__  # Moves a CoreRect without writing back
+
+
+def numpy_available():
+    """True if NumPy is installed, so the core can run"""
+    return np is not None
+
+
+class CoreRect(pygame.Rect):
+    """A core pet's rect: position changes are written back to the pet's slot"""
+    __slots__ = ("owner",)
+
+    def __setattr__(self, name, value):
+        pygame.Rect.__setattr__(self, name, value)
+        owner = getattr(self, "owner", None)  # Copies of the rect have none
+        if owner is not None:
+            arrays = owner.core.arrays
+            arrays["x"][owner.slot] = self.x
+            arrays["y"][owner.slot] = self.y
+
+
+def _array_property(field, cast):
+    def get(self):
+        return cast(self.core.arrays[field].item(self.slot))
+
+    def set(self, value):
+        self.core.arrays[field][self.slot] = value
+
+    return property(get, set)
+
+
+def _flag_property(bit):
+    def get(self):
+        return self.core.flags.item(self.slot) & bit != 0
+
+    def set(self, value):
+        if value:
+            self.core.flags[self.slot] |= bit
+        else:
+            self.core.flags[self.slot] &= 0xFF ^ bit
+
+    return property(get, set)
+
+
+def _get_rect(self):
+    arrays = self.core.arrays
+    rect = self.core_rect
+    _set_topleft(rect, (arrays["x"].item(self.slot), arrays["y"].item(self.slot)))
+    return rect
+
+
+def _set_rect(self, rect):
+    self.core_rect = CoreRect(rect)
+    self.core_rect.owner = self  # Writes the position
+    self.core.arrays["width"][self.slot] = rect.width
+
+
+def _get_image(self):
+    arrays = self.core.arrays
+    clip = STATE_CLIPS[arrays["state"].item(self.slot)]
+    frames = self.clips[clip.sprites][self.core.flags.item(self.slot) & FLIPPED != 0]
+    return frames[clip.sequence[arrays["clip_step"].item(self.slot)] % len(frames)]
+
+
+def _get_previous_position(self):
+    if not self.core.has_previous.item(self.slot):
+        return None
+    arrays = self.core.arrays
+    return arrays["previous_x"].item(self.slot), arrays["previous_y"].item(self.slot)
+
+
+def _set_previous_position(self, position):
+    self.core.has_previous[self.slot] = position is not None
+    if position is not None:
+        self.core.arrays["previous_x"][self.slot], self.core.arrays["previous_y"][self.slot] = position
+
+
+def _get_post_greeting_direction(self):
+    return self.core.arrays["post_greeting_direction"].item(self.slot) or None
+
+
+def _set_post_greeting_direction(self, direction):
+    self.core.arrays["post_greeting_direction"][self.slot] = direction or 0
+
+
+def core_pet_class(base):
+    """
+    Return a subclass of the Digimon class base whose per-step attributes,
+    rect position and image live in a SimulationCore (is_available() reads
+    the state array directly). Construct it as cls(core, *base_args).
+    """
+    def __init__(self, core, *args, **kwargs):
+        self.core = core
+        self.slot = core.allocate()  # Before base __init__, which sets the array-backed attributes
+        try:
+            base.__init__(self, *args, **kwargs)
+        except Exception:
+            core.release(self.slot)  # Keeps slots lined up with the game's pet list
+            raise
+        core.attach(self)
+
+    def show_frame(self):
+        """The image follows the state, clip position and facing (see image)"""
+
+    def is_available(self):
+        return self.core.arrays["state"].item(self.slot) == PetState.WALKING
+
+    namespace = {"__init__": __init__, "show_frame": show_frame, "is_available": is_available,
+                 "rect": property(_get_rect, _set_rect), "image": property(_get_image),
+                 "previous_position": property(_get_previous_position, _set_previous_position),
+                 "post_greeting_direction": property(_get_post_greeting_direction, _set_post_greeting_direction),
+                 "__doc__": f"{base.__name__} backed by a SimulationCore slot"}
+    for field in INT_FIELDS:
+        namespace[field] = _array_property(field, PetState if field == "state" else int)
+    for field in FLOAT_FIELDS:
+        namespace[field] = _array_property(field, float)
+    for field, bit in FLAG_FIELDS.items():
+        namespace[field] = _flag_property(bit)
+    return type(f"Core{base.__name__}", (base,), namespace)
+
+
+class SimulationCore:
+    def __init__(self, capacity, screen_width, hunger_interval, heart_duration, heart_float_speed, heart_keyframe_ms,
+                 rng=None):
+        self.capacity = capacity
+        self.screen_width = screen_width
+        self.hunger_interval = hunger_interval
+        self.heart_duration = heart_duration
+        self.heart_float_speed = heart_float_speed
+        self.heart_keyframe_ms = heart_keyframe_ms
+        self.rng = rng if rng is not None else np.random.default_rng()  # Direction change timings
+
+        self.arrays = {field: np.zeros(capacity, dtype=np.int64) for field in INT_FIELDS + CORE_FIELDS}
+        self.arrays.update({field: np.zeros(capacity, dtype=np.float64) for field in FLOAT_FIELDS})
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.has_previous = np.zeros(capacity, dtype=bool)  # previous_x/y hold a position
+        self.alive = np.zeros(capacity, dtype=bool)  # Slots whose pet finished construction
+
+        # The clip table as arrays indexed by state
+        states = range(max(STATE_CLIPS) + 1)
+        self.clip_delay = np.array([STATE_CLIPS[state].delay for state in states])
+        self.clip_length = np.array([len(STATE_CLIPS[state].sequence) for state in states])
+        self.clip_loop = np.array([STATE_CLIPS[state].loop for state in states])
+        self.pets = [None] * capacity  # Slot -> pet
+        self.allocated = 0
+
+    def allocate(self):
+        """Reserve the next slot for a pet being constructed"""
+        if self.allocated == self.capacity:
+            raise ValueError(f"Simulation core is full ({self.capacity} pets)")
+        self.allocated += 1
+        return self.allocated - 1
+
+    def release(self, slot):
+        """Give back the slot of a pet whose construction failed (the last one allocated)"""
+        if slot == self.allocated - 1:
+            self.allocated -= 1
+
+    def attach(self, pet):
+        """Start stepping a constructed pet"""
+        self.pets[pet.slot] = pet
+        self.arrays["heart_keyframe_count"][pet.slot] = len(pet.heart_keyframes)
+        self.alive[pet.slot] = True
+
+    def face_direction(self, mask):
+        """Turn the sprites of the pets in mask to face the way they walk"""
+        right = mask & (self.arrays["direction"] == 1)
+        self.flags[right] |= FLIPPED
+        self.flags[mask & ~right] &= 0xFF ^ FLIPPED
+
+    def step(self, now):
+        """
+        Advance every attached pet one simulation step (as Digimon.update on
+        each) at time now, in ms
+        """
+        a = self.arrays
+        flags = self.flags
+        alive = self.alive
+
+        # Hunger for everyone
+        a["hunger_timer"][alive] += 1
+        due = alive & (a["hunger_timer"] >= self.hunger_interval)
+        if due.any():
+            a["hunger"][due] = np.maximum(0, a["hunger"][due] - a["hunger_decrease_rate"][due] * self.hunger_interval)
+            a["hunger_timer"][due] = 0
+            for _ in range(np.count_nonzero(due & (a["hunger"] <= 0))):
+                print(f"Digimon is very hungry!")
+
+        # Hearts float up and fade, then disappear
+        heart = alive & (flags & HEART != 0)
+        if heart.any():
+            elapsed = now - a["heart_start_time"]
+            over = heart & (elapsed >= self.heart_duration)
+            flags[over] &= 0xFF ^ HEART
+            a["heart_float_offset"][over] = 0
+            shown = heart & ~over
+            a["heart_float_offset"][shown] += self.heart_float_speed
+            a["heart_keyframe"][shown] = np.minimum(elapsed[shown] // self.heart_keyframe_ms,
+                                                    a["heart_keyframe_count"][shown] - 1)
+
+        # States stepped here as arrays; pets in the others run their Digimon state handler,
+        # which reads and writes the arrays through properties. Masks come from the states
+        # before any handler runs, so a pet that changes state is not stepped twice
+        state = a["state"].copy()
+        greeting = alive & (state == PetState.GREETING)
+        walking = alive & (state == PetState.WALKING)
+        clipped = alive & ((state == PetState.SLEEPING) | (state == PetState.FEEDING)) | greeting | walking
+        for slot in np.flatnonzero(alive & ~clipped):
+            self.pets[slot].update_behavior()
+
+        x = a["x"]
+        y = a["y"]
+
+        # Jump gravity (greeting and walking pets can both be mid-jump)
+        jumping = (greeting | walking) & (flags & JUMPING != 0)
+        if jumping.any():
+            a["jump_velocity"][jumping] += a["gravity"][jumping]
+            y[jumping] += a["jump_velocity"][jumping]
+            landed = jumping & (y >= a["ground_y"])
+            y[landed] = a["ground_y"][landed]
+            flags[landed] &= 0xFF ^ JUMPING
+            a["jump_velocity"][landed] = 0
+
+        # Animation clips (Digimon.advance_clip): a finished one-shot clip ends its state
+        a["clip_timer"][clipped] += 1
+        advanced = clipped & (a["clip_timer"] >= self.clip_delay[state])
+        a["clip_timer"][advanced] = 0
+        at_end = advanced & (a["clip_step"] + 1 >= self.clip_length[state])
+        a["clip_step"][advanced & ~at_end] += 1
+        a["clip_step"][at_end & self.clip_loop[state]] = 0
+        finished = at_end & ~self.clip_loop[state]
+
+        # A finished greeting walks on (Digimon.finish_greeting), the post-greeting direction if one was given
+        greeted = finished & greeting
+        if greeted.any():
+            a["speed"][greeted] = a["speed_backup"][greeted]
+            redirected = greeted & (a["post_greeting_direction"] != 0)
+            a["direction"][redirected] = a["post_greeting_direction"][redirected]
+            a["post_greeting_direction"][greeted] = 0
+            self.face_direction(greeted)
+            a["state"][greeted] = PetState.WALKING
+            a["clip_step"][greeted] = 0
+        # Other one-shot clips (a meal) end through the Digimon
+        for slot in np.flatnonzero(finished & ~greeting):
+            self.pets[slot].set_state(STATE_CLIPS[state[slot]].next_state)
+
+        # Random direction changes
+        a["direction_timer"][walking] += 1
+        turned = walking & (a["direction_timer"] >= a["next_direction_change"])
+        if turned.any():
+            a["direction"][turned] *= -1
+            a["direction_timer"][turned] = 0
+            a["next_direction_change"][turned] = self.rng.integers(60, 301, np.count_nonzero(turned))
+
+        # Move, then bounce off the edges
+        x[walking] += a["speed"][walking] * a["direction"][walking]
+        right_edge = walking & (x + a["width"] >= self.screen_width)
+        left_edge = walking & ~right_edge & (x <= 0)
+        bounced = right_edge | left_edge
+        if bounced.any():
+            x[right_edge] = self.screen_width - 1 - a["width"][right_edge]
+            x[left_edge] = 1
+            a["direction"][right_edge] = -1
+            a["direction"][left_edge] = 1
+            a["direction_timer"][bounced] = 0
+            a["next_direction_change"][bounced] = self.rng.integers(30, 121, np.count_nonzero(bounced))
+            for _ in range(np.count_nonzero(left_edge)):
+                print("Hit left boundary - forced direction right")
+            for _ in range(np.count_nonzero(right_edge)):
+                print("Hit right boundary - forced direction left")
+        self.face_direction(turned | bounced)
+
+    def remember_positions(self):
+        """Keep every pet's position as its previous one, for drawing between steps"""
+        self.arrays["previous_x"][:] = self.arrays["x"]
+        self.arrays["previous_y"][:] = self.arrays["y"]
+        self.has_previous[:] = self.alive
+
+    def sort_by_x(self, order):
+        """Return order (pet slots) re-sorted by left edge, as pet_world.sort_by_x"""
+        order = np.asarray(order, dtype=np.int64)
+        return order[np.argsort(self.arrays["x"][order], kind="stable")].tolist()
+
+    def free_pairs(self, order):
+        """
+        (left, right) slot pairs of available pets that overlap on x, as
+        pet_world.overlapping_pairs over the available pets of an order
+        sorted by x (before any of the pairs is acted on)
+        """
+        order = np.asarray(order, dtype=np.int64)
+        free = order[self.arrays["state"][order] == PetState.WALKING]
+        left = self.arrays["x"][free]
+        # Pets from position + 1 up to the first one starting at or past position's right edge
+        ends = np.searchsorted(left, left + self.arrays["width"][free])
+        counts = ends - np.arange(1, len(free) + 1)
+        firsts = np.repeat(np.arange(len(free)), counts)
+        seconds = firsts + 1 + np.arange(len(firsts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return zip(free[firsts].tolist(), free[seconds].tolist())
+
+    def available_centers(self):
+        """(centerx, slot) for every available pet, for NearestIndex"""
+        slots = np.flatnonzero(self.alive & (self.arrays["state"] == PetState.WALKING))
+        centers = self.arrays["x"][slots] + self.arrays["width"][slots] // 2
+        return zip(centers.tolist(), slots.tolist())
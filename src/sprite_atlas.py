@@ -0,0 +1,279 @@
+"""
+Packed sprite atlas format and memory-mapped loader.
+
+Each source folder under assets/sprites (e.g. "Digimon Color Ver. 1") can be
+packed into a single SPRITE_ATLAS_NAME file that holds every frame of every
+Digimon in it as pre-decoded RGBA pixels plus an index of (name, frame) -> rect.
+
+File layout:
+    8 bytes   magic (ATLAS_MAGIC)
+    4 bytes   little-endian length of the JSON index
+    N bytes   JSON index: {"version", "width", "height", "format", "sprites"}
+    padding   up to the next ATLAS_ALIGNMENT boundary
+    W*H*4     RGBA pixel data of the whole sheet, one Digimon per row
+
+Loading mmaps the file, wraps the pixel block in a single Surface with
+pygame.image.frombuffer (no copy, no PNG decode) and hands out subsurfaces.
+Build atlases with build_sprite_atlas.py in the project root.
+"""
+
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+from asset_loader import load_image
+
+ATLAS_MAGIC = b"VPATLAS\x01"
+ATLAS_VERSION = 1
+ATLAS_ALIGNMENT = 16
+SPRITE_ATLAS_NAME = "sprites.vpatlas"
+MAX_FRAMES = 15  # Frames 0-14 per Digimon
+
+# Open atlases keyed by atlas path (None = checked, no atlas on disk)
+_open_atlases = {}
+
+
+class SpriteAtlas:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            # ACCESS_COPY gives a private mapping, so a stray write to a sprite
+            # surface can never reach the file (or crash on a read-only page)
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except Exception:
+            self._file.close()
+            raise
+
+        if self._mmap[:len(ATLAS_MAGIC)] != ATLAS_MAGIC:
+            self.close()
+            raise ValueError(f"Not a sprite atlas: {path}")
+
+        header_size = len(ATLAS_MAGIC) + 4
+        (index_length,) = struct.unpack("<I", self._mmap[len(ATLAS_MAGIC):header_size])
+        index = json.loads(self._mmap[header_size:header_size + index_length].decode("utf-8"))
+        if index.get("version") != ATLAS_VERSION or index.get("format") != "RGBA":
+            self.close()
+            raise ValueError(f"Unsupported sprite atlas version/format: {path}")
+
+        self.width = index["width"]
+        self.height = index["height"]
+        self.rects = {}
+        for name, frames in index["sprites"].items():
+            self.rects[name] = {int(frame): pygame.Rect(rect) for frame, rect in frames.items()}
+
+        # Wrap the whole sheet in one surface that points straight at the mapping
+        pixel_offset = _align(header_size + index_length)
+        pixel_size = self.width * self.height * 4
+        self.sheet = pygame.image.frombuffer(
+            memoryview(self._mmap)[pixel_offset:pixel_offset + pixel_size],
+            (self.width, self.height), "RGBA")
+        self._frames = {}
+
+    def has_sprite(self, name):
+        """Check if the atlas contains frames for a Digimon"""
+        return name in self.rects
+
+    def frame_numbers(self, name):
+        """Return the sorted frame numbers available for a Digimon"""
+        return sorted(self.rects.get(name, {}))
+
+    def get_frame(self, name, frame_num):
+        """Return a subsurface for (name, frame_num), or None if not packed"""
+        key = (name, frame_num)
+        frame = self._frames.get(key)
+        if frame is None:
+            rect = self.rects.get(name, {}).get(frame_num)
+            if rect is None:
+                return None
+            frame = self.sheet.subsurface(rect)
+            self._frames[key] = frame
+        return frame
+
+    def close(self):
+        """Release the mapping (surfaces handed out become invalid)"""
+        self._frames = {}
+        self.sheet = None
+        try:
+            self._mmap.close()
+        except (BufferError, ValueError):
+            # Surfaces still reference the mapping; it is freed with them
+            pass
+        self._file.close()
+
+
+def _align(offset):
+    return (offset + ATLAS_ALIGNMENT - 1) // ATLAS_ALIGNMENT * ATLAS_ALIGNMENT
+
+
+def atlas_path_for_folder(sprite_folder):
+    """Return the atlas path covering a Digimon sprite folder"""
+    return os.path.join(os.path.dirname(os.path.normpath(sprite_folder)), SPRITE_ATLAS_NAME)
+
+
+def get_atlas(atlas_path):
+    """Return the opened atlas at atlas_path (cached), or None if unavailable"""
+    if atlas_path in _open_atlases:
+        return _open_atlases[atlas_path]
+
+    atlas = None
+    if os.path.exists(atlas_path):
+        try:
+            atlas = SpriteAtlas(atlas_path)
+            print(f"Loaded sprite atlas: {atlas_path} ({len(atlas.rects)} Digimon)")
+        except Exception as e:
+            print(f"Could not load sprite atlas {atlas_path}: {e}")
+    _open_atlases[atlas_path] = atlas
+    return atlas
+
+
+def sprite_frame_region(sprite_folder, frame_num):
+    """
+    Return (sheet, rect) locating frame_num of the Digimon in sprite_folder in
+    its source folder's atlas, or None if the frame is not packed. Renderers
+    that draw from whole sheets (see texture_renderer) use this.
+    """
+    atlas = get_atlas(atlas_path_for_folder(sprite_folder))
+    if atlas is None:
+        return None
+    rect = atlas.rects.get(os.path.basename(os.path.normpath(sprite_folder)), {}).get(frame_num)
+    if rect is None:
+        return None
+    return atlas.sheet, rect
+
+
+def load_sprite_frame(sprite_folder, frame_num, loader=None):
+    """
+    Load frame_num of the Digimon in sprite_folder.
+    Uses the source folder's atlas when present, otherwise decodes the PNG
+    (picking up a decode prefetched on loader, see asset_loader.load_image).
+    Returns None if the frame does not exist.
+    """
+    atlas = get_atlas(atlas_path_for_folder(sprite_folder))
+    name = os.path.basename(os.path.normpath(sprite_folder))
+    if atlas is not None and atlas.has_sprite(name):
+        return atlas.get_frame(name, frame_num)
+
+    frame_path = os.path.join(sprite_folder, f"{frame_num}.png")
+    if os.path.exists(frame_path):
+        return load_image(frame_path, loader)
+    return None
+
+
+def load_sprite_file(frame_path):
+    """load_sprite_frame for a <sprite folder>/<frame number>.png path"""
+    sprite_folder, file_name = os.path.split(frame_path)
+    return load_sprite_frame(sprite_folder, int(os.path.splitext(file_name)[0]))
+
+
+def sprite_frame_paths(sprite_folder, frame_nums):
+    """
+    Return the PNG paths load_sprite_frame would decode for frame_nums
+    (none if an atlas covers the folder). frame_nums must exist on disk.
+    """
+    atlas = get_atlas(atlas_path_for_folder(sprite_folder))
+    if atlas is not None and atlas.has_sprite(os.path.basename(os.path.normpath(sprite_folder))):
+        return []
+    return [os.path.join(sprite_folder, f"{frame_num}.png") for frame_num in frame_nums]
+
+
+def close_atlases():
+    """Close every opened atlas"""
+    for atlas in _open_atlases.values():
+        if atlas is not None:
+            atlas.close()
+    _open_atlases.clear()
+
+
+def build_atlas(source_dir, output_path=None):
+    """
+    Pack every <name>_dmc folder in source_dir into one atlas file.
+    Returns the output path, or None if the folder has no sprites.
+    """
+    if output_path is None:
+        output_path = os.path.join(source_dir, SPRITE_ATLAS_NAME)
+
+    # Decode every frame once, one Digimon per sheet row
+    rows = []
+    cell_width = 0
+    cell_height = 0
+    for folder in sorted(os.listdir(source_dir)):
+        folder_path = os.path.join(source_dir, folder)
+        if not folder.endswith("_dmc") or not os.path.isdir(folder_path):
+            continue
+        frames = {}
+        for frame_num in range(MAX_FRAMES):
+            frame_path = os.path.join(folder_path, f"{frame_num}.png")
+            if os.path.exists(frame_path):
+                frame = pygame.image.load(frame_path)
+                frames[frame_num] = frame
+                cell_width = max(cell_width, frame.get_width())
+                cell_height = max(cell_height, frame.get_height())
+        if frames:
+            rows.append((folder, frames))
+
+    if not rows:
+        return None
+
+    width = cell_width * MAX_FRAMES
+    height = cell_height * len(rows)
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+    sheet.fill((0, 0, 0, 0))
+
+    sprites = {}
+    for row, (name, frames) in enumerate(rows):
+        sprites[name] = {}
+        for frame_num, frame in frames.items():
+            x = frame_num * cell_width
+            y = row * cell_height
+            # RGBA_MAX onto the cleared sheet copies pixels exactly (no alpha blending)
+            sheet.blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            sprites[name][str(frame_num)] = [x, y, frame.get_width(), frame.get_height()]
+
+    index = json.dumps({
+        "version": ATLAS_VERSION,
+        "width": width,
+        "height": height,
+        "format": "RGBA",
+        "sprites": sprites,
+    }, separators=(",", ":")).encode("utf-8")
+
+    header_size = len(ATLAS_MAGIC) + 4 + len(index)
+    padding = _align(header_size) - header_size
+
+    # Write to a temporary file first so a running game never maps a partial atlas
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(ATLAS_MAGIC)
+        f.write(struct.pack("<I", len(index)))
+        f.write(index)
+        f.write(b"\x00" * padding)
+        f.write(pygame.image.tostring(sheet, "RGBA"))
+    os.replace(temp_path, output_path)
+
+    # Drop a stale cached handle for this path
+    stale = _open_atlases.pop(output_path, None)
+    if stale is not None:
+        stale.close()
+    return output_path
+
+
+def build_all_atlases(sprites_dir):
+    """Build one atlas per source folder under sprites_dir, returns the paths written"""
+    written = []
+    if not os.path.exists(sprites_dir):
+        return written
+    # Digimon folders placed directly in sprites_dir get an atlas of their own
+    atlas_path = build_atlas(sprites_dir)
+    if atlas_path:
+        written.append(atlas_path)
+    for folder in sorted(os.listdir(sprites_dir)):
+        folder_path = os.path.join(sprites_dir, folder)
+        if os.path.isdir(folder_path) and not folder.endswith("_dmc"):
+            atlas_path = build_atlas(folder_path)
+            if atlas_path:
+                written.append(atlas_path)
+    return written
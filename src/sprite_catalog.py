@@ -0,0 +1,161 @@
+"""
+Shared sprite catalog.
+
+Walks assets/sprites once - both <name>_dmc folders placed directly in the
+sprites directory and those inside source folders like "Digimon Color Ver. 1" -
+and records name -> folder path -> available frame numbers. The result is
+persisted next to the sprites directory (assets/.sprites_catalog.json) together
+with the mtime of every directory it read, so later launches only stat the directories
+instead of listing folders and probing frame files one by one.
+
+When the same Digimon exists in several sources the folder that sorts last
+wins, matching the game's original "later paths overwrite earlier" rule.
+"""
+
+import json
+import os
+
+CATALOG_VERSION = 1
+WALKING_FRAMES = (0, 1)  # A Digimon needs these to be playable
+
+# Catalogs already loaded in this process, keyed by absolute sprites dir
+_catalogs = {}
+
+
+class SpriteCatalog:
+    def __init__(self, sprites_dir, sprites, dir_mtimes):
+        self.sprites_dir = sprites_dir
+        self.sprites = sprites  # name -> {"path": relative folder path, "frames": [frame numbers]}
+        self.dir_mtimes = dir_mtimes  # relative dir path -> st_mtime_ns
+
+    def names(self):
+        """Return every Digimon name in the catalog, sorted"""
+        return sorted(self.sprites)
+
+    def available_digimon(self, required_frames=WALKING_FRAMES):
+        """Return the sorted names of Digimon that have all required_frames"""
+        return sorted(name for name in self.sprites if self.has_frames(name, required_frames))
+
+    def path(self, name):
+        """Return the absolute sprite folder of a Digimon, or None"""
+        entry = self.sprites.get(name)
+        if entry is None:
+            return None
+        return os.path.join(self.sprites_dir, entry["path"])
+
+    def paths(self, names=None):
+        """Return a name -> absolute sprite folder mapping"""
+        if names is None:
+            names = self.sprites
+        return {name: self.path(name) for name in names if name in self.sprites}
+
+    def frames(self, name):
+        """Return the sorted frame numbers available for a Digimon"""
+        entry = self.sprites.get(name)
+        return list(entry["frames"]) if entry else []
+
+    def has_frames(self, name, frame_nums):
+        """Check if a Digimon has every frame in frame_nums"""
+        entry = self.sprites.get(name)
+        return entry is not None and all(frame_num in entry["frames"] for frame_num in frame_nums)
+
+    def to_json(self):
+        return {
+            "version": CATALOG_VERSION,
+            "dirs": self.dir_mtimes,
+            "sprites": self.sprites,
+        }
+
+
+def _frame_numbers(folder_path):
+    frames = []
+    for file_name in os.listdir(folder_path):
+        stem, ext = os.path.splitext(file_name)
+        if ext.lower() == ".png" and stem.isdigit():
+            frames.append(int(stem))
+    return sorted(frames)
+
+
+def scan_sprites(sprites_dir):
+    """Walk sprites_dir and build a fresh catalog"""
+    sprites = {}
+    dir_mtimes = {}
+    if not os.path.isdir(sprites_dir):
+        return SpriteCatalog(sprites_dir, sprites, dir_mtimes)
+
+    def add_digimon(relative_path):
+        folder_path = os.path.join(sprites_dir, relative_path)
+        dir_mtimes[relative_path] = os.stat(folder_path).st_mtime_ns
+        frames = _frame_numbers(folder_path)
+        if frames:
+            sprites[os.path.basename(relative_path)] = {"path": relative_path, "frames": frames}
+
+    dir_mtimes["."] = os.stat(sprites_dir).st_mtime_ns
+    for folder in sorted(os.listdir(sprites_dir)):
+        folder_path = os.path.join(sprites_dir, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        if folder.endswith("_dmc"):
+            add_digimon(folder)
+        else:
+            # Source folder (like "Digimon Color Ver. 1")
+            dir_mtimes[folder] = os.stat(folder_path).st_mtime_ns
+            for subfolder in sorted(os.listdir(folder_path)):
+                relative_path = os.path.join(folder, subfolder)
+                if subfolder.endswith("_dmc") and os.path.isdir(os.path.join(sprites_dir, relative_path)):
+                    add_digimon(relative_path)
+
+    return SpriteCatalog(sprites_dir, sprites, dir_mtimes)
+
+
+def _cache_is_fresh(sprites_dir, dir_mtimes):
+    try:
+        for relative_path, mtime in dir_mtimes.items():
+            if os.stat(os.path.join(sprites_dir, relative_path)).st_mtime_ns != mtime:
+                return False
+    except OSError:
+        return False
+    return bool(dir_mtimes)
+
+
+def catalog_path_for(sprites_dir):
+    """Return where the catalog of sprites_dir is persisted"""
+    # Kept outside sprites_dir so writing it does not change the mtimes it records
+    sprites_dir = os.path.abspath(sprites_dir)
+    return os.path.join(os.path.dirname(sprites_dir), f".{os.path.basename(sprites_dir)}_catalog.json")
+
+
+def load_catalog(sprites_dir, use_cache=True):
+    """
+    Return the sprite catalog for sprites_dir.
+    Uses the persisted catalog when no directory changed since it was written,
+    otherwise rescans and rewrites it.
+    """
+    sprites_dir = os.path.abspath(sprites_dir)
+    if use_cache and sprites_dir in _catalogs:
+        return _catalogs[sprites_dir]
+
+    cache_path = catalog_path_for(sprites_dir)
+    catalog = None
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == CATALOG_VERSION and _cache_is_fresh(sprites_dir, data["dirs"]):
+                catalog = SpriteCatalog(sprites_dir, data["sprites"], data["dirs"])
+        except (json.JSONDecodeError, KeyError, OSError) as e:
+            print(f"Ignoring unreadable sprite catalog {cache_path}: {e}")
+
+    if catalog is None:
+        catalog = scan_sprites(sprites_dir)
+        if catalog.dir_mtimes:
+            try:
+                with open(cache_path, 'w') as f:
+                    json.dump(catalog.to_json(), f, separators=(",", ":"))
+            except OSError as e:
+                # Read-only installs still work, they just rescan every launch
+                print(f"Could not save sprite catalog: {e}")
+        print(f"Scanned sprites: {len(catalog.sprites)} Digimon")
+
+    _catalogs[sprites_dir] = catalog
+    return catalog
@@ -0,0 +1,183 @@
+"""
+Startup timeline profiler.
+
+Phases are recorded with mark(name) when they end, as monotonic timestamps.
+Marking is always on (one list append per phase); counting file opens and
+decoded bytes needs hooks around open() and pygame's image functions, which
+are only installed while a StartupProfiler is active:
+
+    python src/main.py --profile-startup [startup_profile.json]
+
+prints a table of every phase from process start to the first
+pygame.display.flip() and writes the same data as JSON, so runs on
+different boards or asset layouts can be compared.
+"""
+
+import builtins
+import json
+import mmap
+import os
+import platform
+import sys
+import threading
+import time
+
+# (phase name, monotonic end time, file opens so far, decoded bytes so far)
+_marks = []
+
+# Profiler whose counters marks snapshot (None when not profiling)
+_active_profiler = None
+
+
+def process_start_time():
+    """
+    Return the monotonic time at which this process started, or None where
+    that cannot be read (only Linux /proc is supported).
+    """
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # The command name may contain spaces, fields are counted after it
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, IndexError, ValueError):
+        return None
+    started_after_boot = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    return time.monotonic() - (uptime - started_after_boot)
+
+
+# Read once at import: main.py imports this module first
+_process_start = process_start_time()
+
+
+def mark(name):
+    """Record that the startup phase called name has just ended"""
+    profiler = _active_profiler
+    if profiler is not None:
+        _marks.append((name, time.monotonic(), profiler.file_opens, profiler.decoded_bytes))
+    else:
+        _marks.append((name, time.monotonic(), 0, 0))
+
+
+def get_active_profiler():
+    """Return the running StartupProfiler, or None"""
+    return _active_profiler
+
+
+def _is_path(value):
+    return isinstance(value, (str, bytes, os.PathLike))
+
+
+class StartupProfiler:
+    def __init__(self, output_path="startup_profile.json"):
+        self.output_path = output_path
+        self.file_opens = 0
+        self.decoded_bytes = 0
+        self._lock = threading.Lock()  # Asset loader workers open files too
+        self._originals = None
+
+    def count(self, opens=0, decoded_bytes=0):
+        with self._lock:
+            self.file_opens += opens
+            self.decoded_bytes += decoded_bytes
+
+    def install(self):
+        """Start counting file opens and decoded bytes"""
+        global _active_profiler
+        import pygame
+
+        if self._originals is not None:
+            return
+        original_open = builtins.open
+        original_load = pygame.image.load
+        original_frombuffer = pygame.image.frombuffer
+        self._originals = (original_open, original_load, original_frombuffer)
+
+        def counting_open(file, *args, **kwargs):
+            self.count(opens=1)
+            return original_open(file, *args, **kwargs)
+
+        def counting_load(file, *args, **kwargs):
+            surface = original_load(file, *args, **kwargs)
+            # SDL opens paths itself, file objects were counted by open()
+            self.count(opens=1 if _is_path(file) else 0,
+                       decoded_bytes=surface.get_width() * surface.get_height() * surface.get_bytesize())
+            return surface
+
+        def counting_frombuffer(buffer, *args, **kwargs):
+            surface = original_frombuffer(buffer, *args, **kwargs)
+            # Sprite atlases are memory-mapped pixels, nothing was decoded
+            if not isinstance(getattr(buffer, "obj", buffer), mmap.mmap):
+                self.count(decoded_bytes=surface.get_width() * surface.get_height() * surface.get_bytesize())
+            return surface
+
+        builtins.open = counting_open
+        pygame.image.load = counting_load
+        pygame.image.frombuffer = counting_frombuffer
+        _active_profiler = self
+
+    def uninstall(self):
+        """Remove the counting hooks"""
+        global _active_profiler
+        import pygame
+
+        if self._originals is None:
+            return
+        builtins.open, pygame.image.load, pygame.image.frombuffer = self._originals
+        self._originals = None
+        if _active_profiler is self:
+            _active_profiler = None
+
+    def phases(self):
+        """Return every recorded phase with its start, duration and counters"""
+        phases = []
+        if not _marks:
+            return phases
+        if _process_start is not None:
+            previous = (_process_start, 0, 0)
+            marks = _marks
+        else:
+            # Without a process start time the first mark only opens the timeline
+            previous = _marks[0][1:]
+            marks = _marks[1:]
+        timeline_start = previous[0]
+        for name, end, opens, decoded_bytes in marks:
+            phases.append({
+                "name": name,
+                "start_ms": (previous[0] - timeline_start) * 1000,
+                "duration_ms": (end - previous[0]) * 1000,
+                "file_opens": opens - previous[1],
+                "decoded_bytes": decoded_bytes - previous[2],
+            })
+            previous = (end, opens, decoded_bytes)
+        return phases
+
+    def report(self):
+        """Print the startup timeline as a table"""
+        phases = self.phases()
+        print(f"Startup profile ({platform.machine()}, Python {platform.python_version()}):")
+        print(f"  {'phase':<22} {'start ms':>9} {'ms':>9} {'opens':>6} {'decoded KiB':>12}")
+        for phase in phases:
+            print(f"  {phase['name']:<22} {phase['start_ms']:9.1f} {phase['duration_ms']:9.1f} "
+                  f"{phase['file_opens']:6d} {phase['decoded_bytes'] / 1024:12.1f}")
+        total_ms = sum(phase["duration_ms"] for phase in phases)
+        total_opens = sum(phase["file_opens"] for phase in phases)
+        total_bytes = sum(phase["decoded_bytes"] for phase in phases)
+        print(f"  {'total':<22} {'':>9} {total_ms:9.1f} {total_opens:6d} {total_bytes / 1024:12.1f}")
+
+    def to_json(self):
+        return {
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "argv": sys.argv,
+            "process_start_known": _process_start is not None,
+            "phases": self.phases(),
+        }
+
+    def write_json(self, path=None):
+        """Write the timeline as JSON (to output_path by default)"""
+        path = path or self.output_path
+        with open(path, "w") as f:
+            json.dump(self.to_json(), f, indent=2)
+        print(f"Startup profile written to {path}")
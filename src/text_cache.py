@@ -0,0 +1,72 @@
+"""
+LRU cache of rendered text.
+
+font.render() is one of the most expensive calls on the Pi, and the UI keeps
+rendering the same labels (Digimon names, filter captions, page indicators).
+Rendered surfaces are kept by (font, text, color, antialias) and the least
+recently used ones are dropped once more than capacity are held.
+
+Usage:
+    text = get_text_cache()
+    surface = text.render(font, "Agumon", (40, 40, 40))
+
+Cached surfaces are shared, so callers must not draw onto them.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_CAPACITY = 256  # Labels kept; a page of UI needs a few dozen
+
+# Cache shared by the whole process (see get_text_cache)
+_cache = None
+
+
+class TextCache:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = max(1, capacity)
+        self._surfaces = OrderedDict()  # (font, text, color, antialias) -> Surface, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Return font.render(text, antialias, color), rendering only on a miss"""
+        key = (font, text, tuple(color), bool(antialias))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self.misses += 1
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def hit_rate(self):
+        """Fraction of render() calls served from the cache (0.0 before any call)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Return hit/miss/eviction counters, the hit rate and the number of cached surfaces"""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hit_rate(), "surfaces": len(self._surfaces)}
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+def get_text_cache():
+    """Return the process-wide TextCache"""
+    global _cache
+    if _cache is None:
+        _cache = TextCache()
+    return _cache
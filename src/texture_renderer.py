@@ -0,0 +1,108 @@
+"""
+SDL2 texture render backend (--renderer texture).
+
+The surface backend composes every frame in a software Surface and flips
+it. This backend uploads images once as textures and lets SDL's renderer
+copy them to the window instead:
+    - backgrounds, food and heart images are uploaded the first time they are
+      drawn and their textures live as long as the surfaces do
+    - Digimon frames are copied straight out of their source folder's atlas
+      sheet (one texture per sheet) by source rect, and turned around with the
+      flip flag, so no mirrored surfaces are needed
+    - the selection UI and performance HUD still draw with surface calls onto
+      a transparent overlay canvas, uploaded only on frames where one is shown
+
+The canvas stays SCREEN_WIDTH x SCREEN_HEIGHT; the renderer's logical size
+scales and letterboxes it to the window. TextureRenderer.blit() takes the
+same arguments as Surface.blit(), so sprite draw() methods work with both.
+
+pygame._sdl2.video ships with pygame 2 but is not a stable pygame API; when it
+is missing the game stays on the surface backend.
+"""
+
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:
+    Renderer = Texture = Window = None
+
+RENDERERS = ("surface", "texture")
+BLEND_MODE_BLEND = 1  # SDL_BLENDMODE_BLEND
+
+
+def texture_backend_available():
+    """True if this pygame build has the SDL2 Renderer/Texture API"""
+    return Renderer is not None
+
+
+class TextureRenderer:
+    def __init__(self, title, canvas_size, window_size=None, fullscreen=False, software=False):
+        """
+        Open a window with an SDL renderer. software=True forces SDL's software
+        renderer (headless boxes); otherwise SDL picks the best one available.
+        """
+        self.canvas_size = canvas_size
+        if fullscreen:
+            self.window = Window(title, window_size or canvas_size, fullscreen_desktop=True)
+        else:
+            self.window = Window(title, window_size or canvas_size)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1)
+        self.renderer.logical_size = canvas_size  # SDL scales and letterboxes the canvas
+        self.renderer.draw_color = (0, 0, 0, 255)
+
+        self.textures = weakref.WeakKeyDictionary()  # Surface -> its uploaded texture
+        self.uploads = 0
+        self.overlay_texture = None  # Streaming texture for the overlay canvas
+
+    def present_rect(self):
+        """Where the canvas lands in the window, and its scale (matches SDL's logical size mapping)"""
+        window_width, window_height = self.window.size
+        canvas_width, canvas_height = self.canvas_size
+        scale = min(window_width / canvas_width, window_height / canvas_height)
+        rect = pygame.Rect(0, 0, int(canvas_width * scale), int(canvas_height * scale))
+        rect.center = (window_width // 2, window_height // 2)
+        return rect, scale
+
+    def texture(self, surface):
+        """Return the texture for a surface, uploading it on first use"""
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)  # Keeps the surface's alpha and blend mode
+            self.textures[surface] = texture
+            self.uploads += 1
+        return texture
+
+    def blit(self, source, dest, area=None):
+        """Copy a surface (or area of it) to dest on the canvas like Surface.blit, return the area covered"""
+        return self.copy(source, area, pygame.Rect(dest, (area or source.get_rect()).size))
+
+    def copy(self, source, area, dest_rect, flip_x=False):
+        """Copy area of source (all of it for None) scaled into dest_rect, mirrored when flip_x"""
+        self.texture(source).draw(area, dest_rect, flip_x=flip_x)
+        return dest_rect
+
+    def clear(self):
+        """Start a frame (the letterbox bars stay black)"""
+        self.renderer.clear()
+
+    def draw_overlay(self, overlay):
+        """Upload the transparent overlay canvas and draw it over the frame"""
+        if self.overlay_texture is None:
+            self.overlay_texture = Texture(self.renderer, overlay.get_size(), streaming=True)
+            self.overlay_texture.blend_mode = BLEND_MODE_BLEND
+        self.overlay_texture.update(overlay)
+        self.overlay_texture.draw()
+
+    def present(self):
+        """Show the frame"""
+        self.renderer.present()
+
+    def to_surface(self):
+        """Read the last frame back into a Surface (slow; for tests and screenshots)"""
+        return self.renderer.to_surface()
+
+    def __len__(self):
+        return len(self.textures)
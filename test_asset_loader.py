@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for parallel asset loading
+Checks that images decoded on the worker pool come back identical to a
+direct pygame.image.load, and that phases are timed.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the loader
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from asset_loader import AssetLoader, load_image
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+def test_prefetched_images_match_direct_load():
+    """Worker-decoded images equal directly loaded ones"""
+    print("=== Testing Parallel Asset Loading ===")
+    paths = [
+        os.path.join(ASSETS_DIR, "food", "sushi.png"),
+        os.path.join(ASSETS_DIR, "food", "meat.png"),  # Palette image
+        os.path.join(ASSETS_DIR, "others", "heart.png"),
+    ]
+    
+    loader = AssetLoader(max_workers=2)
+    loader.activate()
+    try:
+        loader.prefetch_images(paths)
+        with loader.phase("images"):
+            for path in paths:
+                assert loader.has_pending(path)
+                prefetched = load_image(path)
+                assert not loader.has_pending(path)
+                direct = pygame.image.load(path)
+                assert prefetched.get_size() == direct.get_size()
+                assert pygame.image.tostring(prefetched, "RGBA") == pygame.image.tostring(direct, "RGBA")
+    finally:
+        loader.shutdown()
+    
+    assert loader.used == len(paths)
+    assert [name for name, _ in loader.phase_times] == ["images"]
+    print(f"   ✅ {loader.used} prefetched images match pygame.image.load")
+    print()
+
+def test_single_core_loader_loads_directly():
+    """A loader without workers still serves every image"""
+    loader = AssetLoader(max_workers=0)
+    loader.activate()
+    try:
+        path = os.path.join(ASSETS_DIR, "food", "sushi.png")
+        loader.prefetch_images([path])
+        assert not loader.has_pending(path)
+        assert load_image(path).get_size() == pygame.image.load(path).get_size()
+    finally:
+        loader.shutdown()
+
+def main():
+    """Run all tests"""
+    test_prefetched_images_match_direct_load()
+    test_single_core_loader_loads_directly()
+    print("🎯 Asset loader tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared asset manager
+Checks that surfaces are shared per (path, transform), that hits and misses
+are counted, and that releasing the last reference frees a surface.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the manager
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from asset_manager import AssetManager
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+HEART_PATH = os.path.join(ASSETS_DIR, "others", "heart.png")
+HEART_TRANSFORM = (("shrink", 30, (25, 25)),)
+
+def test_surfaces_are_shared():
+    """Two owners asking for the same key get the same surface without a second load"""
+    print("=== Testing Shared Asset Manager ===")
+    manager = AssetManager()
+    first = manager.scope()
+    second = manager.scope()
+
+    heart = first.get(HEART_PATH, HEART_TRANSFORM)
+    assert heart.get_size() == (25, 25)
+    assert second.get(HEART_PATH, HEART_TRANSFORM) is heart
+    # Base image plus the shrunk one were loaded once, the second owner was a hit
+    assert manager.stats() == {"hits": 1, "misses": 2, "surfaces": 2}
+    print(f"   ✅ Heart shared between owners: {manager.stats()}")
+
+    # The unscaled base is already cached too
+    assert first.get(HEART_PATH).get_size() == (48, 48)
+    assert manager.hits == 2
+    print()
+
+def test_release_frees_last_reference():
+    """Surfaces stay cached while anyone holds them"""
+    manager = AssetManager()
+    old_pet = manager.scope()
+    new_pet = manager.scope()
+
+    old_pet.get(HEART_PATH, HEART_TRANSFORM)
+    new_pet.get(HEART_PATH, HEART_TRANSFORM)  # Swap: new pet loads before the old one releases
+    old_pet.release()
+    assert (HEART_PATH, HEART_TRANSFORM) in manager
+
+    new_pet.release()
+    assert len(manager) == 0, "Derived and base surfaces should both be freed"
+    print("   ✅ Released surfaces are freed with their last reference")
+
+def test_missing_files_are_not_cached():
+    """A loader returning None yields None and caches nothing"""
+    manager = AssetManager()
+    assert manager.get("missing.png", (), lambda path: None) is None
+    assert len(manager) == 0 and manager.misses == 0
+    print("   ✅ Missing files are not cached")
+
+def test_rle_step_keeps_pixels():
+    """The RLE copy blits like its source and keeps its alpha"""
+    manager = AssetManager()
+    faded = manager.get(HEART_PATH, HEART_TRANSFORM + (("alpha", 128),))
+    accelerated = manager.get(HEART_PATH, HEART_TRANSFORM + (("alpha", 128), ("rle",)))
+    assert accelerated is not faded and accelerated.get_alpha() == 128
+    expected = pygame.Surface((25, 25))
+    expected.blit(faded, (0, 0))
+    result = pygame.Surface((25, 25))
+    result.blit(accelerated, (0, 0))
+    # SDL's RLE blitter may round blended edges differently by one level
+    expected_bytes = pygame.image.tostring(expected, "RGB")
+    result_bytes = pygame.image.tostring(result, "RGB")
+    assert max(abs(a - b) for a, b in zip(expected_bytes, result_bytes)) <= 1
+    print("   ✅ RLE-accelerated copies blit like their source")
+
+def main():
+    """Run all tests"""
+    test_surfaces_are_shared()
+    test_release_frees_last_reference()
+    test_missing_files_are_not_cached()
+    test_rle_step_keeps_pixels()
+    print("🎯 Asset manager tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the lazy background store
+Checks that backgrounds are only decoded on demand and that the LRU cache
+never holds more than its configured number of surfaces.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the background store
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from background_store import BackgroundStore
+
+BACKGROUND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "background")
+
+def test_lazy_lru_loading():
+    """Backgrounds decode on demand and the cache stays bounded"""
+    print("=== Testing Lazy Background Store ===")
+    store = BackgroundStore(BACKGROUND_DIR, (480, 320), cache_size=2)
+    assert len(store) >= 3
+    assert store.decode_count == 0  # Listing files decodes nothing
+    
+    first = store.get(0)
+    assert first.get_size() == (480, 320)
+    assert store.get(0) is first  # Cache hit returns the same surface
+    assert store.decode_count == 1 and store.hit_count == 1
+    
+    store.get(1)
+    store.get(2)  # Evicts 0, the least recently used
+    assert store.cached_indices() == [1, 2]
+    assert store.decode_count == 3
+    
+    assert store.get(len(store)) is None  # Out of range
+    print(f"   ✅ {store.decode_count} decodes for {len(store)} backgrounds, cache {store.cached_indices()}")
+    print()
+
+def test_reduced_decode_matches_full_decode():
+    """The Pillow reduced-size decode gives the same picture as the pygame path"""
+    print("=== Testing Reduced Background Decode ===")
+    import pygame
+    from background_store import Image, list_background_files, load_scaled_background
+    
+    if Image is None:
+        print("   ⚠️  Pillow not installed, skipping")
+        return
+    
+    for bg_file in list_background_files(BACKGROUND_DIR):
+        bg_path = os.path.join(BACKGROUND_DIR, bg_file)
+        reduced = load_scaled_background(bg_path, (480, 320))
+        full = load_scaled_background(bg_path, (480, 320), reduced_decode=False)
+        assert reduced.get_size() == full.get_size() == (480, 320)
+        
+        # Compare average colours; resampling differs, the picture must not
+        reduced_avg = pygame.transform.average_color(reduced)
+        full_avg = pygame.transform.average_color(full)
+        assert all(abs(a - b) <= 8 for a, b in zip(reduced_avg[:3], full_avg[:3])), bg_file
+    print("   ✅ Reduced decode matches full decode for every background")
+    print()
+
+def main():
+    """Run all tests"""
+    test_lazy_lru_loading()
+    test_reduced_decode_matches_full_decode()
+    print("🎯 Background store tests completed!")
+
+if __name__ == "__main__":
+    main()
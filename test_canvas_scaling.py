@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test script for presenting the fixed canvas
+Checks that the 480x320 canvas is shown with one integer scale,
+letterboxed in the window, and that taps are mapped back to the canvas.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import VPetGame
+
+def test_integer_scale_is_letterboxed():
+    """A 1000x700 window shows the canvas at 2x, centered"""
+    print("=== Testing Canvas Scaling ===")
+    game = VPetGame(headless=True, scale_mode="integer", window_size=(1000, 700))
+    assert game.present_scale == 2 and game.present_rect.topleft == (20, 30)
+    game.draw()
+    expected = pygame.transform.scale(game.screen, game.present_rect.size)
+    presented = game.display.subsurface(game.present_rect)
+    assert pygame.image.tostring(expected, "RGB") == pygame.image.tostring(presented, "RGB")
+    print("   ✅ Canvas is presented with one integer scale")
+
+def test_taps_map_back_to_canvas():
+    """Window corners of the scaled canvas map to canvas corners"""
+    game = VPetGame(headless=True, scale_mode="integer", window_size=(1000, 700))
+    assert game.canvas_position((21, 31)) == (0, 0)
+    assert game.canvas_position((979, 669)) == (479, 319)
+    print("   ✅ Input is mapped back to the canvas")
+
+def main():
+    """Run all tests"""
+    test_integer_scale_is_letterboxed()
+    test_taps_map_back_to_canvas()
+    print("🎯 Canvas scaling tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -87,20 +87,13 @@ def test_sprite_folders():
         print("   ❌ Sprites directory not found")
         return
     
-    digimon_count = 0
-    valid_digimon = 0
-    
-    for folder in os.listdir(sprites_dir):
-        if folder.endswith("_dmc"):
-            digimon_count += 1
-            folder_path = os.path.join(sprites_dir, folder)
-            
-            # Check for required animation frames
-            frame_0 = os.path.join(folder_path, "0.png")
-            frame_1 = os.path.join(folder_path, "1.png")
-            
-            if os.path.exists(frame_0) and os.path.exists(frame_1):
-                valid_digimon += 1
+    # Use the same catalog as the game so source subfolders are included
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+    from sprite_catalog import load_catalog
+    
+    catalog = load_catalog(sprites_dir)
+    digimon_count = len(catalog.names())
+    valid_digimon = len(catalog.available_digimon())  # Has walking frames 0 and 1
     
     print(f"   Found {digimon_count} Digimon folders")
     print(f"   Valid Digimon (with walking frames): {valid_digimon}")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test script for dirty-rect rendering
+Checks that frames which only repaint the areas sprites covered end up
+with the same pixels as full redraws.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import VPetGame
+
+def test_dirty_frames_match_full_redraw():
+    """After a walk, the screen equals the background with every pet drawn on it"""
+    print("=== Testing Dirty-Rect Rendering ===")
+    game = VPetGame(headless=True, dirty_rects=True)
+    game.pets[0].wake_up()
+    for _ in range(20):
+        game.update()
+        game.draw()
+    reference = game.background.convert(game.screen)  # Blend in the screen's pixel format
+    for pet in game.pets:
+        pet.draw(reference)
+    assert pygame.image.tostring(reference, "RGB") == pygame.image.tostring(game.screen, "RGB")
+    print("   ✅ Dirty-rect rendering matches a full redraw")
+
+def main():
+    """Run all tests"""
+    test_dirty_frames_match_full_redraw()
+    print("🎯 Dirty-rect tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the fixed simulation timestep
+Checks that a long frame runs the steps it covers, that its catch-up steps
+play out as if the frames had come on time, and that frames drawn between
+steps interpolate sprite positions.
+"""
+
+import os
+import random
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import FOOD_LIFETIME, SIMULATION_STEP_MS, VPetGame
+
+def test_long_frame_runs_missed_steps():
+    """A 350 ms frame runs 3 steps of 100 ms and leaves the rest for interpolation"""
+    print("=== Testing Fixed Timestep ===")
+    game = VPetGame(headless=True)
+    game.frame_rate = 30
+    steps = []
+    game.step = lambda: steps.append(VPetGame.step(game))
+    game.accumulator = 0
+    game.last_step_time = pygame.time.get_ticks() - 350
+    game.advance_simulation()
+    assert len(steps) == 3 and 0.5 <= game.interpolation_alpha() < 1
+    print("   ✅ Simulation runs fixed steps for the time that passed")
+
+def play(frame_times):
+    """
+    Run a game through frames at the given wall clock times (ms) and return
+    what the world looked like after every step: food and pets with their hearts
+    """
+    random.seed(3)
+    game = VPetGame(headless=True)
+    game.frame_rate = 30
+    for digimon in game.pets:
+        digimon.wake_up()  # Shows a heart
+    game.drop_food(100, 50)
+    game.drop_food(300, 80)
+    
+    states = []
+    step = game.step
+    def record():
+        step()
+        states.append(([(food.rect.topleft, food.on_ground) for food in game.food_items],
+                       [(digimon.rect.topleft, digimon.state, digimon.heart_visible, digimon.heart_keyframe,
+                         digimon.heart_float_offset) for digimon in game.pets]))
+    game.step = record
+    
+    get_ticks = pygame.time.get_ticks
+    now = [0]
+    pygame.time.get_ticks = lambda: now[0]
+    try:
+        game.accumulator = 0
+        game.last_step_time = 0
+        for now[0] in frame_times:
+            game.advance_simulation()
+    finally:
+        pygame.time.get_ticks = get_ticks
+    return states
+
+def test_long_frame_catches_up_deterministically():
+    """A 3 s frame gives the same steps as thirty 100 ms frames, food expiry and hearts included"""
+    steps = FOOD_LIFETIME // SIMULATION_STEP_MS + 20
+    on_time = play([SIMULATION_STEP_MS * (frame + 1) for frame in range(steps)])
+    late = play([3000] + [3000 + SIMULATION_STEP_MS * (frame + 1) for frame in range(steps - 30)])
+    assert len(on_time) == len(late) == steps
+    for step, (expected, actual) in enumerate(zip(on_time, late)):
+        assert expected == actual, f"Step {step + 1} differs after a long frame"
+    assert on_time[FOOD_LIFETIME // SIMULATION_STEP_MS - 1][0] and not on_time[-1][0], "The food expired on the way"
+    print("   ✅ A long frame catches up to the same world as frames on time")
+
+def test_frames_interpolate_between_steps():
+    """Halfway through a step a pet is drawn halfway between its positions"""
+    game = VPetGame(headless=True)
+    pet = game.pets[0]
+    pet.previous_position = (pet.rect.x + 10, pet.rect.y)
+    assert pet.draw(game.screen, 0.5)[0].x == pet.rect.x + 5
+    print("   ✅ Frames interpolate between steps")
+
+def main():
+    """Run all tests"""
+    test_long_frame_runs_missed_steps()
+    test_long_frame_catches_up_deterministically()
+    test_frames_interpolate_between_steps()
+    print("🎯 Fixed timestep tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for the food pool
+Checks that food records are allocated once and reused, that the pool
+stops at its capacity and that removing swaps the last piece into the gap.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import FOOD_LIFETIME, FoodPool, VPetGame
+
+def test_pool_reuses_records():
+    """Dropping after a removal hands out the freed record again, reset"""
+    print("=== Testing Food Pool ===")
+    pool = FoodPool(pygame.Surface((30, 20)), 3)
+    records = list(pool.records)
+    first = pool.drop(100, 50, 0)
+    second = pool.drop(200, 60, 0)
+    third = pool.drop(300, 70, 0)
+    assert len(pool) == 3 and pool.drop(400, 80, 0) is None, "A full pool drops nothing"
+    assert list(pool) == [first, second, third]
+    assert first.rect.topleft == (85, 50)
+
+    first.consumed = True
+    first.on_ground = True
+    pool.remove(0)
+    assert list(pool) == [third, second], "The last piece moves into the gap"
+    again = pool.drop(250, 90, 5)
+    assert again is first and not again.consumed and not again.on_ground and again.creation_time == 5
+    assert sorted(map(id, pool.records)) == sorted(map(id, records)), "No new records"
+    print("   ✅ Records are reused and the pool stops at its capacity")
+
+def test_game_caps_and_expires_food():
+    """The game keeps at most max_food pieces and frees expired ones"""
+    game = VPetGame(headless=True, max_food=4)
+    for x in range(20, 220, 20):
+        game.drop_food(x, 100)
+    assert len(game.food_items) == 4
+    for food in game.food_items:
+        food.creation_time -= FOOD_LIFETIME + 1
+    game.update()
+    assert len(game.food_items) == 0
+    assert not any(digimon.target_food for digimon in game.pets)
+    game.drop_food(240, 100)
+    assert len(game.food_items) == 1
+    print("   ✅ Game drops at most max_food pieces and frees expired food")
+
+def main():
+    """Run all tests"""
+    test_pool_reuses_records()
+    test_game_caps_and_expires_food()
+    print("🎯 Food pool tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Test script for import safety and headless runs
+Checks that importing src/main.py initializes nothing and that the game
+runs headless for a fixed number of frames. Both run in a fresh
+interpreter, since the game quits pygame when it finishes.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(ROOT, "src", "main.py")
+
+def run_python(*args):
+    """Run a fresh interpreter in the project root, return (exit code, output)"""
+    result = subprocess.run([sys.executable] + list(args), cwd=ROOT, capture_output=True, text=True, timeout=120)
+    return result.returncode, result.stdout + result.stderr
+
+def test_import_has_no_side_effects():
+    """Importing main leaves SDL uninitialized"""
+    print("=== Testing Headless Mode ===")
+    code, output = run_python("-c", "import sys; sys.path.insert(0, 'src'); import pygame, main; "
+                                    "assert not pygame.display.get_init(); assert not pygame.font.get_init()")
+    assert code == 0, output
+    print("   ✅ Importing main initializes nothing")
+
+def test_headless_run_stops_after_frames():
+    """--headless --frames N runs without a display and returns"""
+    code, output = run_python(MAIN, "--headless", "--frames", "30")
+    assert code == 0, output
+    print("   ✅ Headless game ran 30 frames and exited")
+
+def main():
+    """Run all tests"""
+    test_import_has_no_side_effects()
+    test_headless_run_stops_after_frames()
+    print("🎯 Headless tests completed!")
+
+if __name__ == "__main__":
+    main()
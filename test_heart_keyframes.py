@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test script for the heart emote keyframes
+Checks that the faded heart surfaces are built once and shared by every
+pet, and that drawing a pet uses the keyframe for its point in the animation.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from main import VPetGame
+
+def test_keyframes_are_shared():
+    """Every pet holds the same pre-faded surfaces, from opaque to faded"""
+    print("=== Testing Heart Keyframes ===")
+    game = VPetGame(headless=True)
+    hearts1 = [surface for surface, _ in game.pets[0].heart_keyframes]
+    hearts2 = [surface for surface, _ in game.pets[1].heart_keyframes]
+    assert hearts1 and all(a is b for a, b in zip(hearts1, hearts2))
+    assert hearts1[0] is game.pets[0].heart_image and hearts1[-1].get_alpha() < 255
+    print(f"   ✅ Heart emote drawn from {len(set(map(id, hearts1)))} shared pre-faded surfaces")
+
+def test_draw_uses_current_keyframe():
+    """The heart is drawn with the current keyframe's surface, swayed by its offset"""
+    game = VPetGame(headless=True)
+    pet = game.pets[0]
+    pet.show_heart()
+    pet.heart_keyframe = len(pet.heart_keyframes) - 1
+    surface, sway_offset = pet.heart_keyframes[pet.heart_keyframe]
+    pet_rect, heart_rect = pet.draw(game.screen)
+    assert heart_rect.size == surface.get_size()
+    assert heart_rect.x == pet_rect.centerx - surface.get_width() // 2 + sway_offset
+    print("   ✅ Hearts are drawn from the current keyframe")
+
+def main():
+    """Run all tests"""
+    test_keyframes_are_shared()
+    test_draw_uses_current_keyframe()
+    print("🎯 Heart keyframe tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for idle mode
+Checks that the game idles when every pet sleeps and nothing was touched,
+waking for the next sleeping frame, and that any touch resumes ticking.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import VPetGame
+from pet_states import PetState, STATE_CLIPS
+
+def make_idle_game():
+    """A headless game pretending to be on screen, idle after 1 ms without input"""
+    game = VPetGame(headless=True, idle_after=1)
+    game.frame_rate = 10  # Headless games never idle
+    game.last_input_time -= 1
+    return game
+
+def test_sleeping_pets_idle_until_touched():
+    """Sleeping pets and no input idle; a touch leaves idle mode"""
+    print("=== Testing Idle Mode ===")
+    game = make_idle_game()
+    assert game.is_idle(), "Sleeping pets with no input should idle"
+    assert game.pets[0].ticks_until_animation_change() <= STATE_CLIPS[PetState.SLEEPING].delay
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, button=3, pos=(0, 0)))
+    game.idle_wait()  # Returns at once, the touch is left for handle_events
+    game.handle_events()
+    assert not game.is_idle(), "Input should leave idle mode"
+    print("   ✅ Idle mode waits for input while every pet sleeps")
+
+def test_awake_pet_or_food_prevents_idle():
+    """Anything that moves keeps the game ticking"""
+    game = make_idle_game()
+    game.pets[-1].wake_up()
+    assert not game.is_idle(), "An awake pet should keep the game ticking"
+
+    game = make_idle_game()
+    game.drop_food(200, 100)
+    assert not game.is_idle(), "Falling food should keep the game ticking"
+    print("   ✅ Awake pets and food keep the game ticking")
+
+def main():
+    """Run all tests"""
+    test_sleeping_pets_idle_until_touched()
+    test_awake_pet_or_food_prevents_idle()
+    print("🎯 Idle mode tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test script for precomputed mirrored frames
+Checks that turning a pet around swaps between frame lists prepared at
+load time instead of flipping surfaces.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from main import VPetGame
+
+def test_turning_reuses_mirrored_frames():
+    """Both orientations are ready-made lists; turning only picks one"""
+    print("=== Testing Mirrored Frames ===")
+    game = VPetGame(headless=True)
+    pet = game.pets[0]
+    pet.set_orientation(True)
+    facing_right = pet.frames
+    pet.set_orientation(False)
+    assert pet.frames is not facing_right
+    assert pet.frames is pet.clips["walking"][0]
+    pet.set_orientation(True)
+    assert pet.frames is facing_right and pet.frames[0] is not pet.clips["walking"][0][0]
+    print("   ✅ Turning around selects precomputed mirrored frames")
+
+def main():
+    """Run all tests"""
+    test_turning_reuses_mirrored_frames()
+    print("🎯 Mirrored frame tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for the performance HUD
+Checks the rolling statistics and that the overlay only draws (and only
+collects timings) while it is shown.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the HUD
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from perf_hud import PerfHUD, percentile, process_rss
+
+pygame.font.init()
+COUNTERS = {"food": 2, "sprites": 5, "surfaces": 40}
+
+def test_statistics():
+    """p50/p95 and FPS come from the rolling window"""
+    print("=== Testing Performance HUD ===")
+    ordered = list(range(100))
+    assert percentile(ordered, 0.5) == 50 and percentile(ordered, 0.95) == 95
+    assert percentile([], 0.5) == 0.0
+
+    hud = PerfHUD(pygame.font.Font(None, 18))
+    hud.record(0.001, 0.002, 0.003, 0.0)
+    assert not hud.frame_ends, "Hidden HUD should not collect timings"
+    hud.toggle()
+    for frame in range(11):
+        hud.record(0.001, 0.002, 0.003 + frame * 0.001, frame * 0.1)  # 10 frames per second
+    assert abs(hud.fps() - 10.0) < 1e-6
+    hud.refresh(COUNTERS)
+    assert hud.values["draw ms"] == ["8.00", "13.00"]
+    assert hud.values["food/sprites"] == ["2", "5"]
+    print(f"   ✅ Rolling statistics: {hud.values}")
+
+def test_draws_only_when_shown():
+    """A hidden HUD draws nothing; a shown one returns its area"""
+    hud = PerfHUD(pygame.font.Font(None, 18))
+    surface = pygame.Surface((480, 320))
+    assert hud.draw(surface, lambda: COUNTERS) is None
+    hud.toggle()
+    rect = hud.draw(surface, lambda: COUNTERS)
+    assert rect == hud.rect and hud.values, "Shown HUD should refresh and draw its panel"
+    assert process_rss() is None or hud.values["RSS MB"][0] != "-"
+    print("   ✅ Overlay drawn from pre-rendered labels and digit glyphs")
+
+def main():
+    """Run all tests"""
+    test_statistics()
+    test_draws_only_when_shown()
+    print("🎯 Performance HUD tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for pet parks
+Checks that a game can hold N pets, that colliding pets greet each other
+through the sweep over pets sorted by x, once per cooldown, and that taps
+hit the pet under them.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from main import GREETING_COOLDOWN_STEPS, VPetGame
+from pet_states import PetState
+
+def make_park(count):
+    """A headless game with count awake pets"""
+    park = VPetGame(headless=True, pet_count=count)
+    for pet in park.pets:
+        pet.wake_up()
+    return park
+
+def test_park_runs_n_pets():
+    """N pets with a cooldown slot per pair keep a valid x order while walking"""
+    print("=== Testing Pet Park ===")
+    park = make_park(12)
+    assert len(park.pets) == 12 == len(park.pet_names) and len(park.greeting_cooldowns) == 66
+    for _ in range(50):
+        park.update()
+    assert sorted(park.pet_order) == list(range(12))
+    pet = park.pets[5]
+    pet.set_state(PetState.SLEEPING)
+    assert park.pets[park.pet_at(pet.rect.center)].rect.collidepoint(pet.rect.center)
+    print(f"   ✅ Park of {len(park.pets)} pets walks and hit-tests")
+
+def test_colliding_pets_greet_once_per_cooldown():
+    """Two pets walking into each other greet, then ignore each other until the cooldown ends"""
+    park = make_park(3)
+    first, second, third = park.pets
+    third.set_state(PetState.SLEEPING)  # Out of the way
+    third.rect.x = 400
+    first.rect.x, first.direction = 100, 1
+    second.rect.x, second.direction = 100 + first.rect.width - 2, -1
+    park.update()
+    assert first.state == second.state == PetState.GREETING
+    assert not park.greeting_cooldowns.ready(0, 1, park.simulation_steps)
+    assert park.greeting_cooldowns.ready(0, 1, park.simulation_steps + GREETING_COOLDOWN_STEPS)
+    print("   ✅ Colliding pets greet and start their pair's cooldown")
+
+def main():
+    """Run all tests"""
+    test_park_runs_n_pets()
+    test_colliding_pets_greet_once_per_cooldown()
+    print("🎯 Pet park tests completed!")
+
+if __name__ == "__main__":
+    main()
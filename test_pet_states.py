@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the Digimon behavior states
+Checks that every state has a handler and a clip, that looping clips
+cycle their frames and that one-shot clips (greeting, eating) end their
+state after their frames, running the state's exit handler.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import Digimon, Food, VPetGame
+from pet_states import PetState, STATE_CLIPS
+
+def awake_pet():
+    """A walking pet of a headless game, hungry and not mid-jump"""
+    pet = VPetGame(headless=True).pets[0]
+    pet.wake_up()
+    pet.hunger = 50
+    return pet
+
+def test_every_state_has_a_handler_and_clip():
+    """The dispatch and clip tables cover every state; one-shot clips say what follows"""
+    print("=== Testing Behavior States ===")
+    for state in PetState:
+        assert state in Digimon.state_handlers and state in STATE_CLIPS, state
+        clip = STATE_CLIPS[state]
+        assert clip.loop or clip.next_state is not None, state
+    print(f"   ✅ {len(PetState)} states dispatch to a handler and play a clip")
+
+def test_sleeping_clip_loops():
+    """A sleeping pet alternates its two sleeping frames every delay steps"""
+    pet = VPetGame(headless=True).pets[0]
+    delay = STATE_CLIPS[PetState.SLEEPING].delay
+    shown = []
+    for _ in range(4 * delay):
+        pet.update()
+        shown.append(pet.image)
+    assert pet.state == PetState.SLEEPING
+    assert shown[delay - 1] is pet.sleeping_frames[1 % len(pet.sleeping_frames)]
+    assert shown[2 * delay - 1] is pet.sleeping_frames[0]
+    print("   ✅ Sleeping frames loop")
+
+def test_greeting_ends_after_its_clip():
+    """Greeting stops the pet for its clip, then walks on the post-greeting way"""
+    pet = awake_pet()
+    speed = pet.speed
+    pet.start_greeting(1, -1)
+    assert pet.state == PetState.GREETING and pet.speed == 0 and pet.image is pet.greeting_frames[0]
+    clip = STATE_CLIPS[PetState.GREETING]
+    for _ in range(clip.delay * len(clip.sequence) - 1):
+        pet.update()
+    assert pet.state == PetState.GREETING
+    pet.update()
+    assert pet.state == PetState.WALKING and pet.speed == speed and pet.direction == -1
+    assert pet.image is pet.frames[0] and not pet.flipped
+    print("   ✅ Greeting ends after its clip and walks on")
+
+def test_eating_consumes_food_after_its_clip():
+    """Reaching claimed food starts eating; the clip's end eats it"""
+    pet = awake_pet()
+    food = Food(pet.rect.centerx, pet.rect.y, pygame.Surface((30, 30)))
+    assert pet.move_to_food(food) and pet.state == PetState.MOVING_TO_FOOD
+    pet.update()  # Close enough already: starts eating
+    assert pet.state == PetState.FEEDING and pet.speed == 0
+    clip = STATE_CLIPS[PetState.FEEDING]
+    for _ in range(clip.delay * len(clip.sequence)):
+        pet.update()
+    assert pet.state == PetState.WALKING and pet.speed == pet.original_speed
+    assert food.consumed and pet.target_food is None and pet.hunger == 70
+    print("   ✅ Eating ends after its clip and consumes the food")
+
+def main():
+    """Run all tests"""
+    test_every_state_has_a_handler_and_clip()
+    test_sleeping_clip_loops()
+    test_greeting_ends_after_its_clip()
+    test_eating_consumes_food_after_its_clip()
+    print("🎯 Behavior state tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for the N-pet broad phase
+Checks that the sweep over pets sorted by x finds exactly the pairs an
+all-pairs check finds, that taps hit the pet on top and that per-pair
+cooldowns share one compact array.
+"""
+
+import os
+import random
+import sys
+
+# Add src directory to path so we can import the helpers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from pet_world import NearestIndex, PairCooldowns, hit_test, overlapping_pairs, sort_by_x, spread_positions
+
+class Pet:
+    def __init__(self, x, y=0, width=40):
+        self.rect = pygame.Rect(x, y, width, 40)
+
+def test_sweep_matches_all_pairs():
+    """Sweep and prune finds every pair overlapping on x, and nothing else"""
+    print("=== Testing Pet World ===")
+    random.seed(7)
+    pets = [Pet(random.randint(0, 440), width=random.randint(20, 60)) for _ in range(40)]
+    order = list(range(len(pets)))
+    sort_by_x(order, pets)
+    swept = {tuple(sorted(pair)) for pair in overlapping_pairs(order, pets)}
+    expected = {(i, j) for i in range(len(pets)) for j in range(i + 1, len(pets))
+                if pets[i].rect.x < pets[j].rect.right and pets[j].rect.x < pets[i].rect.right}
+    assert swept == expected
+    print(f"   ✅ Sweep found the same {len(swept)} pairs as all-pairs checks")
+
+def test_hit_test_picks_top_pet():
+    """Overlapping pets: the later one (drawn on top) is hit"""
+    pets = [Pet(100), Pet(120), Pet(300)]
+    order = [2, 1, 0]
+    sort_by_x(order, pets)
+    assert order == [0, 1, 2]
+    assert hit_test(order, pets, (130, 10)) == 1
+    assert hit_test(order, pets, (105, 10)) == 0
+    assert hit_test(order, pets, (200, 10)) is None
+    print("   ✅ Taps hit the pet drawn on top")
+
+def test_nearest_index_matches_scan():
+    """Bisect lookups give the pet a linear scan gives, ties to the lowest index"""
+    random.seed(11)
+    xs = [random.randint(0, 60) * 8 for _ in range(30)]  # Coarse grid: plenty of ties
+    index = NearestIndex((x, i) for i, x in enumerate(xs))
+    for food_x in range(0, 481, 4):
+        candidates = [(abs(x - food_x), i) for i, x in enumerate(xs) if abs(x - food_x) <= 150]
+        expected = min(candidates)[1] if candidates else None
+        assert index.nearest(food_x, 150) == expected, food_x
+    index.remove(xs[3], 3)
+    assert len(index) == 29 and index.nearest(xs[3], 0) != 3
+    print("   ✅ Nearest-pet index agrees with a linear scan")
+
+def test_pair_cooldowns():
+    """One slot per unordered pair; cooldowns expire after their duration"""
+    cooldowns = PairCooldowns(5)
+    assert len(cooldowns) == 10
+    assert len({PairCooldowns.pair_index(i, j) for i in range(5) for j in range(i + 1, 5)}) == 10
+    assert cooldowns.ready(3, 1, 0)
+    cooldowns.start(3, 1, 10, 30)
+    assert not cooldowns.ready(1, 3, 39) and cooldowns.ready(1, 3, 40)
+    assert cooldowns.ready(1, 2, 11), "Other pairs are unaffected"
+    print("   ✅ Per-pair cooldowns stored in one flat array")
+
+def test_spread_positions():
+    """Pets start apart when there is room and stay on screen when there is not"""
+    for count in (2, 3, 30):
+        positions = spread_positions(count, 420, 100)
+        assert len(positions) == count and all(0 <= x <= 420 for x in positions)
+    ordered = sorted(spread_positions(2, 420, 100))
+    assert ordered[1] - ordered[0] >= 100
+    print("   ✅ Spawn positions spread out")
+
+def main():
+    """Run all tests"""
+    test_sweep_matches_all_pairs()
+    test_hit_test_picks_top_pet()
+    test_nearest_index_matches_scan()
+    test_pair_cooldowns()
+    test_spread_positions()
+    print("🎯 Pet world tests completed!")
+
+if __name__ == "__main__":
+    main()
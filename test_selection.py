@@ -24,7 +24,7 @@ try:
     print("✓ VPetGame initialized successfully")
     print(f"Available Digimon: {len(game.available_digimon)}")
     print(f"First few Digimon: {game.available_digimon[:5] if game.available_digimon else 'None'}")
-    print(f"Current Digimon: {game.digimon1_name}, {game.digimon2_name}")
+    print(f"Current Digimon: {', '.join(game.pet_names)}")
     print(f"Selection UI active: {game.selection_ui.active}")
     
     # Test selection file functionality
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached selection overlay chrome
+Checks that the static parts of the selection UI are drawn once and
+reused until the page or the selection changes.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from main import VPetGame
+
+def test_chrome_layer_is_reused():
+    """Redrawing an unchanged overlay keeps its layer; selecting rebuilds it"""
+    print("=== Testing Selection Chrome ===")
+    game = VPetGame(headless=True)
+    ui = game.selection_ui
+    ui.open()
+    ui.draw()
+    chrome = ui.chrome_layer
+    ui.draw()
+    assert ui.chrome_layer is chrome, "Unchanged overlay should reuse its chrome layer"
+    ui.selected_digimon.append(ui.page_digimon(0)[0])
+    ui.draw()
+    assert ui.chrome_layer is not chrome, "Selecting a Digimon should rebuild the chrome layer"
+    ui.selected_digimon.pop()
+    ui.close()
+    print("   ✅ Selection overlay chrome is cached between frames")
+
+def main():
+    """Run all tests"""
+    test_chrome_layer_is_reused()
+    print("🎯 Selection chrome tests completed!")
+
+if __name__ == "__main__":
+    main()
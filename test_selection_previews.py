@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for on-demand selection previews
+Checks that no previews are loaded before the selection UI opens, that
+opening it loads the visible page, that the next page is prefetched and
+that closing it frees the prefetched decodes it no longer needs.
+"""
+
+import os
+import sys
+import tempfile
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from asset_loader import AssetLoader
+from main import VPetGame
+
+def test_previews_load_a_page_at_a_time():
+    """Only the visible page is loaded on open; the next one is queued first"""
+    print("=== Testing Selection Previews ===")
+    game = VPetGame(headless=True)
+    ui = game.selection_ui
+    assert not ui.preview_sprites, "No previews should be loaded before the UI opens"
+    ui.open()
+    ui.draw()
+    assert all(name in ui.preview_sprites for name in ui.page_digimon(0))
+    if ui.max_pages > 1:
+        next_page = ui.page_digimon(1)
+        assert list(ui.prefetch_queue)[:len(next_page)] == next_page, "Next page should be prefetched first"
+    print(f"   ✅ Visible page previews loaded on open ({len(ui.preview_sprites)} of {len(ui.available_digimon)})")
+
+    ui.close()
+    assert not ui.prefetch_queue, "Closing the UI should drop pending prefetches"
+    print("   ✅ Closing the UI stops prefetching")
+
+def test_closing_frees_prefetched_decodes():
+    """Decodes for previews that will not be shown are freed on close, finished ones too"""
+    game = VPetGame(headless=True)
+    ui = game.selection_ui
+    if len(ui.available_digimon) <= ui.items_per_page:
+        print("   ⚠️ Only one page of Digimon, skipping")
+        return
+    loader = AssetLoader(max_workers=1)
+    ui.asset_loader = loader
+    with tempfile.TemporaryDirectory() as folder:
+        # Loose PNG previews, so there are files to decode (atlases need none)
+        ui.preview_paths = lambda digimon_name: [os.path.join(folder, f"{digimon_name}.png")]
+        for digimon_name in ui.available_digimon:
+            pygame.image.save(pygame.Surface((16, 16)), ui.preview_paths(digimon_name)[0])
+        
+        ui.open()
+        paths = [path for digimon_name in ui.prefetch_queue for path in ui.preview_paths(digimon_name)]
+        loader.submit("done", int)
+        loader.take("done")  # One worker: every decode queued before this one has finished
+        assert paths and all(loader.has_pending(path) for path in paths)
+        
+        ui.close()
+        assert not any(loader.has_pending(path) for path in paths), "Finished decodes should be freed on close"
+    loader.shutdown()
+    print(f"   ✅ Closing the UI frees {len(paths)} prefetched decodes")
+
+def main():
+    """Run all tests"""
+    test_previews_load_a_page_at_a_time()
+    test_closing_frees_prefetched_decodes()
+    print("🎯 Selection preview tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test script for the NumPy simulation core
+Steps the same pets as plain Digimon and as core-backed Digimon, with
+random direction changes pinned to the middle of their range, and checks
+that every step ends in the same state and that the game's sweep and food
+claims see the same pets.
+"""
+
+import os
+import random
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import (CoreDigimon, Digimon, Food, HEART_DISPLAY_DURATION, HEART_FLOAT_SPEED, HEART_KEYFRAME_MS,
+                  HUNGER_INTERVAL_STEPS, SCREEN_WIDTH)
+from pet_states import PetState
+from pet_world import overlapping_pairs, sort_by_x
+from sim_core import SimulationCore, numpy_available
+from sprite_catalog import load_catalog
+
+SPRITES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sprites")
+PET_COUNT = 24
+STEPS = 600
+
+class MidpointGenerator:
+    """Stands in for the core's NumPy generator: the middle of every range"""
+    def integers(self, low, high, size):
+        return [(low + high - 1) // 2] * size
+
+def midpoint_randint(low, high):
+    """Stands in for random.randint: the middle of the range"""
+    return (low + high) // 2
+
+def snapshot(pet):
+    """Everything a step can change that does not depend on the wall clock"""
+    return (pet.rect.topleft, pet.direction, pet.speed, pet.flipped, pet.image, pet.state, pet.clip_timer,
+            pet.clip_step, pet.direction_timer, pet.next_direction_change, pet.hunger, pet.jump_velocity,
+            pet.is_jumping, pet.speed_backup, pet.original_speed, pet.post_greeting_direction)
+
+def make_pets(folders, core=None):
+    """Pets at fixed spots, a few of them asleep"""
+    random.seed(5)
+    pets = []
+    for index, folder in enumerate(folders):
+        pet = CoreDigimon(core, folder) if core is not None else Digimon(folder)
+        pet.rect.x = (index * 37) % (SCREEN_WIDTH - 60)
+        if index % 4:
+            pet.wake_up()
+        pets.append(pet)
+    return pets
+
+def poke(pets, step, rng):
+    """The same jumps, greetings and food for both worlds"""
+    for index, pet in enumerate(pets):
+        roll = rng.random()
+        if roll < 0.01 and pet.state != PetState.SLEEPING:
+            pet.jump()
+        elif roll < 0.015 and index + 1 < len(pets):
+            pet.start_greeting(1, -1)
+        elif roll < 0.02 and pet.is_available():
+            pet.move_to_food(Food(rng.randint(20, 460), 100, pygame.Surface((30, 30))))
+
+def test_core_matches_objects():
+    """Every pet ends every step in the same state as with Digimon.update"""
+    print("=== Testing Simulation Core ===")
+    if not numpy_available():
+        print("   ⚠️ NumPy not installed, skipping")
+        return
+    catalog = load_catalog(SPRITES_DIR)
+    digimon = catalog.available_digimon()
+    folders = [catalog.path(digimon[index % len(digimon)]) for index in range(PET_COUNT)]
+
+    plain = make_pets(folders)
+    core = SimulationCore(PET_COUNT, SCREEN_WIDTH, HUNGER_INTERVAL_STEPS, HEART_DISPLAY_DURATION, HEART_FLOAT_SPEED,
+                          HEART_KEYFRAME_MS, rng=MidpointGenerator())
+    backed = make_pets(folders, core)
+    assert [snapshot(pet) for pet in plain] == [snapshot(pet) for pet in backed]
+    assert [pet.state.name for pet in backed] == [pet.state.name for pet in plain], "state reads back as a PetState"
+
+    plain_rng = random.Random(9)
+    backed_rng = random.Random(9)
+    order = list(range(PET_COUNT))
+    randint = random.randint
+    random.randint = midpoint_randint
+    try:
+        for step in range(STEPS):
+            poke(plain, step, plain_rng)
+            poke(backed, step, backed_rng)
+            for pet in plain:
+                pet.update()
+            core.step(pygame.time.get_ticks())
+            for index, (a, b) in enumerate(zip(plain, backed)):
+                assert snapshot(a) == snapshot(b), f"Pet {index} differs after step {step}"
+
+            # What the game's greeting sweep and food claims read
+            sort_by_x(order, plain)
+            assert core.sort_by_x(order) == order
+            free_pets = [index for index in order if plain[index].is_available()]
+            assert list(core.free_pairs(order)) == list(overlapping_pairs(free_pets, plain))
+            assert sorted(core.available_centers()) == sorted((pet.rect.centerx, index)
+                                                              for index, pet in enumerate(plain) if pet.is_available())
+    finally:
+        random.randint = randint
+    print(f"   ✅ {PET_COUNT} pets matched for {STEPS} steps")
+
+def test_core_hearts():
+    """Hearts float up one keyframe per HEART_KEYFRAME_MS and go after HEART_DISPLAY_DURATION"""
+    if not numpy_available():
+        return
+    catalog = load_catalog(SPRITES_DIR)
+    core = SimulationCore(1, SCREEN_WIDTH, HUNGER_INTERVAL_STEPS, HEART_DISPLAY_DURATION, HEART_FLOAT_SPEED,
+                          HEART_KEYFRAME_MS)
+    pet = CoreDigimon(core, catalog.path(catalog.available_digimon()[0]))
+    pet.show_heart()
+    start = pet.heart_start_time
+    core.step(start + 2 * HEART_KEYFRAME_MS)
+    assert pet.heart_visible and pet.heart_float_offset == HEART_FLOAT_SPEED and pet.heart_keyframe == 2
+    core.step(start + HEART_DISPLAY_DURATION - 1)
+    assert pet.heart_keyframe == len(pet.heart_keyframes) - 1, "The last keyframe holds"
+    core.step(start + HEART_DISPLAY_DURATION)
+    assert not pet.heart_visible and pet.heart_float_offset == 0
+    print("   ✅ Hearts animate and disappear from the arrays")
+
+def test_failed_pet_frees_its_slot():
+    """A pet whose construction fails gives its slot back, so slots stay pet indices"""
+    if not numpy_available():
+        return
+    core = SimulationCore(1, SCREEN_WIDTH, HUNGER_INTERVAL_STEPS, HEART_DISPLAY_DURATION, HEART_FLOAT_SPEED,
+                          HEART_KEYFRAME_MS)
+    try:
+        CoreDigimon(core, "missing", speed="fast")  # Not a number, so the speed array refuses it
+    except ValueError:
+        pass
+    else:
+        assert False, "Construction should fail"
+    assert core.allocated == 0
+    print("   ✅ A failed pet frees its slot")
+
+def main():
+    """Run all tests"""
+    test_core_matches_objects()
+    test_core_hearts()
+    test_failed_pet_frees_its_slot()
+    print("🎯 Simulation core tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the packed sprite atlas
+Builds an atlas from a copy of one source folder and checks that every frame
+read back through the memory-mapped loader matches the original PNG.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+# Add src directory to path so we can import the atlas module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from sprite_atlas import SpriteAtlas, build_atlas, load_sprite_frame, close_atlases
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "assets", "sprites", "Digimon Color Ver. 1")
+
+def copy_sample_source(target_dir, count=3):
+    """Copy the first few Digimon folders of a source into target_dir"""
+    names = sorted(f for f in os.listdir(SOURCE_DIR) if f.endswith("_dmc"))[:count]
+    for name in names:
+        shutil.copytree(os.path.join(SOURCE_DIR, name), os.path.join(target_dir, name))
+    return names
+
+def surfaces_equal(a, b):
+    """Compare two surfaces pixel by pixel"""
+    if a.get_size() != b.get_size():
+        return False
+    return pygame.image.tostring(a, "RGBA") == pygame.image.tostring(b, "RGBA")
+
+def test_atlas_round_trip():
+    """Every packed frame matches its source PNG"""
+    print("=== Testing Sprite Atlas Round Trip ===")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        names = copy_sample_source(temp_dir)
+        atlas_path = build_atlas(temp_dir)
+        assert atlas_path and os.path.exists(atlas_path)
+        
+        atlas = SpriteAtlas(atlas_path)
+        for name in names:
+            png_frames = sorted(int(f[:-4]) for f in os.listdir(os.path.join(temp_dir, name)) if f.endswith(".png"))
+            assert atlas.frame_numbers(name) == png_frames
+            for frame_num in png_frames:
+                original = pygame.image.load(os.path.join(temp_dir, name, f"{frame_num}.png"))
+                assert surfaces_equal(atlas.get_frame(name, frame_num), original)
+        assert atlas.get_frame(names[0], 99) is None
+        atlas.close()
+        print(f"   ✅ {len(names)} Digimon match their PNG frames")
+    finally:
+        close_atlases()
+        shutil.rmtree(temp_dir)
+    print()
+
+def test_load_sprite_frame_fallback():
+    """load_sprite_frame uses the atlas when present and PNGs otherwise"""
+    print("=== Testing Atlas/PNG Fallback ===")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        names = copy_sample_source(temp_dir, count=1)
+        folder = os.path.join(temp_dir, names[0])
+        
+        from_png = load_sprite_frame(folder, 0)
+        assert from_png is not None
+        assert load_sprite_frame(folder, 99) is None
+        
+        close_atlases()
+        build_atlas(temp_dir)
+        from_atlas = load_sprite_frame(folder, 0)
+        assert from_atlas.get_parent() is not None  # Subsurface of the atlas sheet
+        assert surfaces_equal(from_atlas, from_png)
+        print("   ✅ Atlas and PNG paths return the same pixels")
+    finally:
+        close_atlases()
+        shutil.rmtree(temp_dir)
+    print()
+
+def main():
+    """Run all tests"""
+    test_atlas_round_trip()
+    test_load_sprite_frame_fallback()
+    print("🎯 Sprite atlas tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared sprite catalog
+Checks that both top-level and source-subfolder Digimon are found, and that
+the persisted catalog is reused until a directory changes.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+# Add src directory to path so we can import the catalog
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import sprite_catalog
+from sprite_catalog import catalog_path_for, load_catalog
+
+def make_digimon(folder, frames):
+    """Create a fake Digimon folder with empty frame files"""
+    os.makedirs(folder)
+    for frame_num in frames:
+        open(os.path.join(folder, f"{frame_num}.png"), 'wb').close()
+
+def test_catalog_scan_and_cache():
+    """The catalog covers every layout and is persisted keyed on mtimes"""
+    print("=== Testing Sprite Catalog ===")
+    root = tempfile.mkdtemp()
+    sprites_dir = os.path.join(root, "sprites")
+    try:
+        make_digimon(os.path.join(sprites_dir, "Agumon_dmc"), [0, 1, 2])
+        make_digimon(os.path.join(sprites_dir, "Source A", "Gabumon_dmc"), [0, 1, 11, 12])
+        make_digimon(os.path.join(sprites_dir, "Source A", "Eggmon_dmc"), [0])  # No walking frame 1
+        
+        catalog = load_catalog(sprites_dir, use_cache=False)
+        assert catalog.names() == ["Agumon_dmc", "Eggmon_dmc", "Gabumon_dmc"]
+        assert catalog.available_digimon() == ["Agumon_dmc", "Gabumon_dmc"]
+        assert catalog.frames("Gabumon_dmc") == [0, 1, 11, 12]
+        assert catalog.path("Gabumon_dmc") == os.path.join(sprites_dir, "Source A", "Gabumon_dmc")
+        assert os.path.exists(catalog_path_for(sprites_dir))
+        
+        # A fresh process reuses the file instead of rescanning
+        sprite_catalog._catalogs.clear()
+        original_scan = sprite_catalog.scan_sprites
+        sprite_catalog.scan_sprites = None  # Would fail if called
+        try:
+            cached = load_catalog(sprites_dir)
+        finally:
+            sprite_catalog.scan_sprites = original_scan
+        assert cached.available_digimon() == catalog.available_digimon()
+        
+        # Adding a Digimon changes its source folder's mtime and forces a rescan
+        make_digimon(os.path.join(sprites_dir, "Source A", "Patamon_dmc"), [0, 1])
+        os.utime(os.path.join(sprites_dir, "Source A"), ns=(0, 0))
+        sprite_catalog._catalogs.clear()
+        assert "Patamon_dmc" in load_catalog(sprites_dir).available_digimon()
+        print("   ✅ Catalog scans, persists and invalidates correctly")
+    finally:
+        sprite_catalog._catalogs.clear()
+        shutil.rmtree(root)
+    print()
+
+def main():
+    """Run all tests"""
+    test_catalog_scan_and_cache()
+    print("🎯 Sprite catalog tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the startup timeline profiler
+Checks that phases are recorded in order with the file opens and decoded
+bytes that happened during each one, and that the JSON output round-trips.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to path so we can import the profiler
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+import startup_profiler
+from startup_profiler import StartupProfiler, mark
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+def test_phases_count_opens_and_bytes():
+    """Each phase gets the opens and decoded bytes made while it ran"""
+    print("=== Testing Startup Profiler ===")
+    del startup_profiler._marks[:]
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        mark("begin")
+        pygame.image.load(os.path.join(ASSETS_DIR, "others", "heart.png"))  # 48x48
+        mark("heart")
+        with open(os.path.join(ASSETS_DIR, "others", "frame.png"), "rb"):
+            pass
+        mark("frame")
+    finally:
+        profiler.uninstall()
+    assert startup_profiler.get_active_profiler() is None
+
+    phases = {phase["name"]: phase for phase in profiler.phases()}
+    assert list(phases)[-2:] == ["heart", "frame"]
+    assert phases["heart"]["file_opens"] == 1
+    assert phases["heart"]["decoded_bytes"] == 48 * 48 * 4
+    assert phases["frame"]["file_opens"] == 1 and phases["frame"]["decoded_bytes"] == 0
+    assert all(phase["duration_ms"] >= 0 for phase in phases.values())
+    print(f"   ✅ Phases recorded: {list(phases)}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "profile.json")
+        profiler.write_json(json_path)
+        with open(json_path) as f:
+            data = json.load(f)
+    assert [phase["name"] for phase in data["phases"]] == [phase["name"] for phase in profiler.phases()]
+    print("   ✅ JSON profile written")
+    print()
+
+def main():
+    """Run all tests"""
+    test_phases_count_opens_and_bytes()
+    print("🎯 Startup profiler tests completed!")
+
+if __name__ == "__main__":
+    main()
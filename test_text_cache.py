@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the rendered-text cache
+Checks that repeated labels are rendered once, that every part of the key
+matters, and that the least recently used labels are evicted first.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the cache
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from text_cache import TextCache
+
+pygame.font.init()
+FONT = pygame.font.Font(None, 18)
+TEXT_COLOR = (40, 40, 40)
+
+def test_repeated_labels_are_rendered_once():
+    """The same (font, text, color, antialias) returns the same surface"""
+    print("=== Testing Text Cache ===")
+    cache = TextCache()
+    name = cache.render(FONT, "Agumon", TEXT_COLOR)
+    assert cache.render(FONT, "Agumon", list(TEXT_COLOR)) is name
+    assert name.get_size() == FONT.size("Agumon")
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    assert cache.hit_rate() == 0.5
+    print(f"   ✅ Repeated label served from cache: {cache.stats()}")
+
+    # Any part of the key changing is a different label
+    assert cache.render(FONT, "Gabumon", TEXT_COLOR) is not name
+    assert cache.render(FONT, "Agumon", (255, 255, 255)) is not name
+    assert cache.render(FONT, "Agumon", TEXT_COLOR, antialias=False) is not name
+    assert cache.render(pygame.font.Font(None, 24), "Agumon", TEXT_COLOR) is not name
+    assert len(cache) == 5
+    print("   ✅ Font, text, color and antialias all key the cache")
+    print()
+
+def test_least_recently_used_is_evicted():
+    """Past capacity the label unused for longest is dropped"""
+    cache = TextCache(capacity=2)
+    first = cache.render(FONT, "Page 1 / 3", TEXT_COLOR)
+    cache.render(FONT, "Page 2 / 3", TEXT_COLOR)
+    cache.render(FONT, "Page 1 / 3", TEXT_COLOR)  # Page 2 is now the oldest
+    cache.render(FONT, "Page 3 / 3", TEXT_COLOR)
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.render(FONT, "Page 1 / 3", TEXT_COLOR) is first
+    misses = cache.misses
+    cache.render(FONT, "Page 2 / 3", TEXT_COLOR)
+    assert cache.misses == misses + 1, "Evicted label should be rendered again"
+    print("   ✅ Least recently used labels are evicted")
+
+def main():
+    """Run all tests"""
+    test_repeated_labels_are_rendered_once()
+    test_least_recently_used_is_evicted()
+    print("🎯 Text cache tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test script for the SDL2 texture renderer backend
+Checks that a texture frame looks like a surface frame (pets mirrored by
+the flip flag) and that images are uploaded once.
+"""
+
+import os
+import sys
+
+# Add src directory to path so we can import the game
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from main import VPetGame
+from texture_renderer import texture_backend_available
+
+def test_texture_frame_matches_surface_frame():
+    """Pets are copied from atlas sheets and flipped on the way; textures upload once"""
+    print("=== Testing Texture Renderer ===")
+    if not texture_backend_available():
+        print("   ⚠️ pygame._sdl2.video not available, skipping")
+        return
+    game = VPetGame(headless=True, renderer="texture")
+    pet = game.pets[0]
+    pet.set_orientation(True)  # Facing right, without a mirrored surface
+    assert pet.frames == pet.clips["walking"][0] and pet.frame_regions
+    game.draw()
+    expected = game.background.copy()
+    for pet in game.pets:
+        expected.blit(pygame.transform.flip(pet.image, pet.flipped, False), pet.rect)
+    rendered = game.renderer.to_surface()
+    # The software renderer may blend edges a level or two differently
+    difference = max(abs(a - b) for a, b in zip(pygame.image.tostring(expected, "RGB"),
+                                                pygame.image.tostring(rendered, "RGB")))
+    assert difference <= 2, f"Texture frame differs by {difference}"
+    print("   ✅ Texture renderer matches the surface renderer")
+
+    uploads = game.renderer.uploads
+    game.draw()
+    assert game.renderer.uploads == uploads, "Textures should be uploaded once"
+    print(f"   ✅ {uploads} textures uploaded once")
+
+def main():
+    """Run all tests"""
+    test_texture_frame_matches_surface_frame()
+    print("🎯 Texture renderer tests completed!")
+
+if __name__ == "__main__":
+    main()